@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Load test: /balance lookup latency, sequential vs fanned out.
+
+Replays --requests /balance calls against stubbed lookups whose latency
+is one round trip plus a lognormal server time, with a --stall share of
+calls hanging until their client timeout:
+- sequential: the former handler; SOL balance, SOL price and token
+  balances awaited one after another, the balance call opening a fresh
+  RPC connection (TCP + TLS, two extra round trips), 10s timeouts
+- fan-out: the current handler; the three lookups started together on
+  pooled connections and answered with whatever arrived within
+  BALANCE_TIMEOUT, tokens being an RPC scan followed by a price lookup
+Every request draws the same latencies for both handlers. Sleeps last
+--time-scale of the modelled latencies; reported times are scaled back.
+Reports p50 / p90 / p99 / max and the share of replies missing a lookup
+(the former handler showed those as zero balances).
+
+Usage:
+    python benchmarks/bench_balance.py [--requests 300] [--rtt-ms 80] [--stall 0.02]
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+
+LOOKUP_TIMEOUT = 10.0  # Per-call timeout of the former HTTP/RPC clients
+BALANCE_TIMEOUT = 5.0  # BALANCE_TIMEOUT_SEC default
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def draw_call(rng, args, median):
+    """Seconds one HTTP call takes on a warm connection."""
+    if rng.random() < args.stall:
+        return math.inf  # Hangs until the client gives up
+    return args.rtt_ms / 1000 + rng.lognormvariate(math.log(median), 0.6)
+
+
+def draw_request(rng, args):
+    """Latencies of every call one /balance request makes."""
+    return {
+        "sol": draw_call(rng, args, 0.04),  # getBalance
+        "price": draw_call(rng, args, 0.12),  # CoinGecko / price oracle
+        "scan": draw_call(rng, args, 0.15),  # Token accounts (Solscan before, RPC after)
+        "value": draw_call(rng, args, 0.10),  # Batched token prices
+    }
+
+
+async def call(seconds, timeout, scale):
+    """Sleep through one call; a call past ``timeout`` fails."""
+    if seconds > timeout:
+        await asyncio.sleep(timeout * scale)
+        raise asyncio.TimeoutError
+    await asyncio.sleep(seconds * scale)
+    return True
+
+
+async def sequential(draw, args, scale):
+    """Former handler: three lookups in a row, errors read as zero balances."""
+    handshake = 2 * args.rtt_ms / 1000
+    answered = 0
+    for seconds in (draw["sol"] + handshake, draw["price"], draw["scan"]):
+        try:
+            answered += await call(seconds, LOOKUP_TIMEOUT, scale)
+        except asyncio.TimeoutError:
+            pass
+    return answered < 3
+
+
+async def fan_out(draw, args, scale):
+    """Current handler: concurrent lookups cut off at BALANCE_TIMEOUT."""
+    async def tokens():
+        await call(draw["scan"], LOOKUP_TIMEOUT, scale)
+        return await call(draw["value"], LOOKUP_TIMEOUT, scale)
+
+    tasks = [
+        asyncio.create_task(call(draw["sol"], LOOKUP_TIMEOUT, scale)),
+        asyncio.create_task(call(draw["price"], LOOKUP_TIMEOUT, scale)),
+        asyncio.create_task(tokens()),
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=args.balance_timeout * scale)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    return any(task.cancelled() or task.exception() is not None for task in tasks)
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    draws = [draw_request(rng, args) for _ in range(args.requests)]
+    results = {}
+    for name, handler in (("sequential", sequential), ("fan-out", fan_out)):
+        latencies, partial = [], 0
+        for draw in draws:
+            started = time.perf_counter()
+            partial += await handler(draw, args, args.time_scale)
+            latencies.append((time.perf_counter() - started) / args.time_scale)
+        results[name] = (latencies, partial)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--rtt-ms", type=float, default=80.0, help="Network round trip to the endpoints")
+    parser.add_argument("--stall", type=float, default=0.02, help="Share of calls that hang until timeout")
+    parser.add_argument("--balance-timeout", type=float, default=BALANCE_TIMEOUT)
+    parser.add_argument("--time-scale", type=float, default=0.1, help="Real seconds slept per modelled second")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{args.requests} /balance requests, rtt {args.rtt_ms:.0f} ms, {args.stall:.0%} of calls stall")
+    print(f"{'handler':<11} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'partial':>8}")
+    for name, (latencies, partial) in results.items():
+        print(f"{name:<11} {percentile(latencies, 0.5) * 1000:>8.0f} {percentile(latencies, 0.9) * 1000:>8.0f} "
+              f"{percentile(latencies, 0.99) * 1000:>8.0f} {max(latencies) * 1000:>8.0f} "
+              f"{partial / len(latencies):>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
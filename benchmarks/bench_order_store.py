@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: indexed order store.
+
+Measures:
+- memory per order: the former dataclass (string id, datetime fields)
+  against the slotted Order with an integer id and float timestamps
+- churn: create, index and fill --orders orders with the archive
+  spilling to a temporary SQLite file; reports orders/s, orders left in
+  memory and peak RSS at each quarter (it stays flat as the count grows)
+- expiry: cancel --open stale orders through the expiry heap, and the
+  cost of an expiry check when nothing is due
+
+Usage:
+    python benchmarks/bench_order_store.py [--orders 1000000] [--open 100000]
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from order_store import Order, OrderStatus, OrderStore, OrderType  # noqa: E402
+
+
+@dataclass
+class LegacyOrder:
+    """Order record as it was before the store (string id, datetimes, no slots)."""
+    order_id: str
+    token_address: str
+    order_type: OrderType
+    side: str
+    size: float
+    price: float
+    stop_price: Optional[float] = None
+    status: OrderStatus = OrderStatus.PENDING
+    filled_size: float = 0.0
+    average_fill_price: float = 0.0
+    created_at: datetime = None
+    updated_at: datetime = None
+
+
+def measure_bytes(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [build(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del items
+    return used / count
+
+
+def bench_memory(mints, count=100_000):
+    legacy = measure_bytes(lambda i: LegacyOrder(
+        f"MARKET_{mints[i % len(mints)]}_{time.time()}", mints[i % len(mints)], OrderType.MARKET, "BUY",
+        1.0, 0.0, created_at=datetime.now(), updated_at=datetime.now(),
+    ), count)
+    compact = measure_bytes(lambda i: Order(
+        i, mints[i % len(mints)], OrderType.MARKET, "BUY", 1.0, 0.0, created_at=time.time(), updated_at=time.time(),
+    ), count)
+    print(f"bytes/order    legacy {legacy:.0f} | slotted {compact:.0f}")
+
+
+def bench_churn(args, mints, rng):
+    with tempfile.TemporaryDirectory() as directory:
+        store = OrderStore(os.path.join(directory, "orders.db"))
+        started = time.perf_counter()
+        peaks = []
+        for i in range(1, args.orders + 1):
+            order = store.create(rng.choice(mints), OrderType.MARKET, "BUY" if i % 2 else "SELL", 1.0, 0.0)
+            order.filled_size = order.size
+            store.set_status(order, OrderStatus.FILLED)
+            if i % (args.orders // 4 or 1) == 0:
+                peaks.append(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+        elapsed = time.perf_counter() - started
+        in_memory = len(store)
+        store.close()
+        size = os.path.getsize(os.path.join(directory, "orders.db"))
+    print(f"churn          {args.orders} orders in {elapsed:.2f}s ({args.orders / elapsed:,.0f}/s) | "
+          f"in memory {in_memory} | archived {store.archived} ({size / 1e6:.1f} MB)")
+    print(f"peak RSS MB    {' -> '.join(f'{p:.0f}' for p in peaks)}")
+
+
+def bench_expiry(args, mints, rng):
+    store = OrderStore(max_closed=args.open)
+    now = time.time()
+    for _ in range(args.open):
+        store.create(rng.choice(mints), OrderType.LIMIT, "BUY", 1.0, 1.0, ttl=rng.uniform(0, 600))
+    started = time.perf_counter()
+    for _ in range(10_000):
+        store.expire(now)  # Nothing due yet
+    idle = (time.perf_counter() - started) / 10_000
+    started = time.perf_counter()
+    expired = store.expire(now + 300)
+    elapsed = time.perf_counter() - started
+    print(f"expiry         {len(expired)} of {args.open} open orders in {elapsed * 1000:.1f}ms "
+          f"({elapsed / max(1, len(expired)) * 1e6:.2f} us each) | idle check {idle * 1e6:.2f} us")
+    started = time.perf_counter()
+    found = store.find(mint=mints[0], status=OrderStatus.PENDING, side="BUY")
+    print(f"indexed query  {len(found)} open BUYs of one mint in {(time.perf_counter() - started) * 1e6:.0f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--open", type=int, default=100_000)
+    parser.add_argument("--mints", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mints = [f"mint{i:04d}" for i in range(args.mints)]
+    bench_memory(mints)
+    bench_churn(args, mints, rng)
+    bench_expiry(args, mints, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: AMM price impact and order splitting.
+
+Builds --mints synthetic tokens, each with 2-4 pools: constant-product
+pools and concentrated-liquidity pools whose liquidity is packed around
+the current price. Market buys and sells of growing size are filled:
+- best pool: the whole order in the pool with the best price
+- even: equal parts in every pool
+- split: price_impact.split_order, marginal prices equalized
+Reports the average fill cost in bps against spot per size, how far the
+former quadratic estimate was from the modelled cost, and the time one
+split decision takes.
+
+Usage:
+    python benchmarks/bench_price_impact.py [--mints 200] [--seed 3]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from price_impact import Pool, Split, split_order  # noqa: E402
+
+SIZES = (0.1, 0.5, 1.0, 5.0, 10.0, 25.0)  # SOL
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def legacy_slippage(size, liquidity):
+    """Quadratic estimate the execution engine used before pool modelling."""
+    return min((size / liquidity) ** 2 * 0.1, 0.05)
+
+
+def synthetic_pools(rng, mint):
+    price = math.exp(rng.uniform(-12, -4))  # SOL per token
+    pools, liquidity = [], 0.0
+    for i in range(rng.randint(2, 4)):
+        sol = rng.lognormvariate(math.log(60), 0.8)  # SOL side of the pool
+        quoted = price * math.exp(rng.gauss(0, 0.002))  # Pools drift apart a little
+        fee = rng.choice((0.0025, 0.003, 0.01))
+        liquidity += 2 * sol  # Pool value in SOL, as a liquidity feed reports it
+        if rng.random() < 0.5:
+            pools.append(Pool.constant_product(f"{mint}-cp{i}", mint, sol / quoted, sol, fee))
+        else:
+            # Liquidity in bands around the price, deepest in the middle
+            s = math.sqrt(quoted)
+            L = sol / s
+            ranges = [
+                (s * 0.97, s * 1.03, 6 * L),
+                (s * 0.85, s * 0.97, 2 * L),
+                (s * 1.03, s * 1.15, 2 * L),
+                (s * 0.5, s * 0.85, L / 2),
+                (s * 1.15, s * 2.0, L / 2),
+            ]
+            pools.append(Pool(f"{mint}-cl{i}", mint, s, ranges, fee))
+    return pools, liquidity
+
+
+def fill(pools, amounts, buy):
+    legs = [(pool, amount, pool.quote(amount, buy)) for pool, amount in zip(pools, amounts) if amount > 0]
+    spot = min(p.price for p in pools) if buy else max(p.price for p in pools)
+    return Split(legs, buy, sum(leg[1] for leg in legs), sum(leg[2] for leg in legs), spot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mints", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    markets = [synthetic_pools(rng, f"mint{i:04d}") for i in range(args.mints)]
+    costs = {(size, mode): [] for size in SIZES for mode in ("best pool", "even", "split")}
+    legacy_error, timings = {size: [] for size in SIZES}, []
+    for pools, liquidity in markets:
+        for size in SIZES:
+            for buy in (True, False):
+                spot = max(pool.price for pool in pools)
+                amount = size if buy else size / spot  # Sells are sized in SOL too
+                best = min(pools, key=lambda p: p.marginal_price(True)) if buy else \
+                    max(pools, key=lambda p: p.marginal_price(False))
+                runs = {
+                    "best pool": fill(pools, [amount if p is best else 0 for p in pools], buy),
+                    "even": fill(pools, [amount / len(pools)] * len(pools), buy),
+                }
+                started = time.perf_counter()
+                runs["split"] = split_order(pools, amount, buy)
+                timings.append(time.perf_counter() - started)
+                for mode, split in runs.items():
+                    costs[(size, mode)].append(split.slippage * 10_000)
+                legacy_error[size].append(abs(legacy_slippage(size, liquidity) - runs["split"].slippage) * 10_000)
+
+    print(f"{args.mints} mints, 2-4 pools each; fill cost in bps vs spot, buys and sells")
+    print(f"{'size SOL':>8} {'best pool':>10} {'even':>10} {'split':>10} {'legacy err':>11}")
+    for size in SIZES:
+        row = [sum(costs[(size, mode)]) / len(costs[(size, mode)]) for mode in ("best pool", "even", "split")]
+        print(f"{size:>8.1f} {row[0]:>10.1f} {row[1]:>10.1f} {row[2]:>10.1f} "
+              f"{sum(legacy_error[size]) / len(legacy_error[size]):>11.1f}")
+    print(f"split decision: p50 {percentile(timings, 0.5) * 1e6:.1f} us | p99 {percentile(timings, 0.99) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
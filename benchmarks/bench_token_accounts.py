@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: RPC-native token balance scan.
+
+Builds synthetic wallets with hundreds to thousands of base64 token
+accounts (Token and Token-2022, some empty, a few delegated to other
+owners) and serves them from an in-process RPC stand-in.
+
+Reports:
+- decode throughput of token_accounts (struct.unpack_from over memoryview)
+  against slicing each field out of a bytes copy
+- end-to-end scan latency with a cold and a warm mint metadata cache
+
+Usage:
+    python benchmarks/bench_token_accounts.py [--accounts 100 500 2000]
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from token_accounts import (  # noqa: E402
+    TOKEN_2022_PROGRAM_ID,
+    decode_token_accounts,
+    scan_token_balances,
+)
+from token_extractor import b58encode  # noqa: E402
+from token_metadata import TokenMetadataCache  # noqa: E402
+
+
+def token_account(mint: bytes, owner: bytes, amount: int, extra: int = 0) -> dict:
+    data = mint + owner + struct.pack("<Q", amount) + bytes(165 - 72 + extra)
+    return {"pubkey": "x", "account": {"data": [base64.b64encode(data).decode(), "base64"]}}
+
+
+def mint_account(decimals: int) -> dict:
+    data = struct.pack("<I32sQBBI32s", 0, bytes(32), 10 ** 12, decimals, 1, 0, bytes(32))
+    return {"data": [base64.b64encode(data).decode(), "base64"]}
+
+
+class FakeRpc:
+    """In-process stand-in for RpcPool.batch."""
+
+    def __init__(self, rng, owner: bytes, accounts: int):
+        self.decimals = {}
+        self.by_program = {"Tokenkeg": [], "Tokenz": []}
+        mints = [rng.randbytes(32) for _ in range(max(1, accounts // 2))]
+        for mint in mints:
+            self.decimals[b58encode(mint)] = rng.choice([0, 6, 9])
+        for i in range(accounts):
+            mint = rng.choice(mints)
+            holder = owner if rng.random() > 0.02 else rng.randbytes(32)
+            amount = 0 if rng.random() < 0.2 else rng.randrange(1, 10 ** 12)
+            program = "Tokenz" if i % 5 == 0 else "Tokenkeg"
+            extra = 17 if program == "Tokenz" else 0  # Token-2022 extensions
+            self.by_program[program].append(token_account(mint, holder, amount, extra))
+        self.calls = 0
+
+    async def batch(self, calls):
+        self.calls += 1
+        results = []
+        for method, params in calls:
+            if method == "getTokenAccountsByOwner":
+                key = "Tokenz" if params[1]["programId"] == TOKEN_2022_PROGRAM_ID else "Tokenkeg"
+                results.append({"value": self.by_program[key]})
+            else:
+                results.append({"value": [mint_account(self.decimals[m]) for m in params[0]]})
+        return results
+
+
+def decode_sliced(accounts, owner):
+    totals = {}
+    for entry in accounts:
+        data = base64.b64decode(entry["account"]["data"][0])
+        mint = data[0:32]
+        if data[32:64] != owner:
+            continue
+        amount = int.from_bytes(data[64:72], "little")
+        if amount:
+            totals[mint] = totals.get(mint, 0) + amount
+    return totals
+
+
+def bench_decode(accounts, owner, repeat):
+    results = {}
+    for name, fn in (("sliced bytes", decode_sliced), ("token_accounts", decode_token_accounts)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(accounts, owner)
+        results[name] = len(accounts) * repeat / (time.perf_counter() - start)
+    return results
+
+
+async def bench_scan(rpc, owner, directory):
+    metadata = TokenMetadataCache(os.path.join(directory, "token_metadata.db"))
+    timings = []
+    for _ in range(2):
+        rpc.calls = 0
+        start = time.perf_counter()
+        balances = await scan_token_balances(owner, rpc, metadata)
+        timings.append((time.perf_counter() - start, rpc.calls))
+    return len(balances), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    owner = rng.randbytes(32)
+    print(f"{'accounts':>8} {'sliced/s':>10} {'unpack/s':>10} {'balances':>9} "
+          f"{'cold ms':>8} {'rpc':>4} {'warm ms':>8} {'rpc':>4}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.accounts:
+            rpc = FakeRpc(rng, owner, count)
+            accounts = rpc.by_program["Tokenkeg"] + rpc.by_program["Tokenz"]
+            decode = bench_decode(accounts, owner, max(1, 20000 // count))
+            held, ((cold, cold_calls), (warm, warm_calls)) = asyncio.run(
+                bench_scan(rpc, b58encode(owner), directory)
+            )
+            print(f"{count:>8} {decode['sliced bytes']:>10.0f} {decode['token_accounts']:>10.0f} "
+                  f"{held:>9} {cold * 1000:>8.1f} {cold_calls:>4} {warm * 1000:>8.1f} {warm_calls:>4}")
+
+
+if __name__ == "__main__":
+    main()
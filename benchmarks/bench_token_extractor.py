@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: token address extraction.
+
+Compares the old "last regex match" extractor with token_extractor on a
+synthetic corpus of signal messages (CA labels, pump.fun/dexscreener links,
+wallet addresses, 88-char transaction signatures, junk base58 runs).
+
+Reports messages per second and how many messages each extractor maps to
+the wrong address, i.e. how many Jupiter quotes would be wasted.
+
+Usage:
+    python benchmarks/bench_token_extractor.py [--messages 20000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from token_extractor import B58_ALPHABET, b58encode, extract_batch  # noqa: E402
+
+_LEGACY_RE = re.compile(r"\b[1-9A-HJ-NP-Za-km-z]{32,44}\b")
+
+
+def legacy_extract(text):
+    match = _LEGACY_RE.findall(text)
+    return match[-1] if match else None
+
+
+def random_key(rng, suffix=""):
+    while True:
+        key = b58encode(rng.randbytes(32))
+        if suffix:
+            key = key[: len(key) - len(suffix)] + suffix
+        if len(key) >= 32:
+            return key
+
+
+def junk_run(rng):
+    # Looks like an address (right length, right alphabet) but is not 32 bytes
+    length = rng.choice([32, 33, 44])
+    while True:
+        value = "".join(rng.choice(B58_ALPHABET) for _ in range(length))
+        number = 0
+        for char in value:
+            number = number * 58 + B58_ALPHABET.index(char)
+        if (number.bit_length() + 7) // 8 != 32:
+            return value
+
+
+def make_message(rng):
+    """Return (message, expected mint or None)."""
+    mint = random_key(rng, suffix="pump" if rng.random() < 0.4 else "")
+    wallet = random_key(rng)
+    sig = b58encode(rng.randbytes(64))
+    kind = rng.randrange(7)
+    if kind == 0:
+        return f"🚀 NEW CALL\nCA: {mint}\nDev wallet: {wallet}\nLFG!!", mint
+    if kind == 1:
+        return f"Aping this one https://pump.fun/coin/{mint} buy tx https://solscan.io/tx/{sig}", mint
+    if kind == 2:
+        return (
+            f"{mint}\n\nChart: https://dexscreener.com/solana/{mint}\n"
+            f"Top holder: {wallet} holds 3%"
+        ), mint
+    if kind == 3:
+        return f"Still pumping 📈 bought more, signature {sig} wallet: {wallet}", None
+    if kind == 4:
+        return f"gm frens, mint {mint} looks ready. ref code {junk_run(rng)}", mint
+    if kind == 5:
+        return f"Holders update. Deployer: {wallet}\nNo new calls today.", None
+    return f"Contract address 👉 {mint} 👈 (not {junk_run(rng)})", mint
+
+
+def run(extract, corpus):
+    messages = [message for message, _ in corpus]
+    start = time.perf_counter()
+    results = extract(messages)
+    elapsed = time.perf_counter() - start
+    wrong = sum(1 for result, (_, expected) in zip(results, corpus) if result != expected)
+    wasted = sum(
+        1 for result, (_, expected) in zip(results, corpus)
+        if result is not None and result != expected
+    )
+    return len(messages) / elapsed, wrong, wasted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_message(rng) for _ in range(args.messages)]
+
+    rows = [
+        ("legacy regex", run(lambda msgs: [legacy_extract(m) for m in msgs], corpus)),
+        ("token_extractor", run(extract_batch, corpus)),
+    ]
+    print(f"{len(corpus)} messages")
+    print(f"{'extractor':<16} {'msgs/s':>10} {'wrong':>7} {'bad quotes':>11}")
+    for name, (rate, wrong, wasted) in rows:
+        print(f"{name:<16} {rate:>10.0f} {wrong:>7} {wasted:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: price trigger engine.
+
+Rests --orders limit, stop-loss and take-profit orders across --mints
+mints around a starting price, then replays random-walk price ticks:
+- scan: check every resting order of the ticked mint
+- index: trigger_engine.TriggerEngine, fired in O(log n + k)
+Both must fire exactly the same orders; reports the per-tick p50 / p99
+latency, orders fired, and the cost of resting and cancelling one order.
+
+Usage:
+    python benchmarks/bench_trigger_engine.py [--orders 50000] [--mints 20] [--ticks 100000]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from order_store import Order, OrderType  # noqa: E402
+from trigger_engine import TriggerEngine, trigger_direction, trigger_price  # noqa: E402
+
+TYPES = (OrderType.LIMIT, OrderType.STOP_LOSS, OrderType.TAKE_PROFIT)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def build_orders(args, rng, mints):
+    orders = []
+    for order_id in range(1, args.orders + 1):
+        order_type = rng.choice(TYPES)
+        level = math.exp(rng.gauss(0, 0.15))  # Around the starting price of 1.0
+        orders.append(Order(
+            order_id, rng.choice(mints), order_type, rng.choice(("BUY", "SELL")), 1.0,
+            level if order_type == OrderType.LIMIT else 0.0,
+            stop_price=None if order_type == OrderType.LIMIT else level,
+        ))
+    return orders
+
+
+class ScanBook:
+    """Baseline: resting orders per mint, every one checked on each tick."""
+
+    def __init__(self):
+        self.books = {}
+
+    def add(self, order):
+        self.books.setdefault(order.token_address, []).append(
+            (trigger_price(order), trigger_direction(order) == 0, order)
+        )
+
+    def on_tick(self, mint, price):
+        book = self.books.get(mint, [])
+        fired, resting = [], []
+        for entry in book:
+            level, falls, order = entry
+            if price <= level if falls else price >= level:
+                fired.append(order)
+            else:
+                resting.append(entry)
+        if fired:
+            self.books[mint] = resting
+        return fired
+
+
+def replay(args, mints, book):
+    rng = random.Random(args.seed + 1)  # Same ticks for every book
+    prices = dict.fromkeys(mints, 1.0)
+    latencies, fired = [], 0
+    for _ in range(args.ticks):
+        mint = rng.choice(mints)
+        prices[mint] *= math.exp(rng.gauss(0, args.volatility))
+        started = time.perf_counter()
+        fired += len(book.on_tick(mint, prices[mint]))
+        latencies.append(time.perf_counter() - started)
+    return latencies, fired
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--mints", type=int, default=20)
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--volatility", type=float, default=0.002, help="Log-price step per tick")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mints = [f"mint{i:04d}" for i in range(args.mints)]
+    orders = build_orders(args, rng, mints)
+
+    engine = TriggerEngine()
+    started = time.perf_counter()
+    for order in orders:
+        engine.add(order)
+    add_cost = (time.perf_counter() - started) / len(orders)
+    scan = ScanBook()
+    for order in orders:
+        scan.add(order)
+
+    print(f"{args.orders} resting orders over {args.mints} mints, {args.ticks} ticks")
+    print(f"{'book':<6} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'fired':>7}")
+    results = {}
+    for name, book in (("scan", scan), ("index", engine)):
+        latencies, fired = replay(args, mints, book)
+        results[name] = fired
+        print(f"{name:<6} {percentile(latencies, 0.5) * 1e6:>8.2f} {percentile(latencies, 0.99) * 1e6:>8.2f} "
+              f"{max(latencies) * 1e6:>8.1f} {fired:>7}")
+    assert results["scan"] == results["index"], "books fired different orders"
+
+    for order in orders:
+        order.order_id += args.orders  # Rest them again under fresh ids
+        engine.add(order)
+    started = time.perf_counter()
+    for order in orders:
+        engine.cancel(order.order_id)
+    cancel_cost = (time.perf_counter() - started) / len(orders)
+    print(f"rest {add_cost * 1e6:.2f} us | cancel {cancel_cost * 1e6:.2f} us per order")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: TWAP scheduling on a shared timer wheel.
+
+Runs thousands of concurrent TWAP parents over hundreds of mints against
+an in-process executor with simulated latency, partial fills and
+failures, and compares:
+- task per parent: each parent is a task sleeping between its slices
+- timer wheel: twap_scheduler children fired from one TimerWheel
+
+Reports children sent, scheduling lag (deadline to firing, p50/p99/max),
+CPU time as a share of wall time, CPU microseconds per child and the
+peak number of live tasks while the schedules run.
+
+Usage:
+    python benchmarks/bench_twap_scheduler.py [--parents 1000 5000 10000] [--slices 8]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from order_store import Order, OrderType  # noqa: E402
+from timer_wheel import TimerWheel  # noqa: E402
+from twap_scheduler import TwapScheduler  # noqa: E402
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def make_executor(rng, latency, partial_rate, failure_rate):
+    async def execute(order, size):
+        await asyncio.sleep(latency * rng.uniform(0.5, 1.5))
+        roll = rng.random()
+        if roll < failure_rate:
+            raise RuntimeError("simulated failure")
+        if roll < failure_rate + partial_rate:
+            return size * rng.uniform(0.2, 0.8), 1.0
+        return size, 1.0
+
+    return execute
+
+
+def make_orders(parents, mints):
+    return [
+        Order(order_id=i, token_address=f"mint{i % mints}", order_type=OrderType.TWAP,
+              side="BUY", size=1.0, price=0)
+        for i in range(parents)
+    ]
+
+
+async def sample_tasks(samples, stop):
+    while not stop.is_set():
+        samples.append(len(asyncio.all_tasks()))
+        await asyncio.sleep(0.05)
+
+
+async def task_per_parent(args, orders, execute):
+    lags = []
+    children = 0
+
+    async def run(order):
+        nonlocal children
+        remaining = order.size
+        interval = args.duration / (args.slices - 1)
+        deadline = time.monotonic()
+        for left in range(args.slices, 0, -1):
+            await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+            lags.append(time.monotonic() - deadline)
+            children += 1
+            try:
+                filled, _ = await execute(order, remaining / left)
+                remaining -= filled
+            except RuntimeError:
+                pass
+            deadline += interval
+
+    await asyncio.gather(*(run(order) for order in orders))
+    return {"children": children, "lags": lags}
+
+
+async def timer_wheel(args, orders, execute):
+    # Lag window large enough to hold every child, retries included
+    wheel = TimerWheel(tick=args.tick_ms / 1000, window=len(orders) * args.slices * 2)
+    scheduler = TwapScheduler(execute, wheel, max_in_flight=args.in_flight, retry_delay=0.1)
+    plans = [scheduler.submit(order, duration=args.duration, slices=args.slices) for order in orders]
+    await asyncio.gather(*(plan.done for plan in plans))
+    await scheduler.stop()
+    await wheel.stop()
+    return {"children": scheduler.stats.children, "lags": list(wheel._lags)}
+
+
+async def measure(mode, args, parents):
+    rng = random.Random(args.seed)
+    execute = make_executor(rng, args.latency_ms / 1000, args.partial_rate, args.failure_rate)
+    orders = make_orders(parents, args.mints)
+    samples, stop = [], asyncio.Event()
+    sampler = asyncio.create_task(sample_tasks(samples, stop))
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = await mode(args, orders, execute)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stop.set()
+    await sampler
+    result.update(wall=wall, cpu=cpu, tasks=max(samples) if samples else 0)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parents", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--mints", type=int, default=300)
+    parser.add_argument("--slices", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per parent schedule")
+    parser.add_argument("--tick-ms", type=float, default=10.0)
+    parser.add_argument("--in-flight", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated child execution time")
+    parser.add_argument("--partial-rate", type=float, default=0.1)
+    parser.add_argument("--failure-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    args.slices = max(2, args.slices)
+    logging.getLogger("SignalForge.TWAP").setLevel(logging.ERROR)  # Simulated failures are expected
+
+    print(f"{'mode':<16} {'parents':>8} {'children':>9} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} "
+          f"{'cpu %':>6} {'us/child':>9} {'tasks':>6}")
+    for parents in args.parents:
+        for name, mode in (("task per parent", task_per_parent), ("timer wheel", timer_wheel)):
+            result = asyncio.run(measure(mode, args, parents))
+            lags = result["lags"]
+            print(f"{name:<16} {parents:>8} {result['children']:>9} {percentile(lags, 0.5) * 1000:>8.1f} "
+                  f"{percentile(lags, 0.99) * 1000:>8.1f} {max(lags, default=0) * 1000:>8.1f} "
+                  f"{100 * result['cpu'] / result['wall']:>6.1f} {result['cpu'] / result['children'] * 1e6:>9.0f} "
+                  f"{result['tasks']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: transaction submission pipeline.
+
+Runs tx_pipeline against an in-process mock RPC that simulates:
+- a block height advancing every --slot-ms milliseconds
+- per-call network latency
+- transactions landing a few slots after they are sent, some dropped
+  (so they need a resend) and none landing after their blockhash expired
+
+Compares the old flow (fetch blockhash, send, poll its own status, one
+transaction at a time) with the pipeline at several in-flight limits.
+Reports end-to-end latency including the wait for an in-flight slot
+(p50/p99), average submit-to-confirm latency, resends, rebroadcasts and
+transactions per second.
+
+Usage:
+    python benchmarks/bench_tx_pipeline.py [--txs 200] [--in-flight 1 8 32]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tx_pipeline import TxPipeline  # noqa: E402
+
+
+class MockRpc:
+    """Stand-in for RpcPool with simulated chain timing."""
+
+    def __init__(self, rng, slot_ms, latency_ms, drop_rate, validity=150):
+        self.rng = rng
+        self.slot = slot_ms / 1000
+        self.latency = latency_ms / 1000
+        self.drop_rate = drop_rate
+        self.validity = validity
+        self.started = time.monotonic()
+        self.landed = {}  # signature -> height it lands at
+        self.calls = 0
+
+    @property
+    def height(self):
+        return int((time.monotonic() - self.started) / self.slot)
+
+    async def _delay(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency * self.rng.uniform(0.5, 1.5))
+
+    async def call(self, method, params=None, timeout=None):
+        await self._delay()
+        if method == "getLatestBlockhash":
+            height = self.height
+            return {"value": {"blockhash": f"hash-{height}", "lastValidBlockHeight": height + self.validity}}
+        if method == "sendTransaction":
+            signature, last_valid = params[0].split("|")
+            if signature not in self.landed and self.rng.random() >= self.drop_rate:
+                land_at = self.height + self.rng.randint(1, 4)
+                if land_at <= int(last_valid):
+                    self.landed[signature] = land_at
+            return signature
+        raise ValueError(method)
+
+    async def call_via(self, method, params=None, timeout=None, prefer=None):
+        return await self.call(method, params, timeout), "mock"
+
+    async def batch(self, calls, prefer=None):
+        await self._delay()
+        results = []
+        for method, params in calls:
+            if method == "getBlockHeight":
+                results.append(self.height)
+            else:
+                height = self.height
+                results.append({"value": [
+                    {"confirmationStatus": "confirmed", "err": None}
+                    if self.landed.get(sig, height + 1) <= height else None
+                    for sig in params[0]
+                ]})
+        return results
+
+
+def builder(rpc, counter):
+    def build(blockhash):
+        counter[0] += 1
+        height = int(blockhash.split("-")[1])
+        signature = f"sig-{counter[0]}"
+        return signature, f"{signature}|{height + rpc.validity}"
+    return build
+
+
+async def sequential(rpc, count, poll):
+    """Old flow: one transaction at a time, blockhash fetched per send."""
+    latencies = []
+    counter = [0]
+    for _ in range(count):
+        started = time.monotonic()
+        value = (await rpc.call("getLatestBlockhash"))["value"]
+        signature, payload = builder(rpc, counter)(value["blockhash"])
+        while True:
+            await rpc.call("sendTransaction", [payload])
+            sent = time.monotonic()
+            while time.monotonic() - sent < 2.0:
+                await asyncio.sleep(poll)
+                _, status = await rpc.batch([("getBlockHeight", None), ("getSignatureStatuses", [[signature]])])
+                if status["value"][0]:
+                    break
+            else:
+                continue
+            break
+        latencies.append(time.monotonic() - started)
+    return latencies, {"confirm": sum(latencies) / len(latencies) if latencies else 0.0}
+
+
+async def pipelined(rpc, count, in_flight, poll):
+    # Blockhash lifetime is 150 slots; refresh at the same fraction of it as live (10s of ~60s)
+    pipeline = TxPipeline(
+        rpc,
+        max_in_flight=in_flight,
+        poll_interval=poll,
+        resend_interval=1.0,
+        blockhash_refresh=rpc.slot * 25,
+        slot_seconds=rpc.slot,
+    )
+    counter = [0]
+
+    async def one():
+        started = time.monotonic()
+        ok, _ = await pipeline.submit(builder(rpc, counter))
+        return time.monotonic() - started if ok else None
+
+    results = await asyncio.gather(*(one() for _ in range(count)))
+    await pipeline.stop()
+    stats = pipeline.stats
+    return [r for r in results if r is not None], {
+        "confirm": stats.avg_latency,
+        "resends": stats.resends,
+        "rebroadcasts": stats.rebroadcasts,
+    }
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--txs", type=int, default=200)
+    parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--slot-ms", type=float, default=40.0, help="Simulated slot time")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Simulated RPC latency")
+    parser.add_argument("--drop-rate", type=float, default=0.1)
+    parser.add_argument("--poll-ms", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    poll = args.poll_ms / 1000
+    runs = [("sequential", None)] + [(f"pipeline x{n}", n) for n in args.in_flight]
+    print(f"{'mode':<14} {'ok':>5} {'p50 ms':>8} {'p99 ms':>8} {'confirm':>8} {'tx/s':>8} {'rpc':>6} "
+          f"{'resend':>7} {'rebcast':>7}")
+    for name, in_flight in runs:
+        rpc = MockRpc(random.Random(args.seed), args.slot_ms, args.latency_ms, args.drop_rate)
+        started = time.monotonic()
+        if in_flight is None:
+            latencies, extra = asyncio.run(sequential(rpc, args.txs, poll))
+        else:
+            latencies, extra = asyncio.run(pipelined(rpc, args.txs, in_flight, poll))
+        elapsed = time.monotonic() - started
+        print(f"{name:<14} {len(latencies):>5} {percentile(latencies, 0.5) * 1000:>8.0f} "
+              f"{percentile(latencies, 0.99) * 1000:>8.0f} {extra['confirm'] * 1000:>8.0f} "
+              f"{len(latencies) / elapsed:>8.1f} {rpc.calls:>6} "
+              f"{extra.get('resends', '-'):>7} {extra.get('rebroadcasts', '-'):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Replay benchmark: VWAP child sizing vs TWAP and naive market orders.
+
+Generates per-minute swap volume for a set of thin tokens, each with its
+own intraday shape, day-to-day regime shifts, clustered activity and
+bursts. The first days
+train a VolumeProfile per mint, then parent orders are replayed on the
+last day and executed as:
+- market: the whole size at once
+- twap: equal children
+- vwap static: children sized by the volume profile alone
+- vwap: vwap_scheduler.vwap_child_size, also adapting to realized volume
+
+Execution cost uses a square-root impact model on the volume traded
+while each child is worked (cost = k * sqrt(child / volume)).
+Reports the average and p95 cost in bps, plus the time one sizing
+decision takes.
+
+Usage:
+    python benchmarks/bench_vwap.py [--mints 50] [--parents 6] [--size 0.5] [--window 240]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from volume_profile import DAY, VolumeProfile  # noqa: E402
+from vwap_scheduler import vwap_child_size  # noqa: E402
+
+MINUTE = 60
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def synthetic_volume(rng, days):
+    """Per-minute volume of one mint over ``days`` days."""
+    base = rng.lognormvariate(0, 1)
+    peaks = [rng.uniform(0, DAY) for _ in range(2)]
+    minutes = []
+    activity = 0.0  # Persistent log-volume deviation: activity comes in clusters
+    for _ in range(days):
+        regime = rng.lognormvariate(0, 0.4)  # Busier or quieter day than usual
+        for minute in range(DAY // MINUTE):
+            t = minute * MINUTE
+            shape = 0.2 + sum(math.exp(-((t - p + DAY / 2) % DAY - DAY / 2) ** 2 / (2 * 5400 ** 2)) for p in peaks)
+            activity = 0.97 * activity + rng.gauss(0, 0.15)
+            burst = rng.lognormvariate(1.5, 0.5) if rng.random() < 0.003 else 1.0
+            minutes.append(base * regime * shape * burst * math.exp(activity) * rng.lognormvariate(0, 0.6))
+    return minutes
+
+
+def impact_bps(size, volume, k):
+    return 10_000 * k * math.sqrt(size / volume) if volume > 0 else 10_000 * k
+
+
+def replay(args, rng, timings):
+    costs = {"market": [], "twap": [], "vwap static": [], "vwap": []}
+    window = args.window * MINUTE
+    step_minutes = args.window // args.slices
+    for _ in range(args.mints):
+        volume = synthetic_volume(rng, args.train_days + 1)
+        profile = VolumeProfile(bucket_seconds=args.bucket_minutes * MINUTE)
+        test_start = args.train_days * DAY // MINUTE
+        for minute, v in enumerate(volume[:test_start]):
+            profile.record(v, minute * MINUTE + 30)
+
+        day_volume = sum(volume[test_start:])
+        # Non-overlapping windows, so the replay never looks ahead
+        windows = rng.sample(range(DAY // window), min(args.parents, DAY // window))
+        starts = sorted(test_start + w * args.window for w in windows)
+        recorded = test_start
+        for start in starts:
+            # Parent size as a share of the average volume in its window
+            size = args.size * day_volume * window / DAY
+
+            def worked(minute):
+                return sum(volume[minute:minute + step_minutes])
+
+            costs["market"].append(impact_bps(size, volume[start], args.k))
+            child = size / args.slices
+            costs["twap"].append(sum(
+                impact_bps(child, worked(start + i * step_minutes), args.k) for i in range(args.slices)
+            ) / args.slices)
+
+            runs = {"vwap static": 1.0, "vwap": args.max_ratio}
+            remaining = dict.fromkeys(runs, size)
+            cost = dict.fromkeys(runs, 0.0)
+            for i in range(args.slices):
+                minute = start + i * step_minutes
+                while recorded < minute:  # Market data up to now is known
+                    profile.record(volume[recorded], recorded * MINUTE + 30)
+                    recorded += 1
+                horizon = window - i * step_minutes * MINUTE
+                for name, ratio in runs.items():
+                    began = time.perf_counter()
+                    child = vwap_child_size(profile, remaining[name], args.slices - i, minute * MINUTE, horizon,
+                                            min_ratio=1 / ratio, max_ratio=ratio)
+                    timings.append(time.perf_counter() - began)
+                    cost[name] += child * impact_bps(child, worked(minute), args.k)
+                    remaining[name] -= child
+            for name in runs:
+                costs[name].append(cost[name] / size)
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mints", type=int, default=50)
+    parser.add_argument("--parents", type=int, default=6, help="Parent orders per mint")
+    parser.add_argument("--size", type=float, default=0.5, help="Parent size / average volume in its window")
+    parser.add_argument("--window", type=int, default=240, help="Execution window, minutes")
+    parser.add_argument("--slices", type=int, default=16)
+    parser.add_argument("--train-days", type=int, default=7)
+    parser.add_argument("--bucket-minutes", type=int, default=15)
+    parser.add_argument("--max-ratio", type=float, default=1.25, help="Bound of the realized volume adjustment")
+    parser.add_argument("--k", type=float, default=0.05, help="Square-root impact coefficient")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    timings = []
+    costs = replay(args, random.Random(args.seed), timings)
+    print(f"{args.mints} mints x {args.parents} parents, size {args.size:.2f}x window volume, "
+          f"{args.slices} slices over {args.window} min")
+    print(f"{'mode':<12} {'avg bps':>8} {'p95 bps':>8}")
+    for name, values in costs.items():
+        print(f"{name:<12} {sum(values) / len(values):>8.1f} {percentile(values, 0.95):>8.1f}")
+    print(f"sizing decision: {sum(timings) / len(timings) * 1e6:.1f} us avg")
+
+
+if __name__ == "__main__":
+    main()
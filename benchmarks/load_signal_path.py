@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Load test: signal-to-quote path against the local emulator.
+
+Pushes synthetic signal messages through the same steps as the bot
+(token extraction, then a Jupiter quote through the shared HTTP pool and
+quote cache) with every upstream pointed at src/emulator.py. Latency,
+error rate and rate limits of the emulator are configurable, so tail
+latency under upstream trouble can be reproduced on one machine.
+
+Reports signals/s, end-to-end latency percentiles, outcomes and the
+number of upstream requests that actually reached the emulator.
+
+Usage:
+    python benchmarks/load_signal_path.py [--signals 5000] [--concurrency 64]
+        [--mints 200] [--latency lognormal:40:400] [--error-rate 0.02]
+        [--service jupiter:rps=200]
+    python benchmarks/load_signal_path.py --url http://127.0.0.1:8899   # external emulator
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def make_messages(rng, signals, mints):
+    from token_extractor import b58encode
+
+    pool = [b58encode(rng.randbytes(32)) for _ in range(mints)]
+    weights = [1 / (rank + 1) for rank in range(mints)]  # A few hot mints, a long tail
+    return [f"🚀 New call\nCA: {mint}\nLFG" for mint in rng.choices(pool, weights, k=signals)]
+
+
+async def run(args):
+    from emulator import build_profiles, start_emulator
+    from http_client import close_http_client, get_http_client
+    from solana_utils import get_token_price, quote_cache
+    from token_extractor import extract_token_address
+
+    runner = None
+    if not args.url:
+        profiles = build_profiles(args.latency, args.error_rate, args.rps, args.service)
+        runner = await start_emulator(profiles, port=args.port, seed=args.seed)
+
+    messages = make_messages(random.Random(args.seed), args.signals, args.mints)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    outcomes = {"quoted": 0, "no quote": 0}
+
+    async def handle(message):
+        async with semaphore:
+            started = time.perf_counter()
+            token = extract_token_address(message)
+            price = await get_token_price(token, args.amount) if token else None
+            latencies.append(time.perf_counter() - started)
+            outcomes["quoted" if price else "no quote"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(handle(message) for message in messages))
+    elapsed = time.perf_counter() - started
+
+    _, upstream = await get_http_client().get_json(f"{os.environ['UPSTREAM_BASE_URL']}/_stats")
+    await close_http_client()
+    if runner is not None:
+        await runner.cleanup()
+
+    stats = quote_cache.stats
+    print(f"signals      {len(messages)} at concurrency {args.concurrency} over {args.mints} mints")
+    print(f"throughput   {len(messages) / elapsed:.0f} signals/s ({elapsed:.2f}s)")
+    print(f"latency ms   p50 {percentile(latencies, 0.5) * 1000:.1f} | p95 {percentile(latencies, 0.95) * 1000:.1f} | "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} | max {max(latencies) * 1000:.1f}")
+    print(f"outcomes     {outcomes}")
+    print(f"quote cache  hits {stats.hits} | coalesced {stats.coalesced} | no-route hits {stats.negative_hits} | "
+          f"upstream {stats.upstream_calls} ({stats.upstream_errors} errors)")
+    if upstream:
+        jupiter = upstream.get("jupiter", {})
+        print(f"emulator     jupiter requests {jupiter.get('requests')} | 500s {jupiter.get('errors')} | "
+              f"429s {jupiter.get('rate_limited')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--mints", type=int, default=200)
+    parser.add_argument("--amount", type=float, default=0.0215, help="Trade size in SOL")
+    parser.add_argument("--url", default="", help="Use an already running emulator")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", default="lognormal:40:400", help="Emulator latency spec (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument("--rps", type=float, default=0.0)
+    parser.add_argument("--service", action="append", default=[], help="Emulator override, name:key=value,...")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Must be set before solana_utils resolves its endpoints
+    os.environ["UPSTREAM_BASE_URL"] = args.url or f"http://127.0.0.1:{args.port}"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
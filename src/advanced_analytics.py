@@ -18,6 +18,8 @@ from typing import Optional
 import math
 import statistics
 
+from price_impact import estimate_slippage
+
 logger = logging.getLogger("SignalForge.Analytics")
 
 
@@ -225,8 +227,8 @@ class AdvancedAnalytics:
             # Liquidity score (higher = better)
             liquidity_score = min(100, (token_liquidity / 10) * 100)  # 10 SOL = 100 score
 
-            # Slippage estimate (simplified)
-            slippage = 0.005 if token_liquidity > 1 else 0.01 if token_liquidity > 0.5 else 0.02
+            # Slippage of selling the whole position into the pool
+            slippage = estimate_slippage(current_position, token_liquidity, "SELL")
 
             return RiskMetrics(
                 position_size_pct=position_size_pct,
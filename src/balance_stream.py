@@ -0,0 +1,283 @@
+"""Push-Based Wallet Balance Stream.
+
+Keep an always-current balance snapshot in memory instead of polling:
+- accountSubscribe on the wallet for its SOL balance
+- programSubscribe on Token and Token-2022 filtered to the wallet's token accounts
+- Full RPC resync after every (re)connect and periodically, to heal missed updates
+- Reconnect with jittered exponential backoff
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import aiohttp
+
+from http_client import get_http_client
+from rpc_pool import rpc_endpoints_from_env
+from token_accounts import (
+    TOKEN_2022_PROGRAM_ID,
+    TOKEN_ACCOUNT_SIZE,
+    TOKEN_PROGRAM_ID,
+    TokenBalance,
+    decode_token_account,
+    fetch_mint_metadata,
+    to_balances,
+)
+from token_extractor import b58decode, b58encode
+from token_metadata import TokenMetadataCache
+
+logger = logging.getLogger("SignalForge.BalanceStream")
+
+
+def ws_url_from_env() -> str:
+    """SOLANA_WS_URL, or the websocket twin of the first RPC endpoint."""
+    url = os.getenv("SOLANA_WS_URL", "").strip()
+    if url:
+        return url
+    rpc_url = rpc_endpoints_from_env()[0]
+    if rpc_url.startswith("https://"):
+        return "wss://" + rpc_url[len("https://"):]
+    if rpc_url.startswith("http://"):
+        return "ws://" + rpc_url[len("http://"):]
+    return rpc_url
+
+
+@dataclass
+class StreamStats:
+    """Subscription counters."""
+    connects: int = 0
+    disconnects: int = 0
+    notifications: int = 0
+    resyncs: int = 0
+    stale_updates: int = 0  # Updates older than the state they would replace
+
+
+class BalanceStream:
+    """Wallet SOL and token balances kept current over a websocket."""
+
+    def __init__(
+        self,
+        owner: str,
+        ws_url: str,
+        rpc: Any,
+        metadata: TokenMetadataCache,
+        resync_interval: float = 300.0,
+        reconnect_min: float = 1.0,
+        reconnect_max: float = 30.0,
+        heartbeat: float = 20.0,
+    ):
+        """
+        Args:
+            owner: Wallet address
+            ws_url: Solana websocket endpoint
+            rpc: RpcPool (or a stand-in) used for resyncs and mint lookups
+            metadata: Mint decimals cache
+            resync_interval: Seconds between full resyncs while connected
+            reconnect_min / reconnect_max: Backoff bounds in seconds
+            heartbeat: Websocket ping interval in seconds
+        """
+        self.owner = owner
+        self.ws_url = ws_url
+        self.rpc = rpc
+        self.metadata = metadata
+        self.resync_interval = resync_interval
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        self.heartbeat = heartbeat
+        self.stats = StreamStats()
+        self.lamports: Optional[int] = None
+        self.updated_at: Optional[float] = None
+        self._owner_key = b58decode(owner)
+        self._lamports_slot = -1
+        # token account -> (mint, raw amount, slot)
+        self._accounts: dict[str, tuple[str, int, int]] = {}
+        self._connected = False
+        self._synced = False
+        self._task: Optional[asyncio.Task] = None
+        self._lookups: set[asyncio.Task] = set()
+        self._pending_mints: set[str] = set()
+
+    @property
+    def is_live(self) -> bool:
+        """True while subscribed and the snapshot has been resynced."""
+        return self._connected and self._synced
+
+    @property
+    def sol_balance(self) -> Optional[float]:
+        """SOL balance from the snapshot."""
+        return None if self.lamports is None else self.lamports / 1e9
+
+    def token_amounts(self) -> dict[str, int]:
+        """Mint -> total raw amount from the snapshot."""
+        totals: dict[str, int] = {}
+        for mint, amount, _ in self._accounts.values():
+            if amount:
+                totals[mint] = totals.get(mint, 0) + amount
+        return totals
+
+    def token_balances(self) -> list[TokenBalance]:
+        """Non-zero token balances from the snapshot (mints of known decimals)."""
+        return to_balances(self.token_amounts(), self.metadata)
+
+    def start(self) -> None:
+        """Connect and keep the subscription alive in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="balance-stream")
+
+    async def stop(self) -> None:
+        """Close the subscription."""
+        tasks = [task for task in (self._task, *self._lookups) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._connected = self._synced = False
+
+    async def _run(self) -> None:
+        failures = 0
+        while True:
+            try:
+                await self._session()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A drop after a healthy session restarts the backoff
+                failures = 1 if self._synced else failures + 1
+                logger.warning("Balance stream error: %s", e)
+            finally:
+                if self._connected:
+                    self.stats.disconnects += 1
+                self._connected = self._synced = False
+            delay = min(self.reconnect_max, self.reconnect_min * 2 ** failures)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    def _subscriptions(self) -> list[dict]:
+        account = {"encoding": "base64", "commitment": "confirmed"}
+        owner_filter = {"memcmp": {"offset": 32, "bytes": self.owner}}
+        return [
+            {"method": "accountSubscribe", "params": [self.owner, account]},
+            {
+                "method": "programSubscribe",
+                "params": [TOKEN_PROGRAM_ID, {**account, "filters": [{"dataSize": TOKEN_ACCOUNT_SIZE}, owner_filter]}],
+            },
+            # Token-2022 accounts carry extensions, so their size varies
+            {"method": "programSubscribe", "params": [TOKEN_2022_PROGRAM_ID, {**account, "filters": [owner_filter]}]},
+        ]
+
+    async def _session(self) -> None:
+        session = await get_http_client().session()
+        async with session.ws_connect(self.ws_url, heartbeat=self.heartbeat) as ws:
+            for request_id, request in enumerate(self._subscriptions(), 1):
+                await ws.send_str(json.dumps({"jsonrpc": "2.0", "id": request_id, **request}))
+            self._connected = True
+            self.stats.connects += 1
+            # Subscribe first, then snapshot: anything that changes in between
+            # arrives as a notification with a newer slot
+            await self.resync()
+            logger.info("Balance stream live (%d token accounts)", len(self._accounts))
+
+            next_resync = time.monotonic() + self.resync_interval
+            while True:
+                try:
+                    msg = await ws.receive(timeout=max(0.0, next_resync - time.monotonic()))
+                except asyncio.TimeoutError:
+                    await self.resync()
+                    next_resync = time.monotonic() + self.resync_interval
+                    continue
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    raise ConnectionError(f"websocket closed ({msg.type.name})")
+                self.handle_message(json.loads(msg.data))
+
+    def handle_message(self, message: dict) -> None:
+        """Apply one websocket message to the snapshot."""
+        if "error" in message:
+            raise ConnectionError(f"subscription {message.get('id')} failed: {message['error']}")
+        method = message.get("method")
+        if method not in ("accountNotification", "programNotification"):
+            return
+        self.stats.notifications += 1
+        result = message.get("params", {}).get("result", {})
+        slot = result.get("context", {}).get("slot", 0)
+        value = result.get("value") or {}
+        if method == "accountNotification":
+            self._set_lamports(value.get("lamports"), slot)
+        else:
+            mint = self._set_account(value.get("pubkey"), value.get("account"), slot)
+            if mint is not None and self.metadata.decimals(mint) is None and mint not in self._pending_mints:
+                self._pending_mints.add(mint)
+                task = asyncio.create_task(self._lookup_decimals([mint]))
+                self._lookups.add(task)
+                task.add_done_callback(self._lookups.discard)
+
+    async def resync(self) -> None:
+        """Replace the snapshot with a fresh RPC read."""
+        options = {"encoding": "base64", "commitment": "confirmed"}
+        balance, *programs = await self.rpc.batch([
+            ("getBalance", [self.owner, {"commitment": "confirmed"}]),
+            ("getTokenAccountsByOwner", [self.owner, {"programId": TOKEN_PROGRAM_ID}, options]),
+            ("getTokenAccountsByOwner", [self.owner, {"programId": TOKEN_2022_PROGRAM_ID}, options]),
+        ])
+        for result in (balance, *programs):
+            if isinstance(result, Exception):
+                raise result
+
+        self._set_lamports(balance.get("value"), balance.get("context", {}).get("slot", 0))
+        snapshot_slot = min(result.get("context", {}).get("slot", 0) for result in programs)
+        # Keep only accounts updated by a notification newer than the snapshot
+        self._accounts = {
+            pubkey: state for pubkey, state in self._accounts.items() if state[2] > snapshot_slot
+        }
+        for result in programs:
+            slot = result.get("context", {}).get("slot", 0)
+            for entry in result.get("value") or []:
+                self._set_account(entry.get("pubkey"), entry.get("account"), slot)
+        unknown = [mint for mint in self.token_amounts() if self.metadata.decimals(mint) is None]
+        if unknown:
+            await self._lookup_decimals(unknown)
+        self._synced = True
+        self.stats.resyncs += 1
+
+    def _set_lamports(self, lamports: Optional[int], slot: int) -> None:
+        if lamports is None:
+            return
+        if slot < self._lamports_slot:
+            self.stats.stale_updates += 1
+            return
+        self.lamports = lamports
+        self._lamports_slot = slot
+        self.updated_at = time.monotonic()
+
+    def _set_account(self, pubkey: Optional[str], account: Optional[dict], slot: int) -> Optional[str]:
+        """Apply a token account update; returns its mint if it is still held."""
+        if not pubkey:
+            return None
+        current = self._accounts.get(pubkey)
+        if current is not None and slot < current[2]:
+            self.stats.stale_updates += 1
+            return None
+        decoded = decode_token_account(account)
+        if decoded is None or decoded[1] != self._owner_key:
+            # Closed or handed to another owner
+            self._accounts.pop(pubkey, None)
+            return None
+        mint = current[0] if current is not None else b58encode(decoded[0])
+        self._accounts[pubkey] = (mint, decoded[2], slot)
+        self.updated_at = time.monotonic()
+        return mint
+
+    async def _lookup_decimals(self, mints: list[str]) -> None:
+        try:
+            await self.metadata.load(mints)
+            unknown = [mint for mint in mints if self.metadata.decimals(mint) is None]
+            if unknown:
+                await fetch_mint_metadata(self.rpc, unknown, self.metadata)
+        except Exception as e:
+            logger.warning("Decimals lookup for %d mints failed: %s", len(mints), e)
+        finally:
+            self._pending_mints.difference_update(mints)
@@ -0,0 +1,167 @@
+"""Per-Channel Signal Shards.
+
+Monitor many signal channels from one process:
+- Per-channel trade amount, target multiplier and concurrency budget
+- One isolated queue + worker pool per channel, so a noisy channel
+  cannot starve a high-value one
+- Per-channel throughput and signal-to-trade latency counters
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from signal_queue import DropPolicy, SignalQueue
+
+logger = logging.getLogger("SignalForge.Channels")
+
+
+@dataclass
+class ChannelConfig:
+    """Trading settings for one monitored channel."""
+    channel: str  # @username, t.me link or numeric id
+    trade_amount: float
+    target_multiplier: float
+    workers: int
+    queue_size: int
+
+    @property
+    def lookup_key(self):
+        """Value to resolve with Telethon (numeric ids must be ints)."""
+        try:
+            return int(self.channel)
+        except ValueError:
+            return self.channel
+
+
+def parse_channel_configs(
+    spec: str,
+    trade_amount: float,
+    target_multiplier: float,
+    workers: int,
+    queue_size: int,
+) -> list[ChannelConfig]:
+    """Parse a channel list.
+
+    Channels are separated by ``;``. Each entry is the channel followed by
+    optional ``key=value`` overrides (``amount``, ``target``, ``workers``,
+    ``queue``), e.g.::
+
+        @alpha amount=0.05 target=3 workers=4; https://t.me/beta; -1001234567890
+
+    Raises:
+        ValueError: On unknown keys or malformed values
+    """
+    configs = []
+    for entry in spec.split(";"):
+        parts = entry.split()
+        if not parts:
+            continue
+        config = ChannelConfig(parts[0], trade_amount, target_multiplier, workers, queue_size)
+        for option in parts[1:]:
+            key, sep, value = option.partition("=")
+            if not sep:
+                raise ValueError(f"Invalid option '{option}' for channel {config.channel}")
+            if key == "amount":
+                config.trade_amount = float(value)
+            elif key == "target":
+                config.target_multiplier = float(value)
+            elif key == "workers":
+                config.workers = int(value)
+            elif key == "queue":
+                config.queue_size = int(value)
+            else:
+                raise ValueError(f"Unknown option '{key}' for channel {config.channel}")
+        configs.append(config)
+    return configs
+
+
+@dataclass
+class ChannelStats:
+    """Per-channel counters."""
+    signals: int = 0
+    trades: int = 0
+    total_latency: float = 0.0  # Seconds from message receipt to trade recorded
+    max_latency: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def avg_latency(self) -> float:
+        """Average signal-to-trade latency in seconds."""
+        return self.total_latency / self.trades if self.trades else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Trades per minute since the shard started."""
+        elapsed = time.monotonic() - self.started_at
+        return self.trades / elapsed * 60 if elapsed > 0 else 0.0
+
+
+class ChannelShard:
+    """Isolated queue and workers for one channel."""
+
+    def __init__(
+        self,
+        config: ChannelConfig,
+        processor: Callable[[ChannelConfig, str], Awaitable[bool]],
+        policy: DropPolicy = DropPolicy.DROP_OLDEST,
+        on_discard: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            config: Channel settings
+            processor: Coroutine that handles one token and returns True
+                if a trade was recorded
+            policy: Drop policy for the shard's queue
+            on_discard: Called with a token whose signal was dropped, rejected
+                or processed without recording a trade
+        """
+        self.config = config
+        self.processor = processor
+        self.on_discard = on_discard
+        self.stats = ChannelStats()
+        self.queue = SignalQueue(
+            self._handle,
+            maxsize=config.queue_size,
+            workers=config.workers,
+            policy=policy,
+            name=config.channel,
+            on_drop=lambda item: self._discard(item[0]),
+        )
+
+    def submit(self, token: str) -> bool:
+        """Queue a token signal from this channel."""
+        self.stats.signals += 1
+        accepted = self.queue.submit((token, time.monotonic()))
+        if not accepted:
+            self._discard(token)
+        return accepted
+
+    def _discard(self, token: str) -> None:
+        if self.on_discard is not None:
+            self.on_discard(token)
+
+    async def _handle(self, item: tuple[str, float]) -> None:
+        token, received_at = item
+        try:
+            traded = await self.processor(self.config, token)
+        except Exception:
+            self._discard(token)
+            raise
+        if not traded:
+            self._discard(token)
+            return
+        latency = time.monotonic() - received_at
+        self.stats.trades += 1
+        self.stats.total_latency += latency
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+
+    def start(self) -> None:
+        """Start the shard's workers."""
+        self.stats.started_at = time.monotonic()
+        self.queue.start()
+
+    async def stop(self) -> None:
+        """Drain and stop the shard's workers."""
+        await self.queue.stop()
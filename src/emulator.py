@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Local Upstream Emulator.
+
+Stand-in for Jupiter, CoinGecko, Coinbase, alternative.me, DexScreener and
+Solana RPC
+for offline load tests:
+- Serves every upstream under the paths expected by UPSTREAM_BASE_URL
+- Injectable latency distributions (fixed, uniform, lognormal by p50/p99)
+- Error rates (HTTP 500) and token-bucket rate limiting (HTTP 429)
+- Deterministic fake prices and quotes, plus a minimal JSON-RPC chain
+
+Usage:
+    python src/emulator.py --port 8899 --latency lognormal:40:400 --error-rate 0.01
+    python src/emulator.py --service jupiter:latency=uniform:20:80,errors=0.05,rps=50
+    UPSTREAM_BASE_URL=http://127.0.0.1:8899 python src/main.py
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import math
+import random
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import web
+
+from token_extractor import b58encode
+
+SERVICES = ("jupiter", "coingecko", "coinbase", "fng", "dexscreener", "rpc")
+_WSOL_MINT = "So11111111111111111111111111111111111111112"
+
+_Z99 = 2.326  # Standard normal 99th percentile
+
+
+@dataclass
+class LatencyModel:
+    """Response delay distribution, in milliseconds."""
+    kind: str = "fixed"  # fixed, uniform or lognormal
+    a: float = 0.0  # fixed value, uniform low, or lognormal p50
+    b: float = 0.0  # uniform high, or lognormal p99
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse "50", "fixed:50", "uniform:20:80" or "lognormal:40:400"."""
+        parts = spec.split(":")
+        if len(parts) == 1:
+            return cls("fixed", float(parts[0]))
+        kind, values = parts[0], [float(v) for v in parts[1:]]
+        if kind == "fixed" and len(values) == 1:
+            return cls(kind, values[0])
+        if kind in ("uniform", "lognormal") and len(values) == 2:
+            return cls(kind, values[0], values[1])
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one delay in seconds."""
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b) / 1000
+        if self.kind == "lognormal" and self.a > 0:
+            sigma = math.log(max(self.b, self.a) / self.a) / _Z99
+            return rng.lognormvariate(math.log(self.a), sigma) / 1000
+        return self.a / 1000
+
+
+class TokenBucket:
+    """Requests per second with a burst allowance."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def take(self) -> bool:
+        """Consume one token; False when the caller is rate limited."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class ServiceProfile:
+    """Fault injection settings and counters for one upstream."""
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0
+    bucket: Optional[TokenBucket] = None
+    requests: int = 0
+    errors: int = 0
+    limited: int = 0
+
+
+def _mint_value(mint: str, low: float, high: float) -> float:
+    """Stable pseudo-random value per mint."""
+    digest = hashlib.sha256(mint.encode()).digest()
+    return low + (high - low) * int.from_bytes(digest[:4], "big") / 2 ** 32
+
+
+class Emulator:
+    """aiohttp application serving all emulated upstreams."""
+
+    def __init__(self, profiles: dict[str, ServiceProfile], seed: int = 0, no_route_rate: float = 0.05):
+        self.profiles = profiles
+        self.rng = random.Random(seed)
+        self.no_route_rate = no_route_rate
+        self.started = time.monotonic()
+        self.sol_price = 150.0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.get("/jupiter/v4/quote", self._wrap("jupiter", self.quote)),
+            web.get("/jupiter/v4/price", self._wrap("jupiter", self.price)),
+            web.get("/coingecko/api/v3/simple/price", self._wrap("coingecko", self.coingecko_price)),
+            web.get("/coinbase/v2/prices/SOL-USD/spot", self._wrap("coinbase", self.coinbase_price)),
+            web.get("/fng/", self._wrap("fng", self.fear_greed)),
+            web.get("/dexscreener/latest/dex/tokens/{mints}", self._wrap("dexscreener", self.dex_volume)),
+            web.post("/rpc", self._wrap("rpc", self.rpc)),
+            web.get("/_stats", self.stats),
+        ])
+        return app
+
+    def _wrap(self, service: str, handler):
+        profile = self.profiles[service]
+
+        async def wrapped(request: web.Request) -> web.StreamResponse:
+            profile.requests += 1
+            if profile.bucket is not None and not profile.bucket.take():
+                profile.limited += 1
+                return web.json_response({"error": "rate limited"}, status=429, headers={"Retry-After": "1"})
+            await asyncio.sleep(profile.latency.sample(self.rng))
+            if profile.error_rate and self.rng.random() < profile.error_rate:
+                profile.errors += 1
+                return web.json_response({"error": "injected failure"}, status=500)
+            return await handler(request)
+
+        return wrapped
+
+    def _sol_price(self) -> float:
+        # Slow drift so price oracles see movement
+        return self.sol_price * (1 + 0.01 * math.sin((time.monotonic() - self.started) / 60))
+
+    async def quote(self, request: web.Request) -> web.Response:
+        mint = request.query.get("inputMint", "")
+        buy = mint == _WSOL_MINT
+        if buy:
+            mint = request.query.get("outputMint", "")
+        amount = int(request.query.get("amount", "0"))
+        if _mint_value(mint, 0, 1) < self.no_route_rate:
+            return web.json_response(
+                {"error": "Could not find any route", "errorCode": "COULD_NOT_FIND_ANY_ROUTE"}, status=400
+            )
+        value = _mint_value(mint, 1e-4, 1e-1)  # Lamports per raw token unit
+        out = int(amount / value if buy else amount * value)
+        return web.json_response({"data": [{"inAmount": str(amount), "outAmount": str(out)}], "timeTaken": 0.01})
+
+    async def price(self, request: web.Request) -> web.Response:
+        data = {}
+        for mint in filter(None, request.query.get("ids", "").split(",")):
+            price = self._sol_price() if mint == "SOL" else _mint_value(mint, 1e-6, 5.0)
+            data[mint] = {"id": mint, "mintSymbol": mint[:4].upper(), "vsToken": "USDC", "price": price}
+        return web.json_response({"data": data, "timeTaken": 0.001})
+
+    async def coingecko_price(self, request: web.Request) -> web.Response:
+        return web.json_response({"solana": {"usd": round(self._sol_price(), 2)}})
+
+    async def coinbase_price(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": {"base": "SOL", "currency": "USD", "amount": f"{self._sol_price():.2f}"}})
+
+    async def fear_greed(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": [{"value": "55", "value_classification": "Greed"}]})
+
+    async def dex_volume(self, request: web.Request) -> web.Response:
+        # One SOL pair per mint; 5-minute volume follows a daily cycle with noise
+        day = 2 * math.pi * (time.time() % 86400) / 86400
+        pairs = [
+            {
+                "chainId": "solana",
+                "baseToken": {"address": mint},
+                "quoteToken": {"address": _WSOL_MINT},
+                "volume": {"m5": _mint_value(mint, 100, 50_000) * (1.2 + math.sin(day)) * self.rng.uniform(0.7, 1.3)},
+            }
+            for mint in filter(None, request.match_info["mints"].split(","))
+        ]
+        return web.json_response({"schemaVersion": "1.0.0", "pairs": pairs})
+
+    def _height(self) -> int:
+        return int((time.monotonic() - self.started) / 0.4)
+
+    def _mint_account(self, mint: str) -> dict:
+        decimals = 6 if _mint_value(mint, 0, 1) < 0.5 else 9
+        data = struct.pack("<I32sQBBI32s", 0, bytes(32), 10 ** 15, decimals, 1, 0, bytes(32))
+        return {"data": [base64.b64encode(data).decode(), "base64"], "executable": False, "lamports": 1461600,
+                "owner": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", "rentEpoch": 0}
+
+    def _rpc_result(self, method: str, params: list):
+        height = self._height()
+        context = {"slot": height}
+        if method == "getBalance":
+            return {"context": context, "value": 2_500_000_000}
+        if method == "getLatestBlockhash":
+            blockhash = b58encode(hashlib.sha256(str(height).encode()).digest())
+            return {"context": context, "value": {"blockhash": blockhash, "lastValidBlockHeight": height + 150}}
+        if method == "getBlockHeight":
+            return height
+        if method == "sendTransaction":
+            return b58encode(hashlib.sha512(str(params[0]).encode()).digest())
+        if method == "getSignatureStatuses":
+            status = {"slot": height, "confirmations": None, "err": None, "confirmationStatus": "confirmed"}
+            return {"context": context, "value": [status for _ in params[0]]}
+        if method in ("getTokenAccountsByOwner", "getProgramAccounts"):
+            return {"context": context, "value": []}
+        if method == "getMultipleAccounts":
+            # Every key is an initialized mint without authorities
+            return {"context": context, "value": [self._mint_account(key) for key in params[0]]}
+        raise KeyError(method)
+
+    def _rpc_reply(self, request: dict) -> dict:
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            reply["result"] = self._rpc_result(request.get("method", ""), request.get("params") or [])
+        except KeyError:
+            reply["error"] = {"code": -32601, "message": "Method not found"}
+        return reply
+
+    async def rpc(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self._rpc_reply(item) for item in payload])
+        return web.json_response(self._rpc_reply(payload))
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            name: {"requests": p.requests, "errors": p.errors, "rate_limited": p.limited}
+            for name, p in self.profiles.items()
+        })
+
+
+def build_profiles(
+    latency: str = "0",
+    error_rate: float = 0.0,
+    rps: float = 0.0,
+    overrides: Optional[list[str]] = None,
+) -> dict[str, ServiceProfile]:
+    """Profiles for every service from defaults plus "name:key=value,..." overrides.
+
+    Override keys: latency (spec as for LatencyModel.parse), errors, rps, burst.
+    """
+    settings = {name: {"latency": latency, "errors": error_rate, "rps": rps} for name in SERVICES}
+    for override in overrides or []:
+        name, _, options = override.partition(":")
+        if name not in settings:
+            raise ValueError(f"Unknown service {name!r}, expected one of {', '.join(SERVICES)}")
+        for option in filter(None, options.split(",")):
+            key, _, value = option.partition("=")
+            if key not in ("latency", "errors", "rps", "burst"):
+                raise ValueError(f"Unknown option {key!r} for {name}")
+            settings[name][key] = value
+    profiles = {}
+    for name, options in settings.items():
+        rate = float(options["rps"])
+        burst = float(options["burst"]) if "burst" in options else None
+        profiles[name] = ServiceProfile(
+            latency=LatencyModel.parse(str(options["latency"])),
+            error_rate=float(options["errors"]),
+            bucket=TokenBucket(rate, burst) if rate > 0 else None,
+        )
+    return profiles
+
+
+async def start_emulator(
+    profiles: dict[str, ServiceProfile],
+    host: str = "127.0.0.1",
+    port: int = 8899,
+    seed: int = 0,
+) -> web.AppRunner:
+    """Start the emulator in the running loop; call ``cleanup()`` on the result to stop."""
+    runner = web.AppRunner(Emulator(profiles, seed=seed).app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", default="0", help="Default latency spec (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Default HTTP 500 probability")
+    parser.add_argument("--rps", type=float, default=0.0, help="Default rate limit, 0 = unlimited")
+    parser.add_argument("--service", action="append", default=[], help="Per-service override, name:key=value,...")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profiles = build_profiles(args.latency, args.error_rate, args.rps, args.service)
+    app = Emulator(profiles, seed=args.seed).app()
+    print(f"Emulator on http://{args.host}:{args.port} (set UPSTREAM_BASE_URL to this address)")
+    web.run_app(app, host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == "__main__":
+    main()
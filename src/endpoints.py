@@ -0,0 +1,31 @@
+"""Upstream Endpoint Configuration.
+
+One place for every external base URL:
+- Public defaults for Jupiter, CoinGecko, Coinbase, alternative.me, DexScreener
+  and Solana RPC
+- Per-endpoint override through the environment variable of the same name
+- UPSTREAM_BASE_URL points every endpoint at one host (e.g. the local emulator)
+"""
+
+import os
+
+# name -> (public default, path under UPSTREAM_BASE_URL)
+UPSTREAMS = {
+    "JUPITER_QUOTE_URL": ("https://quote-api.jup.ag/v4/quote", "/jupiter/v4/quote"),
+    "JUPITER_PRICE_URL": ("https://price.jup.ag/v4/price", "/jupiter/v4/price"),
+    "COINGECKO_API_URL": ("https://api.coingecko.com/api/v3", "/coingecko/api/v3"),
+    "COINBASE_API_URL": ("https://api.coinbase.com/v2", "/coinbase/v2"),
+    "FEAR_GREED_URL": ("https://api.alternative.me/fng/", "/fng/"),
+    "DEXSCREENER_API_URL": ("https://api.dexscreener.com/latest/dex", "/dexscreener/latest/dex"),
+    "SOLANA_RPC_URL": ("https://api.mainnet-beta.solana.com", "/rpc"),
+}
+
+
+def endpoint(name: str) -> str:
+    """Resolve an upstream URL: explicit env var, then UPSTREAM_BASE_URL, then the default."""
+    default, path = UPSTREAMS[name]
+    url = os.getenv(name, "").strip()
+    if url:
+        return url
+    base = os.getenv("UPSTREAM_BASE_URL", "").strip().rstrip("/")
+    return base + path if base else default
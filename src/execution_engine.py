@@ -1,67 +1,62 @@
 """Smart Order Execution Engine.
 
 Professional-grade order execution:
-- Slippage optimization (split large orders)
+- Slippage optimization (split large orders across AMM pools)
 - Time-weighted average price (TWAP) orders
 - Volume-weighted average price (VWAP) orders
-- Limit order placement and management
+- Limit, stop-loss and take-profit orders fired by price ticks
 - Partial fill handling
 - Circuit breaker checks
 - Pre-trade compliance checks
 """
 
 import logging
-import asyncio
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-logger = logging.getLogger("SignalForge.ExecutionEngine")
+from order_store import Order, OrderStatus, OrderStore, OrderType
+from price_impact import PoolCache, estimate_slippage
+from token_metadata import TokenMetadataCache
+from trigger_engine import TriggerEngine
 
+if TYPE_CHECKING:
+    from twap_scheduler import TwapScheduler
+    from vwap_scheduler import VwapScheduler
 
-class OrderType(Enum):
-    """Order types."""
-    MARKET = "market"
-    LIMIT = "limit"
-    STOP_LOSS = "stop_loss"
-    TAKE_PROFIT = "take_profit"
-    TWAP = "twap"  # Time-weighted average price
-    VWAP = "vwap"  # Volume-weighted average price
-
-
-class OrderStatus(Enum):
-    """Order status."""
-    PENDING = "pending"
-    PARTIALLY_FILLED = "partially_filled"
-    FILLED = "filled"
-    CANCELLED = "cancelled"
-    REJECTED = "rejected"
-
-
-@dataclass
-class Order:
-    """Order object."""
-    order_id: str
-    token_address: str
-    order_type: OrderType
-    side: str  # BUY or SELL
-    size: float  # Size in SOL
-    price: float  # Limit price
-    stop_price: Optional[float] = None
-    status: OrderStatus = OrderStatus.PENDING
-    filled_size: float = 0.0
-    average_fill_price: float = 0.0
-    created_at: datetime = None
-    updated_at: datetime = None
+logger = logging.getLogger("SignalForge.ExecutionEngine")
 
 
 class ExecutionEngine:
     """Smart order execution system."""
 
-    def __init__(self):
-        self.orders: dict[str, Order] = {}
-        self.max_order_age = timedelta(minutes=5)  # Orders expire after 5 min
+    def __init__(
+        self,
+        metadata: Optional[TokenMetadataCache] = None,
+        twap: Optional["TwapScheduler"] = None,
+        vwap: Optional["VwapScheduler"] = None,
+        orders: Optional[OrderStore] = None,
+        triggers: Optional[TriggerEngine] = None,
+        pools: Optional[PoolCache] = None,
+    ):
+        """
+        Args:
+            metadata: Token metadata cache used for mint authority checks
+            twap: Scheduler working off TWAP orders (they stay PENDING without one)
+            vwap: Scheduler working off VWAP orders (they stay PENDING without one)
+            orders: Order store (in-memory only if omitted); its
+                ``max_order_age`` bounds how long an order stays open
+            triggers: Resting limit / stop orders, fired by ``on_price``
+            pools: AMM pool states; market orders are split across a
+                mint's pools when it has any, else priced off ``liquidity``
+        """
+        self.metadata = metadata
+        self.twap = twap
+        self.vwap = vwap
+        self.orders = orders if orders is not None else OrderStore()
+        self.triggers = triggers if triggers is not None else TriggerEngine()
+        self.pools = pools
+        for scheduler in (twap, vwap):
+            if scheduler is not None and scheduler.store is None:
+                scheduler.store = self.orders  # Keep status indexes in step with fills
         self.slippage_tolerance = 0.01  # 1% slippage tolerance
 
     async def execute_order(
@@ -80,13 +75,15 @@ class ExecutionEngine:
             order_type: Type of order
             side: BUY or SELL
             size: Order size in SOL
-            price: Price (for limit orders)
+            price: Limit price, or trigger price of stop-loss / take-profit orders
             liquidity: Available liquidity
 
         Returns:
             Order object with execution details
         """
         try:
+            self.expire_orders()
+
             # Pre-trade compliance checks
             compliance_check = await self._pre_trade_compliance(
                 token_address, size, liquidity
@@ -104,6 +101,10 @@ class ExecutionEngine:
                 order = await self._execute_limit_order(
                     token_address, side, size, price
                 )
+            elif order_type in (OrderType.STOP_LOSS, OrderType.TAKE_PROFIT):
+                order = await self._execute_trigger_order(
+                    token_address, order_type, side, size, price
+                )
             elif order_type == OrderType.TWAP:
                 order = await self._execute_twap_order(
                     token_address, side, size, price
@@ -116,7 +117,6 @@ class ExecutionEngine:
                 order = None
 
             if order:
-                self.orders[order.order_id] = order
                 logger.info(f"Order executed: {order.order_id}")
 
             return order
@@ -124,6 +124,35 @@ class ExecutionEngine:
             logger.error(f"Error executing order: {e}", exc_info=True)
             return None
 
+    def expire_orders(self) -> list[Order]:
+        """Cancel open orders older than ``max_order_age``, including their schedules."""
+        expired = self.orders.expire()
+        for order in expired:
+            self.triggers.cancel(order.order_id)
+            for scheduler in (self.twap, self.vwap):
+                if scheduler is not None:
+                    scheduler.cancel(order.order_id)
+        if expired:
+            logger.info(f"Expired {len(expired)} stale orders")
+        return expired
+
+    def on_price(self, token_address: str, price: float) -> list[Order]:
+        """Fill the resting orders of a mint that a price tick crosses.
+
+        Returns:
+            list[Order]: Orders filled by this tick
+        """
+        self.expire_orders()  # Stale orders must not fill; O(1) when none are due
+        fired = self.triggers.on_tick(token_address, price)
+        for order in fired:
+            # Crossed limits fill at or inside their limit; stops fill at market
+            order.average_fill_price = price
+            order.filled_size = order.size
+            self.orders.set_status(order, OrderStatus.FILLED)
+        if fired:
+            logger.info(f"Price {price} on {token_address} triggered {len(fired)} orders")
+        return fired
+
     async def _pre_trade_compliance(
         self,
         token_address: str,
@@ -140,6 +169,15 @@ class ExecutionEngine:
 
         # Check for suspected honeypot or restricted tokens
         # (In production, check against honeypot database)
+        mint = None
+        if self.metadata is not None:
+            await self.metadata.load([token_address])
+            mint = self.metadata.get(token_address)
+        if mint is not None:
+            if mint.freeze_authority:
+                logger.warning(f"Token {token_address} has a freeze authority")
+            if mint.mint_authority:
+                logger.warning(f"Token {token_address} still has a mint authority")
 
         return {"pass": True, "reason": ""}
 
@@ -151,22 +189,31 @@ class ExecutionEngine:
         liquidity: float,
     ) -> Order:
         """Execute market order with slippage estimation."""
-        order = Order(
-            order_id=f"MARKET_{token_address}_{datetime.now().timestamp()}",
-            token_address=token_address,
-            order_type=OrderType.MARKET,
-            side=side,
-            size=size,
-            price=0,  # Market price TBD
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+        order = self.orders.create(
+            token_address,
+            OrderType.MARKET,
+            side,
+            size,
+            0,  # Market price TBD
         )
 
-        # Estimate slippage
-        slippage = self._estimate_slippage(size, liquidity)
+        pools = await self.pools.refresh(token_address) if self.pools is not None else []
+        if pools:
+            buy = side == "BUY"
+            spot = max(pool.price for pool in pools)
+            # Sizes are in SOL: sells are converted to tokens at the best price
+            split = self.pools.split(token_address, size if buy else size / spot, buy)
+            slippage = split.slippage
+            self.pools.apply(split)
+            logger.debug(
+                "Split %s %.4f SOL of %s over %d pools, slippage %.3f%%",
+                side, size, token_address, len(split.legs), slippage * 100,
+            )
+        else:
+            slippage = self._estimate_slippage(size, liquidity, side)
         order.average_fill_price = 1.0 * (1 - slippage if side == "SELL" else 1 + slippage)
         order.filled_size = size
-        order.status = OrderStatus.FILLED
+        self.orders.set_status(order, OrderStatus.FILLED)
 
         return order
 
@@ -178,17 +225,34 @@ class ExecutionEngine:
         limit_price: float,
     ) -> Order:
         """Execute limit order."""
-        order = Order(
-            order_id=f"LIMIT_{token_address}_{datetime.now().timestamp()}",
-            token_address=token_address,
-            order_type=OrderType.LIMIT,
-            side=side,
-            size=size,
-            price=limit_price,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            status=OrderStatus.PENDING,
+        order = self.orders.create(
+            token_address,
+            OrderType.LIMIT,
+            side,
+            size,
+            limit_price,
+        )
+        self.triggers.add(order)
+        return order
+
+    async def _execute_trigger_order(
+        self,
+        token_address: str,
+        order_type: OrderType,
+        side: str,
+        size: float,
+        trigger_price: float,
+    ) -> Order:
+        """Rest a stop-loss or take-profit order until its trigger price is crossed."""
+        order = self.orders.create(
+            token_address,
+            order_type,
+            side,
+            size,
+            0,  # Market price once triggered
+            stop_price=trigger_price,
         )
+        self.triggers.add(order)
         return order
 
     async def _execute_twap_order(
@@ -198,25 +262,26 @@ class ExecutionEngine:
         total_size: float,
         price: float,
         intervals: int = 4,
+        interval_seconds: float = 30.0,
     ) -> Order:
         """Execute Time-Weighted Average Price order.
 
-        Splits order over time to reduce market impact.
+        Splits order over time to reduce market impact: ``intervals``
+        children, ``interval_seconds`` apart, fired by the TWAP scheduler.
         """
-        order = Order(
-            order_id=f"TWAP_{token_address}_{datetime.now().timestamp()}",
-            token_address=token_address,
-            order_type=OrderType.TWAP,
-            side=side,
-            size=total_size,
-            price=price,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+        duration = (intervals - 1) * interval_seconds
+        order = self.orders.create(
+            token_address,
+            OrderType.TWAP,
+            side,
+            total_size,
+            price,
+            ttl=duration + self.orders.max_order_age,
         )
 
-        # In production, split order into intervals
-        # and execute each piece at scheduled times
-        order.status = OrderStatus.PENDING
+        if self.twap is not None:
+            # Children update the order in place as they fill
+            self.twap.submit(order, duration=duration, slices=intervals)
         return order
 
     async def _execute_vwap_order(
@@ -225,31 +290,35 @@ class ExecutionEngine:
         side: str,
         total_size: float,
         price: float,
+        intervals: int = 8,
+        interval_seconds: float = 30.0,
     ) -> Order:
         """Execute Volume-Weighted Average Price order.
 
-        Executes in proportion to market volume.
+        Executes in proportion to market volume: ``intervals`` children,
+        ``interval_seconds`` apart, sized by the mint's volume profile.
         """
-        order = Order(
-            order_id=f"VWAP_{token_address}_{datetime.now().timestamp()}",
-            token_address=token_address,
-            order_type=OrderType.VWAP,
-            side=side,
-            size=total_size,
-            price=price,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+        duration = (intervals - 1) * interval_seconds
+        order = self.orders.create(
+            token_address,
+            OrderType.VWAP,
+            side,
+            total_size,
+            price,
+            ttl=duration + self.orders.max_order_age,
         )
 
-        order.status = OrderStatus.PENDING
+        if self.vwap is not None:
+            self.vwap.submit(order, duration=duration, slices=intervals)
         return order
 
     def _estimate_slippage(
         self,
         order_size: float,
         available_liquidity: float,
+        side: str = "BUY",
     ) -> float:
-        """Estimate execution slippage.
+        """Estimate execution slippage against one constant-product pool.
 
         Returns:
             float: Slippage as percentage (e.g., 0.01 = 1%)
@@ -257,7 +326,4 @@ class ExecutionEngine:
         if available_liquidity <= 0:
             return 0.05  # 5% worst case
 
-        # Slippage increases non-linearly with order size
-        ratio = order_size / available_liquidity
-        slippage = (ratio ** 2) * 0.1  # Quadratic model
-        return min(slippage, 0.05)  # Cap at 5%
+        return estimate_slippage(order_size, available_liquidity, side)
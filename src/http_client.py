@@ -0,0 +1,154 @@
+"""Shared async HTTP client.
+
+One long-lived aiohttp session for every outbound API call:
+- Keep-alive connection pool shared across handlers
+- Per-host connection limits
+- DNS caching
+- Uniform JSON GET/POST helpers with per-call latency budgets
+- Every request runs through its endpoint's resilience guard
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Optional
+
+import aiohttp
+
+from resilience import get_guard
+
+logger = logging.getLogger("SignalForge.HTTP")
+
+DEFAULT_TIMEOUT = 10.0
+
+
+class UpstreamStatusError(Exception):
+    """Retryable HTTP status (429 or 5xx) from an upstream."""
+
+    def __init__(self, status: int, data: Any):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.data = data
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class HttpClient:
+    """Lazily created, pooled aiohttp session."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    use_dns_cache=True,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                )
+        return self._session
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> tuple[int, Any]:
+        """GET a JSON document.
+
+        Args:
+            timeout: Total latency budget, retries included
+
+        Returns:
+            (status, data) where data is None if the body is not JSON
+        """
+        return await self._request("GET", url, timeout, params=params)
+
+    async def post_json(
+        self,
+        url: str,
+        payload: Any,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> tuple[int, Any]:
+        """POST a JSON payload and decode the JSON reply."""
+        return await self._request("POST", url, timeout, json=payload)
+
+    async def _request(self, method: str, url: str, budget: float, **kwargs) -> tuple[int, Any]:
+        session = await self.session()
+
+        async def attempt(timeout: float) -> tuple[int, Any]:
+            async with session.request(
+                method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+            ) as resp:
+                data = await self._read_json(resp)
+                if resp.status == 429 or resp.status >= 500:
+                    raise UpstreamStatusError(resp.status, data)
+                return resp.status, data
+
+        try:
+            return await get_guard(url).call(attempt, budget)
+        except UpstreamStatusError as e:
+            # Out of retries: hand the last status back like any other reply
+            return e.status, e.data
+
+    @staticmethod
+    async def _read_json(resp: aiohttp.ClientResponse) -> Any:
+        try:
+            return await resp.json(content_type=None)
+        except (aiohttp.ContentTypeError, ValueError):
+            return None
+
+    async def close(self) -> None:
+        """Close the pool and release all sockets."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client."""
+    global _client
+    if _client is None:
+        _client = HttpClient(
+            limit=_env_int("HTTP_POOL_SIZE", 100),
+            limit_per_host=_env_int("HTTP_POOL_PER_HOST", 20),
+            dns_cache_ttl=_env_int("HTTP_DNS_CACHE_TTL", 300),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client, if it was ever opened."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
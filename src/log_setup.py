@@ -0,0 +1,120 @@
+"""Logging Pipeline.
+
+Keep log I/O off the event loop:
+- Queue-based handler; a background thread formats and writes records
+- Size or time based rotation of the log file
+- Optional structured JSON output
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock handler merges ``msg % args`` in the calling thread. The queue
+    here never leaves the process, so the record can be passed through
+    untouched and the caller only pays for an enqueue. Arguments should not
+    be mutated after they are logged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _file_handler(path: str) -> logging.Handler:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    backups = _env_int("LOG_BACKUP_COUNT", 5)
+    when = os.getenv("LOG_ROTATE_WHEN", "").strip()
+    if when:
+        return logging.handlers.TimedRotatingFileHandler(
+            path, when=when, backupCount=backups, encoding="utf-8"
+        )
+    return logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=_env_int("LOG_MAX_BYTES", 10 * 1024 * 1024),
+        backupCount=backups,
+        encoding="utf-8",
+    )
+
+
+def configure_logging() -> None:
+    """Configure root logging from the environment.
+
+    Environment:
+        LOG_LEVEL: Root level (default INFO)
+        LOG_FILE: Log file path, empty to disable (default bot.log)
+        LOG_MAX_BYTES / LOG_BACKUP_COUNT: Size rotation (default 10 MB x 5)
+        LOG_ROTATE_WHEN: Time rotation instead, e.g. "midnight" or "H"
+        LOG_JSON: "1" for JSON lines
+        LOG_ASYNC: "0" to write synchronously (default async)
+    """
+    global _listener
+
+    formatter = JsonFormatter() if os.getenv("LOG_JSON", "0") == "1" else logging.Formatter(DEFAULT_FORMAT)
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    log_file = os.getenv("LOG_FILE", "bot.log").strip()
+    if log_file:
+        handlers.append(_file_handler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    if os.getenv("LOG_ASYNC", "1") == "0":
+        for handler in handlers:
+            root.addHandler(handler)
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -8,32 +8,54 @@ import random
 import re
 import signal
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+
+# Taken before third-party imports so the startup report includes them
+_PROCESS_START = time.perf_counter()
 
 from dotenv import load_dotenv
-from telethon import Button, TelegramClient, events
+
+# Before local imports, which resolve endpoint URLs from the environment
+load_dotenv()
+
+from telethon import Button, TelegramClient, events, utils
 from telethon.sessions import StringSession
 
+from balance_stream import BalanceStream, ws_url_from_env
+from channel_shards import ChannelConfig, ChannelShard, parse_channel_configs
+from http_client import close_http_client
+from log_setup import configure_logging, shutdown_logging
+from market_volume import MarketVolumeFeed
+from pnl_tracker import PnLTracker
+from resilience import CircuitState, all_guards
+from rpc_pool import get_rpc_pool
+from session_store import SessionStore, entity_from_dict, entity_to_dict
+from signal_dedup import SignalDedupCache
+from signal_queue import DropPolicy
 from solana_utils import (
+    fetch_market_volume,
     get_sol_price,
     get_token_balances,
     get_token_price,
     get_wallet_balance,
     initialize_wallet,
+    quote_cache,
+    refresh_token_metadata,
     send_sol,
+    sol_price_oracle,
+    token_metadata,
+    value_token_balances,
 )
-
-load_dotenv()
+from startup_timer import StartupTimer
+from token_extractor import extract_token_address
+from trade_index import TradeIndex, page_from_end
+from trade_journal import TradeJournal
+from tx_pipeline import close_tx_pipeline, current_tx_pipeline, get_tx_pipeline
+from volume_profile import VolumeProfileStore
 
 # ========== Logging Setup ==========
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("bot.log"),
-    ],
-)
+configure_logging()
 logger = logging.getLogger("SignalForge")
 
 
@@ -56,6 +78,15 @@ def _get_float_env(name: str, default: float) -> float:
         return default
 
 
+def _get_drop_policy_env(name: str, default: DropPolicy) -> DropPolicy:
+    value = os.getenv(name, default.value).strip().lower()
+    try:
+        return DropPolicy(value)
+    except ValueError:
+        logger.warning(f"Invalid drop policy for {name}, using default: {default.value}")
+        return default
+
+
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 API_ID = _get_int_env("TELEGRAM_API_ID", 0)
 API_HASH = os.getenv("TELEGRAM_API_HASH", "").strip()
@@ -66,6 +97,28 @@ TRADE_AMOUNT = _get_float_env("TRADE_AMOUNT_SOL", 0.0215)
 TARGET_MULTIPLIER = _get_float_env("TARGET_MULTIPLIER", 2.0)
 DEFAULT_STATUS = os.getenv("DEFAULT_BOT_STATUS", "stopped").lower() == "running"
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "").strip()
+SIGNAL_QUEUE_SIZE = _get_int_env("SIGNAL_QUEUE_SIZE", 100)
+SIGNAL_WORKERS = _get_int_env("SIGNAL_WORKERS", 4)
+SIGNAL_DROP_POLICY = _get_drop_policy_env("SIGNAL_DROP_POLICY", DropPolicy.DROP_OLDEST)
+SIGNAL_DEDUP_WINDOW = _get_float_env("SIGNAL_DEDUP_WINDOW_SEC", 300.0)
+SIGNAL_DEDUP_MAX_SIZE = _get_int_env("SIGNAL_DEDUP_MAX_SIZE", 10_000)
+CHANNELS_SPEC = os.getenv("TELEGRAM_CHANNELS", "").strip()
+try:
+    CHANNEL_CONFIGS: list[ChannelConfig] = parse_channel_configs(
+        CHANNELS_SPEC or CHANNEL, TRADE_AMOUNT, TARGET_MULTIPLIER, SIGNAL_WORKERS, SIGNAL_QUEUE_SIZE
+    )
+    CHANNEL_CONFIG_ERROR = ""
+except ValueError as e:
+    CHANNEL_CONFIGS = []
+    CHANNEL_CONFIG_ERROR = f"TELEGRAM_CHANNELS is invalid: {e}"
+STATE_DIR = os.getenv("BOT_STATE_DIR", "state").strip() or "state"
+TRADE_JOURNAL_PATH = os.getenv("TRADE_JOURNAL_PATH", os.path.join(STATE_DIR, "trades.db")).strip()
+TRADE_JOURNAL_SYNC = os.getenv("TRADE_JOURNAL_SYNC", "normal").strip().upper()
+SESSION_PATH = os.getenv("SESSION_PATH", os.path.join(STATE_DIR, "session.enc")).strip()
+VOLUME_PROFILE_PATH = os.getenv("VOLUME_PROFILE_PATH", os.path.join(STATE_DIR, "volume_profiles.db")).strip()
+SESSION_SECRET = os.getenv("SESSION_SECRET", "").strip()
+BALANCE_TIMEOUT = _get_float_env("BALANCE_TIMEOUT_SEC", 5.0)
+BALANCE_STREAM = os.getenv("BALANCE_STREAM", "0").strip().lower() in {"1", "true", "yes"}
 
 
 def _validate_runtime_config() -> list[str]:
@@ -77,29 +130,56 @@ def _validate_runtime_config() -> list[str]:
         errors.append("TELEGRAM_API_ID is required")
     if not API_HASH:
         errors.append("TELEGRAM_API_HASH is required")
-    if not CHANNEL:
-        errors.append("TELEGRAM_CHANNEL is required")
+    if CHANNEL_CONFIG_ERROR:
+        errors.append(CHANNEL_CONFIG_ERROR)
+    elif not CHANNEL_CONFIGS:
+        errors.append("TELEGRAM_CHANNEL or TELEGRAM_CHANNELS is required")
+    for config in CHANNEL_CONFIGS:
+        if config.trade_amount <= 0 or config.target_multiplier <= 0:
+            errors.append(f"{config.channel}: amount and target must be greater than 0")
+        if config.workers <= 0 or config.queue_size <= 0:
+            errors.append(f"{config.channel}: workers and queue must be greater than 0")
     if TRADE_AMOUNT <= 0:
         errors.append("TRADE_AMOUNT_SOL must be greater than 0")
     if TARGET_MULTIPLIER <= 0:
         errors.append("TARGET_MULTIPLIER must be greater than 0")
+    if SIGNAL_QUEUE_SIZE <= 0:
+        errors.append("SIGNAL_QUEUE_SIZE must be greater than 0")
+    if SIGNAL_WORKERS <= 0:
+        errors.append("SIGNAL_WORKERS must be greater than 0")
+    if TRADE_JOURNAL_SYNC not in {"OFF", "NORMAL", "FULL"}:
+        errors.append("TRADE_JOURNAL_SYNC must be off, normal or full")
     return errors
 
 
 # ========== Global State ==========
-wallet = initialize_wallet(PRIVATE_KEY)
-wallet_pubkey = wallet.pubkey() if wallet else None
+startup_timer = StartupTimer(_PROCESS_START)
+startup_timer.mark("imports")
+wallet = None
+wallet_pubkey = None
+_wallet_loaded = False
 bot_status = "running" if DEFAULT_STATUS else "stopped"
 bot_start_time = datetime.now()
 trading_history: list[dict] = []
+pnl_tracker = PnLTracker()
+trade_index = TradeIndex()
+trade_journal = TradeJournal(TRADE_JOURNAL_PATH, synchronous=TRADE_JOURNAL_SYNC)
+signal_dedup = SignalDedupCache(window=SIGNAL_DEDUP_WINDOW, max_size=SIGNAL_DEDUP_MAX_SIZE)
+volume_profiles = VolumeProfileStore(VOLUME_PROFILE_PATH)  # Intraday volume per mint, for VWAP sizing
+market_volume = MarketVolumeFeed(volume_profiles, fetch_market_volume)  # Market swaps, never our own
 shutdown_event = asyncio.Event()
+balance_stream: BalanceStream | None = None
 
 
 # ========== Utilities ==========
-def extract_token_address(text: str) -> str | None:
-    """Extract Solana token address from text using regex."""
-    match = re.findall(r"\b[1-9A-HJ-NP-Za-km-z]{32,44}\b", text)
-    return match[-1] if match else None
+def load_wallet():
+    """Initialize the wallet on first use, keeping solders out of startup."""
+    global wallet, wallet_pubkey, _wallet_loaded
+    if not _wallet_loaded:
+        wallet = initialize_wallet(PRIVATE_KEY)
+        wallet_pubkey = wallet.pubkey() if wallet else None
+        _wallet_loaded = True
+    return wallet
 
 
 def truncate_address(addr: str | None, chars: int = 8) -> str:
@@ -120,30 +200,42 @@ def simulate_trade(amount: float) -> tuple[bool, float]:
 
 
 def calculate_pnl() -> tuple[float, float, float, float]:
-    """Calculate profit and loss from trading history."""
-    total_invested = sum(t.get("amount", 0) for t in trading_history)
-    total_returned = sum(t.get("return", 0) for t in trading_history)
-    pnl = total_returned - total_invested
-    pct = (pnl / total_invested * 100) if total_invested else 0
-    return pnl, pct, total_invested, total_returned
+    """Return profit and loss from the running aggregates."""
+    totals = pnl_tracker.totals
+    return totals.pnl, totals.pnl_pct, totals.invested, totals.returned
 
 
-def add_trade(token: str, amount: float, price: float | None = None, ret: float | None = None) -> None:
+def add_trade(token: str, amount: float, price: float | None = None, ret: float | None = None) -> dict:
     """Record a trade in history."""
-    trading_history.append(
-        {
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "token": token,
-            "amount": amount,
-            "price": price,
-            "return": ret,
-        }
-    )
-    logger.info(f"Trade recorded: {token} | Amount: {amount} SOL | Price: {price}")
+    trade = {
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "token": token,
+        "amount": amount,
+        "price": price,
+        "return": ret,
+    }
+    trading_history.append(trade)
+    pnl_tracker.add_trade(trade)
+    trade_journal.append(trade)
+    trade_index.add(trade)
+    logger.info("Trade recorded: %s | Amount: %s SOL | Price: %s", token, amount, price)
+    return trade
+
+
+def set_trade_return(trade: dict, ret: float) -> None:
+    """Fill in the return of a recorded trade."""
+    old_return = trade.get("return")
+    trade["return"] = ret
+    pnl_tracker.update_return(trade, old_return)
+    trade_index.update_return(trade, old_return)
+    trade_journal.update_return(trade)
 
 
 # ========== Telegram Bot Handlers ==========
-client = TelegramClient(StringSession(), API_ID or 1, API_HASH or "dummy")
+session_store = SessionStore(SESSION_PATH, SESSION_SECRET)
+_saved_session, _saved_entities = session_store.load()
+client = TelegramClient(StringSession(_saved_session), API_ID or 1, API_HASH or "dummy")
+startup_timer.mark("session load")
 
 
 @client.on(events.NewMessage(pattern="/start"))
@@ -160,7 +252,7 @@ async def start_handler(event):
         await event.reply(
             f"🤖 **SignalForge Bot**\n\n"
             f"Status: {status_emoji} {bot_status.upper()}\n"
-            f"Channel: {CHANNEL}\n"
+            f"Channels: {', '.join(c.channel for c in CHANNEL_CONFIGS)}\n"
             f"Trade amount: {TRADE_AMOUNT} SOL\n"
             f"Target: {TARGET_MULTIPLIER}x",
             buttons=buttons,
@@ -174,30 +266,127 @@ async def start_handler(event):
 async def balance_handler(event):
     """Handle /balance command."""
     try:
-        if not wallet:
+        if not load_wallet():
             await event.reply("❌ Wallet not initialized.")
             return
 
         await event.reply("💰 Fetching balance...")
-        sol = await get_wallet_balance(str(wallet_pubkey))
-        price = get_sol_price()
-        value = sol * price
-        tokens, token_value = await get_token_balances(str(wallet_pubkey))
-        total = value + token_value
-
-        msg = f"💰 **Balance**\nSOL: {sol:.4f} (${value:.2f})\n"
-        if tokens:
+        started = time.perf_counter()
+        address = str(wallet_pubkey)
+        stream = balance_stream if balance_stream is not None and balance_stream.is_live else None
+        tasks = {"price": asyncio.create_task(get_sol_price())}
+        if stream is None:
+            tasks["sol"] = asyncio.create_task(get_wallet_balance(address))
+            tasks["tokens"] = asyncio.create_task(get_token_balances(address))
+        else:
+            # Balances come from the subscription snapshot; only prices hit the network
+            tasks["tokens"] = asyncio.create_task(value_token_balances(stream.token_balances()))
+        _, pending = await asyncio.wait(tasks.values(), timeout=BALANCE_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        results = {
+            name: task.result()
+            for name, task in tasks.items()
+            if task.done() and not task.cancelled() and task.exception() is None
+        }
+        if stream is not None:
+            results["sol"] = stream.sol_balance
+        missing = sorted(set(tasks) - set(results))
+        logger.info(
+            "⏱️ /balance lookups took %.0fms (%s, missing: %s)",
+            (time.perf_counter() - started) * 1000,
+            "stream" if stream is not None else "poll",
+            missing,
+        )
+
+        sol = results.get("sol")
+        price = results.get("price")
+        tokens, token_value = results.get("tokens", ([], 0))
+        value = sol * price if sol is not None and price else None
+
+        if sol is None:
+            msg = "💰 **Balance**\nSOL: ⏳ timed out\n"
+        elif value is None:
+            msg = f"💰 **Balance**\nSOL: {sol:.4f} (USD price unavailable)\n"
+        else:
+            msg = f"💰 **Balance**\nSOL: {sol:.4f} (${value:.2f})\n"
+        if "tokens" in missing:
+            msg += "\n**Tokens**: ⏳ timed out\n"
+        elif tokens:
             msg += "\n**Tokens**:\n"
             for token in tokens[:5]:
                 token_value_usd = token["balance"] * token["price"]
                 msg += f"• {token['symbol']}: {token['balance']:.4f} (${token_value_usd:.2f})\n"
-        msg += f"\n**Total**: ${total:.2f}"
+        total = (value or 0) + token_value
+        msg += f"\n**Total**: ${total:.2f}{' (partial)' if missing else ''}"
         await event.reply(msg)
     except Exception as e:
         logger.error(f"Error in balance_handler: {e}")
         await event.reply("❌ Error fetching balance.")
 
 
+HISTORY_PAGE_SIZE = 5
+
+
+def _format_trades(trades: list[dict], start: int = 1) -> str:
+    """Format trades for a history reply."""
+    msg = ""
+    for i, trade in enumerate(trades, start):
+        ret = trade.get("return")
+        pnl = (ret - trade["amount"]) if ret is not None else 0
+        emoji = "✅" if pnl > 0 else "❌" if pnl < 0 else "⚪"
+        msg += f"\n**#{i}** {emoji} {trade['date']}\n"
+        msg += f"Token: {truncate_address(trade['token'])}\n"
+        msg += f"Amount: {trade['amount']:.4f} SOL\n"
+        if ret is not None:
+            msg += f"Return: {ret:.4f} SOL ({pnl:+.4f})\n"
+    return msg
+
+
+def _query_history(args: list[str]) -> tuple[str, list[dict], int, int]:
+    """Resolve /history arguments to (title, trades, total, first number).
+
+    Supported forms:
+        /history [page]
+        /history today|yesterday|YYYY-MM-DD [page]
+        /history worst|best [count] [page]
+        /history <mint> [page]
+    """
+    def _int_arg(index: int, default: int) -> int:
+        try:
+            return max(1, int(args[index]))
+        except (IndexError, ValueError):
+            return default
+
+    if not args or args[0].isdigit():
+        page = _int_arg(0, 1)
+        trades = page_from_end(trading_history, page, HISTORY_PAGE_SIZE)
+        return "Recent Trades", trades, len(trading_history), (page - 1) * HISTORY_PAGE_SIZE + 1
+
+    keyword = args[0].lower()
+    if keyword in ("worst", "best"):
+        count = min(_int_arg(1, 10), 20)
+        page = _int_arg(2, 1)
+        query = trade_index.worst if keyword == "worst" else trade_index.best
+        trades, total = query(count, page)
+        return f"{keyword.title()} Trades", trades, total, (page - 1) * count + 1
+
+    if keyword in ("today", "yesterday") or re.fullmatch(r"\d{4}-\d{2}-\d{2}", keyword):
+        if keyword == "today":
+            day = datetime.now().strftime("%Y-%m-%d")
+        elif keyword == "yesterday":
+            day = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        else:
+            day = keyword
+        page = _int_arg(1, 1)
+        trades, total = trade_index.for_day(day, page, HISTORY_PAGE_SIZE)
+        return f"Trades on {day}", trades, total, (page - 1) * HISTORY_PAGE_SIZE + 1
+
+    page = _int_arg(1, 1)
+    trades, total = trade_index.for_mint(args[0], page, HISTORY_PAGE_SIZE)
+    return f"Trades for {truncate_address(args[0])}", trades, total, (page - 1) * HISTORY_PAGE_SIZE + 1
+
+
 @client.on(events.NewMessage(pattern="/history"))
 async def history_handler(event):
     """Handle /history command."""
@@ -206,15 +395,14 @@ async def history_handler(event):
             await event.reply("📊 No trades yet.")
             return
 
-        msg = "📊 **Recent Trades**\n"
-        for i, trade in enumerate(trading_history[-5:], 1):
-            pnl = (trade.get("return", 0) - trade["amount"]) if "return" in trade else 0
-            emoji = "✅" if pnl > 0 else "❌" if pnl < 0 else "⚪"
-            msg += f"\n**#{i}** {emoji}\n"
-            msg += f"Token: {truncate_address(trade['token'])}\n"
-            msg += f"Amount: {trade['amount']:.4f} SOL\n"
-            if "return" in trade and trade["return"] is not None:
-                msg += f"Return: {trade['return']:.4f} SOL\n"
+        args = (getattr(event, "raw_text", None) or "").split()[1:]
+        title, trades, total, first = _query_history(args)
+        if not trades:
+            await event.reply(f"📊 No trades found ({total} matching).")
+            return
+
+        msg = f"📊 **{title}** ({first}-{first + len(trades) - 1} of {total})\n"
+        msg += _format_trades(trades, first)
 
         pnl, pct, _, _ = calculate_pnl()
         msg += f"\n**Overall PnL**: {pnl:+.4f} SOL ({pct:+.2f}%)"
@@ -233,13 +421,19 @@ async def pnl_handler(event):
             await event.reply("📈 No trades yet.")
             return
 
-        usd = pnl * get_sol_price()
+        sol_price = await get_sol_price()
+        usd_text = f"${pnl * sol_price:.2f}" if sol_price else "n/a (no fresh SOL price)"
+        totals = pnl_tracker.totals
+        today = pnl_tracker.by_day.get(datetime.now().strftime("%Y-%m-%d"))
+        today_text = f"{today.pnl:+.4f} SOL ({today.trades} trades)" if today else "no trades"
         await event.reply(
             f"📈 **PnL**\n"
             f"Invested: {invested:.4f} SOL\n"
             f"Returned: {returned:.4f} SOL\n"
             f"PnL: {pnl:+.4f} SOL ({pct:+.2f}%)\n"
-            f"USD: ${usd:.2f}"
+            f"USD: {usd_text}\n"
+            f"Wins/Losses: {totals.wins}/{totals.losses} | Open: {totals.open}\n"
+            f"Today: {today_text}"
         )
     except Exception as e:
         logger.error(f"Error in pnl_handler: {e}")
@@ -250,7 +444,7 @@ async def pnl_handler(event):
 async def wallet_handler(event):
     """Handle /wallet command."""
     try:
-        if wallet_pubkey:
+        if load_wallet():
             await event.reply(f"🏦 **Wallet**\n`{wallet_pubkey}`")
         else:
             await event.reply("❌ Wallet not available.")
@@ -300,7 +494,7 @@ async def about_handler(event):
             f"Uptime: {uptime_text}\n"
             f"Trades: {len(trading_history)}\n"
             f"PnL: {pnl:+.4f} SOL\n"
-            f"Channel: {CHANNEL}"
+            f"Channels: {', '.join(c.channel for c in CHANNEL_CONFIGS)}"
         )
     except Exception as e:
         logger.error(f"Error in about_handler: {e}")
@@ -316,12 +510,14 @@ async def help_handler(event):
             "/start – Main menu\n"
             "/balance – Wallet balance\n"
             "/history – Trade history\n"
+            "  /history <mint> | today | YYYY-MM-DD | worst 10 | best 10 [page]\n"
             "/pnl – Profit/Loss\n"
             "/wallet – Show address\n"
             "/runbot – Start monitoring\n"
             "/stopbot – Stop monitoring\n"
             "/send – Send SOL (usage: /send <amount> <address>)\n"
             "/receive – Show address\n"
+            "/stats – Signal queue stats\n"
             "/about – Bot info\n"
             "/help – This message"
         )
@@ -334,7 +530,7 @@ async def help_handler(event):
 async def send_handler(event):
     """Handle /send command."""
     try:
-        if not wallet:
+        if not load_wallet():
             await event.reply("❌ Wallet not ready.")
             return
 
@@ -355,6 +551,10 @@ async def send_handler(event):
             if success:
                 await event.reply(f"✅ Sent! Tx: {tx}")
                 logger.info(f"SOL sent: {amount} to {truncate_address(addr)}")
+            elif success is None:
+                # Still tracked: sending again now could pay twice
+                await event.reply(f"⏳ Not confirmed yet: {tx}. Check the balance before sending again.")
+                logger.warning(f"SOL send unconfirmed: {tx}")
             else:
                 await event.reply(f"❌ Failed: {tx}")
                 logger.error(f"Failed to send SOL: {tx}")
@@ -369,7 +569,7 @@ async def send_handler(event):
 async def receive_handler(event):
     """Handle /receive command."""
     try:
-        if wallet_pubkey:
+        if load_wallet():
             await event.reply(f"📥 **Receive**\n`{wallet_pubkey}`")
         else:
             await event.reply("❌ Wallet not available.")
@@ -398,32 +598,161 @@ async def callback_handler(event):
         logger.error(f"Error in callback_handler: {e}")
 
 
-@client.on(events.NewMessage(chats=CHANNEL))
+@client.on(events.NewMessage(pattern="/stats"))
+async def stats_handler(event):
+    """Handle /stats command."""
+    try:
+        msg = "📡 **Channels**\n"
+        for shard in channel_shards:
+            queue = shard.queue
+            stats = queue.stats
+            channel = shard.stats
+            msg += (
+                f"\n**{shard.config.channel}** ({shard.config.trade_amount} SOL, "
+                f"{shard.config.target_multiplier}x, {queue.worker_count} workers)\n"
+                f"Signals: {channel.signals} | Trades: {channel.trades} ({channel.throughput:.2f}/min)\n"
+                f"Latency: avg {channel.avg_latency * 1000:.0f}ms, max {channel.max_latency * 1000:.0f}ms\n"
+                f"Queue: {queue.depth}/{queue.maxsize} (max {stats.max_depth}) | "
+                f"Failed: {stats.failed} | Dropped: {stats.dropped} | Rejected: {stats.rejected}\n"
+                f"Wait: avg {stats.avg_wait * 1000:.1f}ms, max {stats.max_wait * 1000:.1f}ms\n"
+            )
+        msg += (
+            f"\n🔁 **Dedup** ({SIGNAL_DEDUP_WINDOW:.0f}s window)\n"
+            f"Hits: {signal_dedup.stats.hits} | Misses: {signal_dedup.stats.misses} "
+            f"({signal_dedup.stats.hit_rate * 100:.1f}% dup)\n"
+            f"Tracked: {len(signal_dedup)} | Evicted: {signal_dedup.stats.evictions}\n"
+        )
+        oracle = sol_price_oracle
+        msg += (
+            f"\n💵 **SOL/USD** ${oracle.price:.2f} from {oracle.source or 'n/a'} "
+            f"({oracle.age:.0f}s old{', STALE' if oracle.is_stale else ''})\n"
+            f"Refreshes: {oracle.stats.refreshes} | Failed: {oracle.stats.failures} | "
+            f"Outliers: {oracle.stats.outliers}\n"
+        )
+        if balance_stream is not None:
+            stream = balance_stream.stats
+            msg += (
+                f"\n📶 **Balance Stream** {'live' if balance_stream.is_live else 'reconnecting'}\n"
+                f"Notifications: {stream.notifications} | Resyncs: {stream.resyncs} | "
+                f"Reconnects: {stream.disconnects}\n"
+            )
+        guards = sorted(all_guards(), key=lambda guard: guard.name)
+        if guards:
+            msg += "\n🛡️ **Upstreams**\n"
+        for guard in guards:
+            icon = {CircuitState.CLOSED: "🟢", CircuitState.HALF_OPEN: "🟡", CircuitState.OPEN: "🔴"}[guard.state]
+            p99 = f"{guard.p99 * 1000:.0f}ms" if guard.p99 is not None else "n/a"
+            msg += (
+                f"{icon} {guard.name}\n"
+                f"Calls: {guard.stats.calls} | Failed: {guard.stats.failures} (timeouts {guard.stats.timeouts}) | "
+                f"Retries: {guard.stats.retries} | Fast-fails: {guard.stats.short_circuits} | "
+                f"Trips: {guard.stats.trips}\n"
+                f"p99 {p99} → attempt timeout {guard.attempt_timeout:.2f}s\n"
+            )
+        pipeline = current_tx_pipeline()
+        if pipeline is None:
+            msg += "\n📤 **Transactions**: not started (no wallet)\n"
+        else:
+            txs = pipeline.stats
+            msg += (
+                f"\n📤 **Transactions** ({pipeline.in_flight} in flight)\n"
+                f"Submitted: {txs.submitted} | Confirmed: {txs.confirmed} | Failed: {txs.failed}\n"
+                f"Resends: {txs.resends} | Rebroadcasts: {txs.rebroadcasts} | "
+                f"Confirm: avg {txs.avg_latency:.1f}s, max {txs.max_latency:.1f}s\n"
+            )
+        quotes = quote_cache.stats
+        msg += (
+            f"\n🧮 **Quote Cache** ({quote_cache.ttl:.0f}s TTL, {len(quote_cache)} cached)\n"
+            f"Hits: {quotes.hits} | No-route hits: {quotes.negative_hits} | "
+            f"Coalesced: {quotes.coalesced} | Misses: {quotes.misses} "
+            f"({quotes.hit_rate * 100:.1f}% saved)\n"
+            f"Upstream: {quotes.upstream_calls} calls, {quotes.upstream_errors} errors, "
+            f"avg {quotes.avg_upstream_latency * 1000:.0f}ms, max {quotes.upstream_latency_max * 1000:.0f}ms\n"
+        )
+        await event.reply(msg)
+    except Exception as e:
+        logger.error(f"Error in stats_handler: {e}")
+        await event.reply("❌ Error retrieving stats.")
+
+
+async def process_signal(config: ChannelConfig, token: str) -> bool:
+    """Quote, record and simulate a trade for a queued signal."""
+    amount = config.trade_amount
+    price = await get_token_price(token, amount)
+    if not price:
+        logger.warning("⚠️ Could not fetch price for %s.", token)
+        return False
+
+    trade = add_trade(token, amount, price)
+    market_volume.watch(token)
+    target = price * config.target_multiplier
+    logger.info("💰 Price: %.6f → Target: %.6f", price, target)
+    success, ret = simulate_trade(amount)
+    set_trade_return(trade, ret)
+    diff = ret - amount
+    logger.info("%s Trade: %+.4f SOL", "✅" if success else "❌", diff)
+    return True
+
+
+# A signal that never becomes a trade must not block reposts of its mint
+channel_shards = [
+    ChannelShard(config, process_signal, SIGNAL_DROP_POLICY, on_discard=signal_dedup.unmark)
+    for config in CHANNEL_CONFIGS
+]
+shards_by_peer: dict[int, ChannelShard] = {}
+
+
 async def channel_handler(event):
-    """Monitor channel for trading signals."""
+    """Monitor channels for trading signals."""
     try:
         if bot_status != "running":
             return
 
+        shard = shards_by_peer.get(event.chat_id)
+        if shard is None:
+            return
+
         msg = event.raw_text
         token = extract_token_address(msg)
         if not token:
             return
 
-        logger.info(f"📥 Signal detected: {token}")
-        price = get_token_price(token, TRADE_AMOUNT)
-        if price:
-            add_trade(token, TRADE_AMOUNT, price)
-            target = price * TARGET_MULTIPLIER
-            logger.info(f"💰 Price: {price:.6f} → Target: {target:.6f}")
-            success, ret = simulate_trade(TRADE_AMOUNT)
-            trading_history[-1]["return"] = ret
-            diff = ret - TRADE_AMOUNT
-            logger.info(f"{'✅' if success else '❌'} Trade: {diff:+.4f} SOL")
-        else:
-            logger.warning("⚠️ Could not fetch price.")
+        # Marked on intake so reposts are ignored while this one is queued;
+        # the shard unmarks it if it is dropped or fails
+        if signal_dedup.check_and_mark(token):
+            logger.info("🔁 Duplicate signal ignored: %s", token)
+            return
+
+        logger.info("📥 Signal detected in %s: %s", shard.config.channel, token)
+        shard.submit(token)
     except Exception as e:
-        logger.error(f"Error in channel_handler: {e}")
+        logger.error("Error in channel_handler: %s", e)
+
+
+async def _register_channels() -> None:
+    """Resolve monitored channels and start one shard per channel.
+
+    Entities cached by a previous run are reused, so a warm restart skips
+    the username lookups.
+    """
+    for shard in channel_shards:
+        cached = _saved_entities.get(shard.config.channel)
+        entity = entity_from_dict(cached) if cached else None
+        if entity is None:
+            try:
+                entity = await client.get_input_entity(shard.config.lookup_key)
+            except Exception as e:
+                logger.error(f"Cannot resolve channel {shard.config.channel}: {e}")
+                continue
+            cached = entity_to_dict(entity)
+            if cached:
+                _saved_entities[shard.config.channel] = cached
+        shards_by_peer[utils.get_peer_id(entity)] = shard
+        shard.start()
+
+    if not shards_by_peer:
+        raise ValueError("None of the configured channels could be resolved")
+    client.add_event_handler(channel_handler, events.NewMessage(chats=list(shards_by_peer)))
 
 
 # ========== Signal Handlers ==========
@@ -433,7 +762,24 @@ def handle_shutdown_signal(signum, frame):
     shutdown_event.set()
 
 
+async def _disconnect_on_shutdown() -> None:
+    """Disconnect the client once a shutdown signal arrives."""
+    await shutdown_event.wait()
+    await client.disconnect()
+
+
 # ========== Main ==========
+def _start_balance_stream() -> None:
+    """Subscribe to wallet balance changes over the RPC websocket."""
+    global balance_stream
+    if not load_wallet():
+        logger.warning("BALANCE_STREAM is on but no wallet is configured")
+        return
+    balance_stream = BalanceStream(str(wallet_pubkey), ws_url_from_env(), get_rpc_pool(), token_metadata)
+    balance_stream.start()
+    logger.info("📶 Balance stream enabled")
+
+
 async def main() -> None:
     """Main entry point for the bot."""
     try:
@@ -444,25 +790,66 @@ async def main() -> None:
             raise ValueError(error_msg)
 
         logger.info("🚀 SignalForge Bot starting...")
-        logger.info(f"📡 Monitoring channel: {CHANNEL}")
-        logger.info(f"💰 Trade amount: {TRADE_AMOUNT} SOL")
-        logger.info(f"🎯 Target multiplier: {TARGET_MULTIPLIER}x")
-
+        trading_history.extend(trade_journal.load(pnl=pnl_tracker))
+        trade_index.rebuild(trading_history)  # Indexes build on their first query
+        trade_journal.start()
+        startup_timer.mark("journal replay")
+        for config in CHANNEL_CONFIGS:
+            logger.info(
+                f"📡 Monitoring channel: {config.channel} | 💰 {config.trade_amount} SOL | "
+                f"🎯 {config.target_multiplier}x | 📥 {config.queue_size} slots, {config.workers} workers"
+            )
+        logger.info(f"📥 Queue drop policy: {SIGNAL_DROP_POLICY.value}")
+
+        warm = bool(_saved_session)
         await client.start(bot_token=BOT_TOKEN)
+        startup_timer.mark("connect (warm session)" if warm else "connect + login")
+        await _register_channels()
+        startup_timer.mark("channel resolution")
+        sol_price_oracle.start()
+        token_metadata.start(refresh_token_metadata)
+        volume_profiles.start()
+        market_volume.start()
+        if BALANCE_STREAM:
+            _start_balance_stream()
+        logger.info(f"⏱️ Startup: {startup_timer.report()}")
+        if load_wallet():
+            # Prefetch blockhashes now, so the first /send signs without waiting on the RPC
+            get_tx_pipeline().start()
+        session_store.save(client.session.save(), _saved_entities)
+        if not session_store.enabled:
+            logger.info("SESSION_SECRET not set, Telegram session will not be persisted")
+
         me = await client.get_me()
         logger.info(f"✅ Logged in as {me.username or me.first_name}")
         logger.info("=" * 50)
 
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, handle_shutdown_signal)
-        signal.signal(signal.SIGINT, handle_shutdown_signal)
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, handle_shutdown_signal, signum, None)
 
-        await client.run_until_disconnected()
+        disconnect_on_shutdown = asyncio.create_task(_disconnect_on_shutdown())
+        try:
+            await client.run_until_disconnected()
+        finally:
+            disconnect_on_shutdown.cancel()
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
     finally:
+        await asyncio.gather(*(shard.stop() for shard in channel_shards))
+        await sol_price_oracle.stop()
+        if balance_stream is not None:
+            await balance_stream.stop()
+        await token_metadata.stop()
+        await market_volume.stop()
+        await volume_profiles.stop()
+        await close_tx_pipeline()
+        await close_http_client()
+        await asyncio.to_thread(trade_journal.close)
         logger.info("Bot shutdown complete.")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
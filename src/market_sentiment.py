@@ -14,7 +14,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-import requests
+
+from endpoints import endpoint
+from http_client import get_http_client
 
 logger = logging.getLogger("SignalForge.Sentiment")
 
@@ -48,9 +50,8 @@ class MarketSentiment:
     """Market sentiment analysis engine."""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.fear_greed_url = "https://api.alternative.me/fng/"
-        self.coingecko_url = "https://api.coingecko.com/api/v3"
+        self.fear_greed_url = endpoint("FEAR_GREED_URL")
+        self.coingecko_url = endpoint("COINGECKO_API_URL")
 
     async def analyze_market_sentiment(
         self,
@@ -111,9 +112,8 @@ class MarketSentiment:
     async def _get_fear_greed_index(self) -> float:
         """Fetch Fear & Greed Index from alternative.me."""
         try:
-            resp = self.session.get(self.fear_greed_url, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
+            status, data = await get_http_client().get_json(self.fear_greed_url, timeout=5)
+            if status == 200 and data:
                 return float(data["data"][0]["value"])
         except Exception as e:
             logger.warning(f"Error fetching Fear & Greed: {e}")
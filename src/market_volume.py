@@ -0,0 +1,105 @@
+"""Market Volume Feed.
+
+Per-mint market swap volume for the intraday volume profiles:
+- Polls a DEX volume source for mints that were recently signalled or traded
+- Records the volume the whole market traded, never the bot's own fills,
+  so VWAP children cannot inflate the forecast that sizes the next child
+- Watched mints expire after a while and their number is bounded
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from volume_profile import VolumeProfileStore
+
+logger = logging.getLogger("SignalForge.MarketVolume")
+
+SOURCE_WINDOW = 300.0  # Seconds of volume one answer covers (DexScreener "m5")
+
+# Mints -> volume traded by the market over the last SOURCE_WINDOW seconds
+VolumeSource = Callable[[list[str]], Awaitable[dict[str, float]]]
+
+
+class MarketVolumeFeed:
+    """Feeds market swap volume of watched mints into their volume profiles."""
+
+    def __init__(
+        self,
+        profiles: VolumeProfileStore,
+        fetch: VolumeSource,
+        interval: float = SOURCE_WINDOW,
+        watch_for: float = 6 * 3600,
+        max_mints: int = 200,
+        batch_size: int = 30,
+    ):
+        """
+        Args:
+            profiles: Volume profiles to feed
+            fetch: Market volume of up to ``batch_size`` mints per call
+            interval: Seconds between polls; volume is scaled to it
+            watch_for: Seconds a mint is polled after its last ``watch``
+            max_mints: Mints polled at most; the least recently watched go first
+            batch_size: Mints per ``fetch`` call
+        """
+        self.profiles = profiles
+        self.fetch = fetch
+        self.interval = interval
+        self.watch_for = watch_for
+        self.max_mints = max(1, max_mints)
+        self.batch_size = max(1, batch_size)
+        self._watched: OrderedDict[str, float] = OrderedDict()  # mint -> monotonic expiry
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(self, mint: str) -> None:
+        """Poll the market volume of ``mint`` for the next ``watch_for`` seconds."""
+        self._watched[mint] = time.monotonic() + self.watch_for
+        self._watched.move_to_end(mint)
+        while len(self._watched) > self.max_mints:
+            self._watched.popitem(last=False)
+
+    async def poll(self) -> int:
+        """Record one interval of market volume for every watched mint; returns mints recorded."""
+        now = time.monotonic()
+        for mint in [mint for mint, expiry in self._watched.items() if expiry <= now]:
+            del self._watched[mint]
+        mints = list(self._watched)
+        recorded = 0
+        for start in range(0, len(mints), self.batch_size):
+            batch = mints[start:start + self.batch_size]
+            try:
+                volumes = await self.fetch(batch)
+            except Exception as e:
+                logger.warning(f"Market volume of {len(batch)} mints unavailable: {e}")
+                continue
+            ts = time.time()
+            for mint in batch:
+                volume = volumes.get(mint)
+                if volume is not None and volume >= 0:
+                    self.profiles.record(mint, volume * self.interval / SOURCE_WINDOW, ts)
+                    recorded += 1
+        return recorded
+
+    def start(self) -> None:
+        """Poll every ``interval`` seconds in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop(), name="market-volume")
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            recorded = await self.poll()
+            logger.debug("Recorded market volume of %d mints", recorded)
+
+    def __len__(self) -> int:
+        """Mints currently watched."""
+        return len(self._watched)
@@ -0,0 +1,308 @@
+"""Indexed Order Store.
+
+Bounded in-memory order book for the execution engine:
+- Compact slotted Order records with monotonic integer ids and unix float timestamps
+- Secondary indexes by mint, status and side
+- Min-heap of expiry times, so stale open orders are cancelled in O(log n)
+- Closed orders beyond a memory bound spill to a SQLite archive in batches
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from enum import Enum
+from typing import Optional
+
+logger = logging.getLogger("SignalForge.OrderStore")
+
+
+class OrderType(Enum):
+    """Order types."""
+    MARKET = "market"
+    LIMIT = "limit"
+    STOP_LOSS = "stop_loss"
+    TAKE_PROFIT = "take_profit"
+    TWAP = "twap"  # Time-weighted average price
+    VWAP = "vwap"  # Volume-weighted average price
+
+
+class OrderStatus(Enum):
+    """Order status."""
+    PENDING = "pending"
+    PARTIALLY_FILLED = "partially_filled"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+    REJECTED = "rejected"
+
+
+OPEN_STATUSES = (OrderStatus.PENDING, OrderStatus.PARTIALLY_FILLED)
+
+
+@dataclass(slots=True)
+class Order:
+    """Order object."""
+    order_id: int
+    token_address: str
+    order_type: OrderType
+    side: str  # BUY or SELL
+    size: float  # Size in SOL
+    price: float  # Limit price
+    stop_price: Optional[float] = None
+    status: OrderStatus = OrderStatus.PENDING
+    filled_size: float = 0.0
+    average_fill_price: float = 0.0
+    created_at: float = 0.0  # Unix time
+    updated_at: float = 0.0  # Unix time
+
+    @property
+    def is_open(self) -> bool:
+        """True while the order can still fill."""
+        return self.status in OPEN_STATUSES
+
+
+_COLUMNS = tuple(f.name for f in fields(Order))
+_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS orders (
+        order_id INTEGER PRIMARY KEY,
+        {", ".join(name for name in _COLUMNS[1:])}
+    )
+"""
+_row = attrgetter(*_COLUMNS)
+_INSERT = f"INSERT OR REPLACE INTO orders ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+
+def _to_row(order: Order) -> tuple:
+    row = list(_row(order))
+    row[2] = order.order_type.value
+    row[7] = order.status.value
+    return tuple(row)
+
+
+def _from_row(row) -> Order:
+    order = Order(*row)
+    order.order_type = OrderType(order.order_type)
+    order.status = OrderStatus(order.status)
+    return order
+
+
+class OrderStore:
+    """Orders by id with secondary indexes, expiry heap and a disk archive."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_order_age: float = 300.0,
+        max_closed: int = 10_000,
+        spill_batch: int = 1_000,
+    ):
+        """
+        Args:
+            path: SQLite archive for closed orders (None = drop them)
+            max_order_age: Seconds after which an open order is cancelled
+            max_closed: Closed orders kept in memory for lookups
+            spill_batch: Closed orders written to the archive at once
+        """
+        self.path = path
+        self.max_order_age = max_order_age
+        self.max_closed = max(0, max_closed)
+        self.spill_batch = max(1, spill_batch)
+        self.archived = 0
+        self.expired = 0
+        self._orders: dict[int, Order] = {}
+        self._by_mint: dict[str, set[int]] = {}
+        self._by_status: dict[OrderStatus, set[int]] = {status: set() for status in OrderStatus}
+        self._by_side: dict[str, set[int]] = {}
+        self._expiry: list[tuple[float, int]] = []
+        self._expires_at: dict[int, float] = {}  # Open order id -> expiry time
+        self._closed: deque[int] = deque()  # Closed ids in memory, oldest first
+        self._db: Optional[sqlite3.Connection] = None
+        start = 1
+        if path and os.path.exists(path):
+            try:
+                start += self._connect().execute("SELECT COALESCE(MAX(order_id), 0) FROM orders").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read order archive {path}: {e}")
+        self._ids = itertools.count(start)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+        return self._db
+
+    def __len__(self) -> int:
+        """Orders in memory, open and recently closed."""
+        return len(self._orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self._orders
+
+    def create(
+        self,
+        token_address: str,
+        order_type: OrderType,
+        side: str,
+        size: float,
+        price: float,
+        ttl: Optional[float] = None,
+        **values,
+    ) -> Order:
+        """Create, index and return a new order with the next id.
+
+        Args:
+            ttl: Seconds until the order expires if still open
+                (default ``max_order_age``)
+            **values: Further Order fields
+        """
+        now = time.time()
+        order = Order(
+            next(self._ids), token_address, order_type, side, size, price,
+            created_at=now, updated_at=now, **values,
+        )
+        self.add(order, ttl)
+        return order
+
+    def add(self, order: Order, ttl: Optional[float] = None) -> None:
+        """Index an order created elsewhere."""
+        order_id = order.order_id
+        if order_id in self._orders:
+            raise ValueError(f"Order {order_id} already exists")
+        self._orders[order_id] = order
+        self._by_mint.setdefault(order.token_address, set()).add(order_id)
+        self._by_status[order.status].add(order_id)
+        self._by_side.setdefault(order.side, set()).add(order_id)
+        if order.is_open:
+            ttl = self.max_order_age if ttl is None else ttl
+            expires_at = (order.created_at or time.time()) + ttl
+            self._expires_at[order_id] = expires_at
+            heapq.heappush(self._expiry, (expires_at, order_id))
+        else:
+            self._close(order_id)
+
+    def get(self, order_id: int) -> Optional[Order]:
+        """Order by id, from memory or the archive."""
+        order = self._orders.get(order_id)
+        if order is not None or not self.path:
+            return order
+        try:
+            row = self._connect().execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM orders WHERE order_id = ?", (order_id,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Order archive lookup failed: {e}")
+            return None
+        return _from_row(row) if row else None
+
+    def set_status(self, order: Order, status: OrderStatus) -> None:
+        """Change an order's status, keeping the indexes in step."""
+        previous = order.status
+        if previous not in OPEN_STATUSES and status != previous:
+            logger.debug("Order %d is already %s", order.order_id, previous.value)
+            return  # Closed is final
+        order.status = status
+        order.updated_at = time.time()
+        if previous == status or order.order_id not in self._orders:
+            return
+        self._by_status[previous].discard(order.order_id)
+        self._by_status[status].add(order.order_id)
+        if previous in OPEN_STATUSES and status not in OPEN_STATUSES:
+            self._close(order.order_id)
+
+    def find(
+        self,
+        mint: Optional[str] = None,
+        status: Optional[OrderStatus] = None,
+        side: Optional[str] = None,
+    ) -> list[Order]:
+        """In-memory orders matching every given criterion, oldest first."""
+        sets = []
+        if mint is not None:
+            sets.append(self._by_mint.get(mint, set()))
+        if status is not None:
+            sets.append(self._by_status[status])
+        if side is not None:
+            sets.append(self._by_side.get(side, set()))
+        if not sets:
+            return list(self._orders.values())
+        sets.sort(key=len)
+        ids = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+        return [self._orders[order_id] for order_id in sorted(ids)]
+
+    def open_orders(self, mint: Optional[str] = None) -> list[Order]:
+        """Pending and partially filled orders, optionally of one mint."""
+        return [order for status in OPEN_STATUSES for order in self.find(mint, status)]
+
+    def count(self, status: OrderStatus) -> int:
+        """In-memory orders with a status."""
+        return len(self._by_status[status])
+
+    def expire(self, now: Optional[float] = None) -> list[Order]:
+        """Cancel open orders past their expiry time and return them."""
+        now = time.time() if now is None else now
+        expired = []
+        while self._expiry and self._expiry[0][0] <= now:
+            _, order_id = heapq.heappop(self._expiry)
+            order = self._orders.get(order_id)
+            if order is not None and order_id in self._expires_at:  # Skip entries of closed orders
+                self.set_status(order, OrderStatus.CANCELLED)
+                expired.append(order)
+        self.expired += len(expired)
+        return expired
+
+    def _close(self, order_id: int) -> None:
+        self._expires_at.pop(order_id, None)
+        if len(self._expiry) > 2 * len(self._expires_at) + 1024:
+            # Mostly entries of orders closed before expiring: rebuild from the open ones
+            self._expiry = [(expires_at, open_id) for open_id, expires_at in self._expires_at.items()]
+            heapq.heapify(self._expiry)
+        self._closed.append(order_id)
+        if len(self._closed) >= self.max_closed + self.spill_batch:
+            self._spill(len(self._closed) - self.max_closed)
+
+    def _spill(self, count: int) -> None:
+        """Move the oldest ``count`` closed orders from memory to the archive."""
+        orders = [self._orders[self._closed[i]] for i in range(count)]
+        if self.path:
+            try:
+                with self._connect() as db:
+                    db.executemany(_INSERT, [_to_row(order) for order in orders])
+            except sqlite3.Error as e:
+                logger.warning(f"Could not archive {count} orders to {self.path}: {e}")
+                return  # Keep them in memory and retry on the next spill
+        for order in orders:
+            self._closed.popleft()
+            self._forget(order)
+        self.archived += count
+
+    def _forget(self, order: Order) -> None:
+        order_id = order.order_id
+        del self._orders[order_id]
+        self._by_status[order.status].discard(order_id)
+        for index, key in ((self._by_mint, order.token_address), (self._by_side, order.side)):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(order_id)
+                if not ids:
+                    del index[key]
+
+    def close(self) -> None:
+        """Archive every order still in memory, open ones included, and close the archive."""
+        if self.path and self._orders:
+            try:
+                with self._connect() as db:
+                    db.executemany(_INSERT, [_to_row(order) for order in self._orders.values()])
+            except sqlite3.Error as e:
+                logger.warning(f"Could not archive {len(self._orders)} orders to {self.path}: {e}")
+        if self._db is not None:
+            self._db.close()
+            self._db = None
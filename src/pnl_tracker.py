@@ -0,0 +1,103 @@
+"""Incremental PnL Aggregates.
+
+Running totals maintained as trades are recorded:
+- Overall invested / returned / PnL in O(1) per update
+- Per-token rollups
+- Per-day rollups
+- Win / loss / open trade counts
+- Plain-tuple state, so a journal snapshot can carry the aggregates
+"""
+
+from dataclasses import astuple, dataclass, field
+
+
+@dataclass
+class PnLTotals:
+    """Aggregated PnL for a set of trades."""
+    invested: float = 0.0
+    returned: float = 0.0
+    trades: int = 0
+    settled: int = 0  # Trades with a return filled in
+    wins: int = 0
+    losses: int = 0
+
+    @property
+    def pnl(self) -> float:
+        """Returned minus invested, in SOL."""
+        return self.returned - self.invested
+
+    @property
+    def pnl_pct(self) -> float:
+        """PnL as a percentage of invested."""
+        return (self.pnl / self.invested * 100) if self.invested else 0
+
+    @property
+    def open(self) -> int:
+        """Trades still waiting for a return."""
+        return self.trades - self.settled
+
+    def _add(self, amount: float, ret) -> None:
+        self.invested += amount
+        self.trades += 1
+        self._settle(amount, ret, 1)
+
+    def _settle(self, amount: float, ret, sign: int) -> None:
+        if ret is None:
+            return
+        self.returned += sign * ret
+        self.settled += sign
+        if ret > amount:
+            self.wins += sign
+        elif ret < amount:
+            self.losses += sign
+
+
+@dataclass
+class PnLTracker:
+    """Overall, per-token and per-day PnL, updated incrementally."""
+    totals: PnLTotals = field(default_factory=PnLTotals)
+    by_token: dict[str, PnLTotals] = field(default_factory=dict)
+    by_day: dict[str, PnLTotals] = field(default_factory=dict)
+
+    def _buckets(self, trade: dict) -> tuple[PnLTotals, PnLTotals, PnLTotals]:
+        token = self.by_token.get(trade["token"])
+        if token is None:
+            token = self.by_token[trade["token"]] = PnLTotals()
+        day_key = trade["date"][:10]
+        day = self.by_day.get(day_key)
+        if day is None:
+            day = self.by_day[day_key] = PnLTotals()
+        return self.totals, token, day
+
+    def add_trade(self, trade: dict) -> None:
+        """Account for a newly recorded trade."""
+        for bucket in self._buckets(trade):
+            bucket._add(trade["amount"], trade.get("return"))
+
+    def update_return(self, trade: dict, old_return) -> None:
+        """Account for a trade's return changing from ``old_return``."""
+        for bucket in self._buckets(trade):
+            bucket._settle(trade["amount"], old_return, -1)
+            bucket._settle(trade["amount"], trade.get("return"), 1)
+
+    def state(self) -> dict:
+        """Aggregates as plain tuples and dicts (marshal-friendly)."""
+        return {
+            "totals": astuple(self.totals),
+            "by_token": {token: astuple(totals) for token, totals in self.by_token.items()},
+            "by_day": {day: astuple(totals) for day, totals in self.by_day.items()},
+        }
+
+    def restore(self, state: dict) -> None:
+        """Replace the aggregates with what ``state`` produced."""
+        self.totals = PnLTotals(*state["totals"])
+        self.by_token = {token: PnLTotals(*values) for token, values in state["by_token"].items()}
+        self.by_day = {day: PnLTotals(*values) for day, values in state["by_day"].items()}
+
+    def rebuild(self, trades: list[dict]) -> None:
+        """Recompute everything from scratch, e.g. after a journal replay."""
+        self.totals = PnLTotals()
+        self.by_token.clear()
+        self.by_day.clear()
+        for trade in trades:
+            self.add_trade(trade)
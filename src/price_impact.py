@@ -0,0 +1,342 @@
+"""AMM Price Impact Model.
+
+Slippage from pool state instead of a rule of thumb:
+- Constant-product and concentrated-liquidity pools share one model:
+  sorted sqrt-price ranges, each with its own liquidity
+- Orders split across a mint's pools by equalizing their marginal
+  prices, found by a bracketing root search, so no pool is pushed past the others
+- Per-pool state cache: only stale pools are re-read, and our own fills
+  move the cached prices without a round trip
+"""
+
+import bisect
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger("SignalForge.PriceImpact")
+
+_INF = float("inf")
+
+
+class Pool:
+    """One AMM pool of a token against SOL.
+
+    Prices are SOL per token. Liquidity sits in sorted, non-overlapping
+    sqrt-price ranges; a constant-product pool is one unbounded range.
+    """
+
+    __slots__ = ("pool_id", "mint", "fee", "sqrt_price", "lowers", "uppers", "liquidity", "updated_at")
+
+    def __init__(
+        self,
+        pool_id: str,
+        mint: str,
+        sqrt_price: float,
+        ranges: list[tuple[float, float, float]],
+        fee: float = 0.0025,
+    ):
+        """
+        Args:
+            pool_id: Pool account address
+            mint: Token traded against SOL
+            sqrt_price: Square root of the current price
+            ranges: (lower sqrt price, upper sqrt price, liquidity) per range
+            fee: Swap fee taken from the input (0.0025 = 0.25%)
+        """
+        ranges = sorted(r for r in ranges if r[2] > 0 and r[1] > r[0])
+        self.pool_id = pool_id
+        self.mint = mint
+        self.fee = fee
+        self.sqrt_price = sqrt_price
+        self.lowers = [r[0] for r in ranges]
+        self.uppers = [r[1] for r in ranges]
+        self.liquidity = [r[2] for r in ranges]
+        self.updated_at = time.time()
+
+    @classmethod
+    def constant_product(
+        cls,
+        pool_id: str,
+        mint: str,
+        token_reserve: float,
+        sol_reserve: float,
+        fee: float = 0.0025,
+    ) -> "Pool":
+        """x * y = k pool from its reserves."""
+        return cls(
+            pool_id, mint, math.sqrt(sol_reserve / token_reserve),
+            [(0.0, _INF, math.sqrt(token_reserve * sol_reserve))], fee,
+        )
+
+    @property
+    def price(self) -> float:
+        """Current SOL per token, before fees."""
+        return self.sqrt_price * self.sqrt_price
+
+    def marginal_price(self, buy: bool) -> float:
+        """Fee-inclusive price of the next unit: SOL paid per token bought, or received per token sold."""
+        return self.price / (1 - self.fee) if buy else self.price * (1 - self.fee)
+
+    def _move(self, target: float, buy: bool, budget: float = _INF) -> tuple[float, float, float]:
+        """Walk the price toward sqrt price ``target`` until ``budget`` (input after fees) is spent.
+
+        Returns:
+            tuple: (input after fees, output, sqrt price reached)
+        """
+        s = self.sqrt_price
+        lowers, uppers, liquidity = self.lowers, self.uppers, self.liquidity
+        spent = out = 0.0
+        if buy:  # SOL in, tokens out, price rises
+            i = bisect.bisect_right(lowers, s) - 1
+            if i < 0:
+                i = 0
+            while s < target and spent < budget and i < len(lowers):
+                if s < lowers[i]:  # No liquidity below the next range: the price jumps
+                    s = min(lowers[i], target)
+                    continue
+                if s >= uppers[i]:
+                    i += 1
+                    continue
+                L = liquidity[i]
+                b = min(uppers[i], target)
+                need = L * (b - s)
+                if spent + need > budget:
+                    b = s + (budget - spent) / L
+                    need = budget - spent
+                spent += need
+                out += L * (1 / s - 1 / b)
+                s = b
+        else:  # Tokens in, SOL out, price falls
+            i = bisect.bisect_left(uppers, s)
+            if i == len(uppers):
+                i -= 1
+            while s > target and spent < budget and i >= 0:
+                if s > uppers[i]:
+                    s = max(uppers[i], target)
+                    continue
+                if s <= lowers[i]:
+                    i -= 1
+                    continue
+                L = liquidity[i]
+                b = max(lowers[i], target)
+                need = L * (1 / b - 1 / s) if b > 0 else _INF
+                if spent + need > budget:
+                    b = 1 / (1 / s + (budget - spent) / L)
+                    need = budget - spent
+                spent += need
+                out += L * (s - b)
+                s = b
+        return spent, out, s
+
+    def input_to(self, sqrt_target: float, buy: bool) -> float:
+        """Input, fees included, that moves the price to ``sqrt_target`` (SOL when buying, tokens when selling)."""
+        if (sqrt_target <= self.sqrt_price) if buy else (sqrt_target >= self.sqrt_price):
+            return 0.0
+        return self._move(sqrt_target, buy)[0] / (1 - self.fee)
+
+    def quote(self, amount_in: float, buy: bool) -> float:
+        """Output of swapping ``amount_in``, leaving the pool as it is."""
+        return self._move(_INF if buy else 0.0, buy, amount_in * (1 - self.fee))[1]
+
+    def swap(self, amount_in: float, buy: bool) -> float:
+        """Swap ``amount_in`` and move the pool price, as our own fill does on chain."""
+        _, out, self.sqrt_price = self._move(_INF if buy else 0.0, buy, amount_in * (1 - self.fee))
+        self.updated_at = time.time()
+        return out
+
+
+@dataclass
+class Split:
+    """An order split across pools."""
+    legs: list[tuple[Pool, float, float]]  # (pool, input, output) per used pool
+    buy: bool
+    amount_in: float  # SOL when buying, tokens when selling
+    amount_out: float
+    spot: float  # Best pool price before the trade, SOL per token
+
+    @property
+    def price(self) -> float:
+        """Average SOL per token, fees included."""
+        sol, tokens = (self.amount_in, self.amount_out) if self.buy else (self.amount_out, self.amount_in)
+        return sol / tokens if tokens > 0 else _INF
+
+    @property
+    def slippage(self) -> float:
+        """Cost against the spot price, fees included (0.01 = 1%)."""
+        if self.amount_in <= 0 or self.spot <= 0:
+            return 0.0
+        if self.amount_out <= 0:
+            return 1.0
+        return self.price / self.spot - 1 if self.buy else 1 - self.price / self.spot
+
+
+def split_order(
+    pools: list[Pool],
+    amount_in: float,
+    buy: bool,
+    tolerance: float = 1e-4,
+    max_iterations: int = 60,
+) -> Split:
+    """Cheapest split of an order across pools.
+
+    Raises the marginal price every pool is pushed to until their inputs
+    add up to the order: past that point each extra unit costs the same
+    everywhere, so no other split fills for less.
+
+    Args:
+        pools: Pools of one mint
+        amount_in: SOL to spend when buying, tokens to sell when selling
+        buy: True to buy the token with SOL
+        tolerance: Relative error allowed on the total input
+        max_iterations: Bisection steps at most
+
+    Returns:
+        Split: Legs per pool; ``amount_in`` is smaller than asked only
+            if the pools cannot absorb the whole order
+    """
+    pools = [pool for pool in pools if pool.sqrt_price > 0 and pool.liquidity]
+    if not pools or amount_in <= 0:
+        return Split([], buy, 0.0, 0.0, 0.0)
+    spot = min(pool.price for pool in pools) if buy else max(pool.price for pool in pools)
+    if len(pools) == 1:
+        pool = pools[0]
+        out = pool.quote(amount_in, buy)
+        return Split([(pool, amount_in, out)], buy, amount_in, out, spot)
+
+    fees = [1 - pool.fee for pool in pools]
+    base = min(pool.marginal_price(buy) for pool in pools) if buy else max(pool.marginal_price(buy) for pool in pools)
+
+    def excess(log_level: float) -> tuple[float, list[float]]:
+        # Inputs that bring every pool to marginal price base * level (buying)
+        # or base / level (selling), and how far their sum overshoots the order
+        level = math.exp(log_level)
+        price = base * level if buy else base / level
+        amounts = [
+            pool.input_to(math.sqrt(price * fee if buy else price / fee), buy)
+            for pool, fee in zip(pools, fees)
+        ]
+        return sum(amounts) - amount_in, amounts
+
+    # Bracket the order, then search the log marginal price level by false
+    # position with the Illinois step, which keeps the bracket like bisection
+    # but converges in a handful of pool evaluations
+    lo, f_lo = 0.0, -amount_in
+    hi = math.log(2)
+    f_hi, amounts = excess(hi)
+    while f_hi < 0 and hi < 28:  # Up to a 1e12x price move
+        lo, f_lo = hi, f_hi
+        hi *= 2
+        f_hi, amounts = excess(hi)
+    if f_hi >= 0:  # Else every pool is drained: take all they hold
+        over, w_lo, w_hi, last = f_hi, f_lo, f_hi, 0
+        for _ in range(max_iterations):
+            if over <= tolerance * amount_in or hi - lo <= 1e-12:
+                break
+            x = hi - w_hi * (hi - lo) / (w_hi - w_lo)
+            f, trial = excess(x)
+            if f >= 0:
+                hi, w_hi, over, amounts = x, f, f, trial
+                if last > 0:
+                    w_lo /= 2
+                last = 1
+            else:
+                lo, w_lo = x, f
+                if last < 0:
+                    w_hi /= 2
+                last = -1
+    total = sum(amounts)
+    scale = min(1.0, amount_in / total) if total > 0 else 0.0
+    legs = []
+    for pool, amount in zip(pools, amounts):
+        if amount > 0:
+            amount *= scale
+            legs.append((pool, amount, pool.quote(amount, buy)))
+    return Split(legs, buy, sum(leg[1] for leg in legs), sum(leg[2] for leg in legs), spot)
+
+
+def estimate_slippage(size: float, liquidity: float, side: str = "BUY", fee: float = 0.0) -> float:
+    """Slippage of trading ``size`` SOL against one constant-product pool.
+
+    Args:
+        size: Order size in SOL
+        liquidity: Pool value in SOL, half of it on each side
+        side: BUY or SELL
+        fee: Pool fee counted into the cost
+
+    Returns:
+        float: Slippage as a fraction (1.0 if there is no liquidity)
+    """
+    if size <= 0:
+        return 0.0
+    if liquidity <= 0:
+        return 1.0
+    pool = Pool.constant_product("", "", liquidity / 2, liquidity / 2, fee)  # Price 1 SOL per token
+    return split_order([pool], size, side == "BUY").slippage
+
+
+# Reads the current state of the given pool ids
+PoolFetcher = Callable[[list[str]], Awaitable[list[Pool]]]
+
+
+class PoolCache:
+    """Pool states by id and by mint, re-read only when stale."""
+
+    def __init__(self, fetch: Optional[PoolFetcher] = None, max_age: float = 2.0):
+        """
+        Args:
+            fetch: Reads pool states from chain (None = only ``put`` updates them)
+            max_age: Seconds a pool state is used before it is re-read
+        """
+        self.fetch = fetch
+        self.max_age = max_age
+        self.refreshes = 0
+        self._pools: dict[str, Pool] = {}
+        self._by_mint: dict[str, dict[str, Pool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def put(self, pool: Pool) -> None:
+        """Add a pool or replace its state."""
+        previous = self._pools.get(pool.pool_id)
+        if previous is not None and previous.mint != pool.mint:
+            self._by_mint[previous.mint].pop(pool.pool_id, None)
+        self._pools[pool.pool_id] = pool
+        self._by_mint.setdefault(pool.mint, {})[pool.pool_id] = pool
+
+    def get(self, pool_id: str) -> Optional[Pool]:
+        """Cached pool by id."""
+        return self._pools.get(pool_id)
+
+    def pools(self, mint: str) -> list[Pool]:
+        """Cached pools of a mint, fresh or not."""
+        return list(self._by_mint.get(mint, {}).values())
+
+    def stale(self, mint: str, now: Optional[float] = None) -> list[str]:
+        """Ids of the mint's pools due for a re-read."""
+        now = time.time() if now is None else now
+        return [pool.pool_id for pool in self.pools(mint) if now - pool.updated_at >= self.max_age]
+
+    async def refresh(self, mint: str) -> list[Pool]:
+        """Re-read the stale pools of a mint, then return all of its pools."""
+        pool_ids = self.stale(mint)
+        if pool_ids and self.fetch is not None:
+            try:
+                for pool in await self.fetch(pool_ids):
+                    self.put(pool)
+                self.refreshes += len(pool_ids)
+            except Exception as e:
+                logger.warning(f"Pool refresh failed for {mint}: {e}")  # Keep quoting from the last state
+        return self.pools(mint)
+
+    def split(self, mint: str, amount_in: float, buy: bool) -> Split:
+        """Cheapest split of an order over the cached pools of a mint."""
+        return split_order(self.pools(mint), amount_in, buy)
+
+    def apply(self, split: Split) -> None:
+        """Move the cached pools as a filled split moved them on chain."""
+        for pool, amount, _ in split.legs:
+            pool.swap(amount, split.buy)
@@ -0,0 +1,199 @@
+"""Stale-While-Revalidate Price Oracle.
+
+Serve a cached price instantly while keeping it fresh in the background:
+- Callers read memory, never the network (except on a cold start)
+- Background refresh loop plus on-demand revalidation when the TTL expires
+- Hedged requests across several sources, first good answer wins
+- Outlier rejection against the last accepted price and between sources;
+  without a fresh price to compare to, two sources must agree
+- Hard staleness bound after which no price is served
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger("SignalForge.PriceOracle")
+
+PriceSource = Callable[[], Awaitable[Optional[float]]]
+
+
+@dataclass
+class OracleStats:
+    """Refresh counters."""
+    refreshes: int = 0
+    failures: int = 0  # Refreshes that produced no acceptable price
+    outliers: int = 0  # Answers rejected as outliers
+    wins: dict[str, int] = field(default_factory=dict)  # Accepted answers per source
+
+
+class PriceOracle:
+    """Cached price kept fresh by hedged multi-source refreshes."""
+
+    def __init__(
+        self,
+        sources: list[tuple[str, PriceSource]],
+        ttl: float = 60.0,
+        max_staleness: float = 900.0,
+        hedge_delay: float = 0.25,
+        max_deviation: float = 0.10,
+        timeout: float = 5.0,
+        name: str = "price",
+    ):
+        """
+        Args:
+            sources: (name, coroutine function) pairs in order of preference
+            ttl: Age after which a read triggers a background refresh
+            max_staleness: Age after which the cached price is not served
+            hedge_delay: Delay before each further source is queried
+            max_deviation: Max relative distance from the reference price
+            timeout: Max seconds one refresh may take
+            name: Label for logs
+        """
+        if not sources:
+            raise ValueError("At least one price source is required")
+        self.sources = sources
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self.hedge_delay = hedge_delay
+        self.max_deviation = max_deviation
+        self.timeout = timeout
+        self.name = name
+        self.stats = OracleStats()
+        self.price = 0.0
+        self.updated_at: Optional[float] = None
+        self.source: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def age(self) -> float:
+        """Seconds since the cached price was accepted (inf if never)."""
+        if self.updated_at is None:
+            return float("inf")
+        return time.monotonic() - self.updated_at
+
+    @property
+    def is_stale(self) -> bool:
+        """True when the cached price is too old to be served."""
+        return self.age > self.max_staleness
+
+    def get(self) -> float:
+        """Return the cached price without waiting.
+
+        Triggers a background refresh once the TTL has expired. Returns 0
+        if there is no price or it is older than ``max_staleness``.
+        """
+        if self.age > self.ttl:
+            self.revalidate()
+        return 0.0 if self.is_stale else self.price
+
+    async def get_or_wait(self) -> float:
+        """Like get(), but on a cold start wait (bounded) for the first price."""
+        if self.updated_at is None:
+            self.revalidate()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._refresh_task), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                pass  # The shielded refresh keeps running
+        return self.get()
+
+    def revalidate(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh(), name=f"{self.name}-refresh")
+
+    def start(self) -> None:
+        """Refresh every ``ttl`` seconds in the background."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._refresh_loop(), name=f"{self.name}-oracle")
+
+    async def stop(self) -> None:
+        """Cancel the background loop and any in-flight refresh."""
+        for task in (self._loop_task, self._refresh_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._loop_task = self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            self.revalidate()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            await asyncio.sleep(self.ttl)
+
+    def _reference(self) -> Optional[float]:
+        return None if self.is_stale or not self.price else self.price
+
+    def _close(self, a: float, b: float) -> bool:
+        return abs(a / b - 1) <= self.max_deviation
+
+    async def _query(self, name: str, source: PriceSource, delay: float) -> tuple[str, Optional[float]]:
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            return name, await source()
+        except Exception as e:
+            logger.debug("%s source %s failed: %s", self.name, name, e)
+            return name, None
+
+    async def refresh(self) -> Optional[float]:
+        """Query sources with hedging and accept the first sane answer.
+
+        An answer is sane if it is close to the current price or, when there is
+        no fresh price (cold start, stale cache), if another source agrees with it.
+        """
+        self.stats.refreshes += 1
+        reference = self._reference()
+        pending = {
+            asyncio.create_task(self._query(name, source, i * self.hedge_delay))
+            for i, (name, source) in enumerate(self.sources)
+        }
+        outliers: list[tuple[str, float]] = []  # Unconfirmed answers
+        single = len(self.sources) == 1  # Nothing to cross-check against
+        deadline = time.monotonic() + self.timeout
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name, price = task.result()
+                    if not price or price <= 0:
+                        continue
+                    if single or (reference is not None and self._close(price, reference)):
+                        return self._accept(name, price)
+                    # No fresh price, or far from it: only believe it if another source agrees
+                    agreeing = [p for _, p in outliers if self._close(price, p)]
+                    if agreeing:
+                        return self._accept(name, (price + agreeing[0]) / 2)
+                    outliers.append((name, price))
+                    if reference is not None:
+                        self.stats.outliers += 1
+                        logger.warning(
+                            "%s outlier from %s: %.4f vs reference %.4f", self.name, name, price, reference
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self.stats.failures += 1
+        if reference is None and outliers:
+            logger.warning(
+                "%s refresh failed: no two sources agreed (%s)",
+                self.name, ", ".join(f"{name} {price:.4f}" for name, price in outliers),
+            )
+        logger.warning("%s refresh failed, serving price aged %.0fs", self.name, self.age)
+        return None
+
+    def _accept(self, source: str, price: float) -> float:
+        self.price = float(price)
+        self.updated_at = time.monotonic()
+        self.source = source
+        self.stats.wins[source] = self.stats.wins.get(source, 0) + 1
+        return self.price
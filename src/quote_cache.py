@@ -0,0 +1,144 @@
+"""Request-Coalescing Quote Cache.
+
+Share Jupiter quotes between concurrent callers:
+- Keyed by (mint, amount bucket, slippage) with a short TTL
+- Single-flight: concurrent misses for one key share one upstream request
+- Negative cache for mints with no route
+- Hit rate, coalesced calls and upstream latency counters
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+QuoteKey = tuple[str, int, int]
+
+
+@dataclass
+class QuoteCacheStats:
+    """Quote cache counters."""
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Callers that joined an in-flight request
+    upstream_calls: int = 0
+    upstream_errors: int = 0
+    upstream_latency_total: float = 0.0
+    upstream_latency_max: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without a new upstream call."""
+        total = self.hits + self.negative_hits + self.misses + self.coalesced
+        return (total - self.misses) / total if total else 0.0
+
+    @property
+    def avg_upstream_latency(self) -> float:
+        """Average upstream call latency in seconds."""
+        return self.upstream_latency_total / self.upstream_calls if self.upstream_calls else 0.0
+
+
+class QuoteCache:
+    """TTL cache of per-unit quote rates with single-flight fetches."""
+
+    def __init__(
+        self,
+        ttl: float = 3.0,
+        negative_ttl: float = 60.0,
+        precision: int = 2,
+        max_size: int = 10_000,
+    ):
+        """
+        Args:
+            ttl: Seconds a quote is reused
+            negative_ttl: Seconds a "no route" answer is remembered
+            precision: Significant digits of the amount that share one quote,
+                so buckets scale with the token's decimals
+            max_size: Max cached keys, least recently used evicted first
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.precision = max(1, precision)
+        self.max_size = max(1, max_size)
+        self.stats = QuoteCacheStats()
+        self._entries: OrderedDict[QuoteKey, tuple[float, Optional[float]]] = OrderedDict()
+        self._inflight: dict[QuoteKey, asyncio.Future] = {}
+
+    def bucket(self, amount: int) -> int:
+        """Representative amount for the bucket ``amount`` falls into."""
+        step = 10 ** max(0, len(str(max(1, amount))) - self.precision)
+        return max(1, round(amount / step)) * step
+
+    async def get(
+        self,
+        mint: str,
+        amount: int,
+        slippage_bps: int,
+        fetch: Callable[[int], Awaitable[Optional[float]]],
+    ) -> Optional[float]:
+        """Return the quoted output for ``amount`` of ``mint``.
+
+        Args:
+            fetch: Coroutine function quoting a raw amount. It returns the
+                output amount, None when there is no route (cached as a
+                negative), and raises on transport errors (not cached).
+        """
+        bucket_amount = self.bucket(amount)
+        key = (mint, bucket_amount, slippage_bps)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, rate = entry
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                if rate is None:
+                    self.stats.negative_hits += 1
+                    return None
+                self.stats.hits += 1
+                return rate * amount
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            rate = await asyncio.shield(inflight)
+            return None if rate is None else rate * amount
+
+        self.stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        started = time.perf_counter()
+        try:
+            out = await fetch(bucket_amount)
+            rate = None if out is None else out / bucket_amount
+            self._store(key, rate)
+            future.set_result(rate)
+            return None if rate is None else rate * amount
+        except BaseException as e:
+            self.stats.upstream_errors += 1
+            if isinstance(e, asyncio.CancelledError):
+                # Only the leader was cancelled: waiters get an ordinary error
+                # rather than a CancelledError that would unwind their tasks
+                e = RuntimeError(f"Quote request for {mint} was cancelled")
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stats.upstream_calls += 1
+            self.stats.upstream_latency_total += elapsed
+            self.stats.upstream_latency_max = max(self.stats.upstream_latency_max, elapsed)
+            del self._inflight[key]
+
+    def _store(self, key: QuoteKey, rate: Optional[float]) -> None:
+        ttl = self.negative_ttl if rate is None else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, rate)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,220 @@
+"""Per-Endpoint Resilience Guards.
+
+Keep upstream trouble from stalling the hot path:
+- Adaptive per-attempt timeout from the endpoint's observed p99 latency
+- Jittered retries that never exceed the caller's total latency budget
+- Circuit breaker that fails fast while an endpoint keeps failing
+- Per-endpoint counters and breaker state for /stats
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("SignalForge.Resilience")
+
+T = TypeVar("T")
+
+
+class CircuitState(Enum):
+    """Breaker state."""
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls fail immediately
+    HALF_OPEN = "half_open"  # One probe call decides whether to close
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+
+@dataclass
+class GuardStats:
+    """Per-endpoint counters."""
+    calls: int = 0
+    successes: int = 0
+    failures: int = 0  # Failed attempts, including timeouts
+    timeouts: int = 0
+    retries: int = 0
+    short_circuits: int = 0  # Calls rejected by an open breaker
+    trips: int = 0  # Times the breaker opened
+
+
+class EndpointGuard:
+    """Adaptive timeout, budgeted retries and a circuit breaker for one endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int = 3,
+        min_timeout: float = 0.5,
+        max_timeout: float = 10.0,
+        timeout_factor: float = 1.5,
+        backoff: float = 0.05,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        window: int = 200,
+    ):
+        """
+        Args:
+            name: Label for logs and /stats
+            max_attempts: Attempts per call, budget permitting
+            min_timeout / max_timeout: Bounds of the adaptive attempt timeout
+            timeout_factor: Attempt timeout as a multiple of the observed p99
+            backoff: Base of the jittered exponential backoff, seconds
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a probe
+            window: Recent successful latencies kept for the p99
+        """
+        self.name = name
+        self.max_attempts = max(1, max_attempts)
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_factor = timeout_factor
+        self.backoff = backoff
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.stats = GuardStats()
+        self.state = CircuitState.CLOSED
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def p99(self) -> Optional[float]:
+        """p99 of recent successful attempt latencies (None until 20 samples)."""
+        if len(self._latencies) < 20:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+
+    @property
+    def attempt_timeout(self) -> float:
+        """Per-attempt timeout derived from the observed p99."""
+        p99 = self.p99
+        if p99 is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, p99 * self.timeout_factor))
+
+    def _admit(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = CircuitState.HALF_OPEN
+            self._probing = False
+        if self.state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def _on_success(self, latency: float) -> None:
+        self.stats.successes += 1
+        self._latencies.append(latency)
+        self._consecutive_failures = 0
+        if self.state != CircuitState.CLOSED:
+            logger.info("Circuit for %s closed", self.name)
+        self.state = CircuitState.CLOSED
+        self._probing = False
+
+    def _on_failure(self) -> None:
+        self.stats.failures += 1
+        self._consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                self.stats.trips += 1
+                logger.warning(
+                    "Circuit for %s opened after %d failures", self.name, self._consecutive_failures
+                )
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    async def call(self, attempt: Callable[[float], Awaitable[T]], budget: float) -> T:
+        """Run ``attempt(timeout)`` with retries inside ``budget`` seconds.
+
+        ``attempt`` receives its own timeout and signals failure by raising.
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            Exception: The last attempt's error once attempts or budget run out
+        """
+        self.stats.calls += 1
+        deadline = time.monotonic() + budget
+        error: Optional[BaseException] = None
+        for number in range(self.max_attempts):
+            if not self._admit():
+                self.stats.short_circuits += 1
+                if error is not None:
+                    raise error
+                raise CircuitOpenError(f"{self.name}: circuit open")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if number:
+                self.stats.retries += 1
+            timeout = min(self.attempt_timeout, remaining)
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(attempt(timeout), timeout=timeout)
+            except asyncio.CancelledError:
+                self._probing = False
+                raise
+            except asyncio.TimeoutError as e:
+                self.stats.timeouts += 1
+                error = e
+            except Exception as e:
+                error = e
+            else:
+                self._on_success(time.monotonic() - started)
+                return result
+            self._on_failure()
+            # Full jitter, only if it leaves time for another attempt
+            delay = random.uniform(0, self.backoff * 2 ** number)
+            if time.monotonic() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+        if error is None:
+            error = asyncio.TimeoutError(f"{self.name}: latency budget {budget:.2f}s exhausted")
+        raise error
+
+
+_guards: dict[str, EndpointGuard] = {}
+
+
+def _env_number(name: str, default, cast=float):
+    try:
+        return cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def endpoint_key(url: str) -> str:
+    """Guard key for a URL: scheme, host and path, without the query."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def get_guard(url: str) -> EndpointGuard:
+    """Return the process-wide guard for the endpoint serving ``url``."""
+    key = endpoint_key(url)
+    guard = _guards.get(key)
+    if guard is None:
+        guard = _guards[key] = EndpointGuard(
+            key,
+            max_attempts=_env_number("UPSTREAM_MAX_ATTEMPTS", 3, int),
+            failure_threshold=_env_number("UPSTREAM_BREAKER_THRESHOLD", 5, int),
+            reset_timeout=_env_number("UPSTREAM_BREAKER_RESET_SEC", 30.0),
+        )
+    return guard
+
+
+def all_guards() -> list[EndpointGuard]:
+    """Every guard created so far."""
+    return list(_guards.values())
@@ -0,0 +1,161 @@
+"""Pooled Solana JSON-RPC Client.
+
+One long-lived RPC client for the whole bot:
+- Rides on the shared keep-alive HTTP pool
+- Multiple endpoints with latency-aware selection and failover
+- Per-request timeouts
+- JSON-RPC batch requests
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from endpoints import endpoint
+from http_client import get_http_client
+
+logger = logging.getLogger("SignalForge.RPC")
+
+
+class RpcError(Exception):
+    """Raised when an RPC call fails on every endpoint."""
+
+
+@dataclass
+class EndpointState:
+    """Health and latency of one RPC endpoint."""
+    url: str
+    latency: float = 0.0  # EWMA of successful call latency, seconds
+    failures: int = 0  # Consecutive failures
+    calls: int = 0
+
+    @property
+    def score(self) -> float:
+        """Lower is better: penalize recent failures, then prefer fast endpoints."""
+        return self.failures * 10.0 + self.latency
+
+
+class RpcPool:
+    """JSON-RPC client over a set of endpoints."""
+
+    def __init__(self, endpoints: list[str], timeout: float = 8.0):
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        self.endpoints = [EndpointState(url) for url in endpoints]
+        self.timeout = timeout
+        self._next_id = 0
+
+    def _ordered(self, prefer: Optional[str] = None) -> list[EndpointState]:
+        # Healthiest first, or ``prefer`` first when a caller needs the same node again
+        return sorted(self.endpoints, key=lambda e: (e.url != prefer, e.score))
+
+    def _record(self, endpoint: EndpointState, started: float, ok: bool) -> None:
+        endpoint.calls += 1
+        if ok:
+            elapsed = time.perf_counter() - started
+            endpoint.latency = elapsed if endpoint.calls == 1 else endpoint.latency * 0.8 + elapsed * 0.2
+            endpoint.failures = 0
+        else:
+            endpoint.failures += 1
+
+    async def _post(self, payload: Any, timeout: Optional[float], prefer: Optional[str] = None) -> tuple[Any, str]:
+        errors = []
+        for endpoint in self._ordered(prefer):
+            started = time.perf_counter()
+            try:
+                status, data = await get_http_client().post_json(
+                    endpoint.url, payload, timeout=timeout or self.timeout
+                )
+                if status == 200 and data is not None:
+                    self._record(endpoint, started, True)
+                    return data, endpoint.url
+                errors.append(f"{endpoint.url}: HTTP {status}")
+            except Exception as e:
+                errors.append(f"{endpoint.url}: {type(e).__name__} {e}")
+            self._record(endpoint, started, False)
+        raise RpcError("; ".join(errors))
+
+    def _request(self, method: str, params: Optional[list]) -> dict:
+        self._next_id += 1
+        return {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params or []}
+
+    async def call(self, method: str, params: Optional[list] = None, timeout: Optional[float] = None) -> Any:
+        """Call one RPC method and return its ``result``.
+
+        Raises:
+            RpcError: If every endpoint fails or the node returns an error
+        """
+        return (await self.call_via(method, params, timeout))[0]
+
+    async def call_via(
+        self,
+        method: str,
+        params: Optional[list] = None,
+        timeout: Optional[float] = None,
+        prefer: Optional[str] = None,
+    ) -> tuple[Any, str]:
+        """Call one RPC method, trying ``prefer`` first.
+
+        Returns:
+            (result, url of the endpoint that answered)
+
+        Raises:
+            RpcError: If every endpoint fails or the node returns an error
+        """
+        data, url = await self._post(self._request(method, params), timeout, prefer)
+        if "error" in data:
+            raise RpcError(f"{method}: {data['error']}")
+        return data.get("result"), url
+
+    async def batch(
+        self,
+        calls: list[tuple[str, Optional[list]]],
+        timeout: Optional[float] = None,
+        prefer: Optional[str] = None,
+    ) -> list[Any]:
+        """Send several calls in one JSON-RPC batch, to ``prefer`` first if given.
+
+        Returns:
+            Results in call order; failed calls are returned as RpcError
+            instances rather than raised
+        """
+        if not calls:
+            return []
+        requests = [self._request(method, params) for method, params in calls]
+        data, _ = await self._post(requests, timeout, prefer)
+        if not isinstance(data, list):
+            raise RpcError(f"Batch of {len(calls)} calls returned {data!r:.200}")
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        results = []
+        for request in requests:
+            item = by_id.get(request["id"])
+            if item is None:
+                results.append(RpcError(f"{request['method']}: missing from batch reply"))
+            elif "error" in item:
+                results.append(RpcError(f"{request['method']}: {item['error']}"))
+            else:
+                results.append(item.get("result"))
+        return results
+
+
+_pool: Optional[RpcPool] = None
+
+
+def rpc_endpoints_from_env() -> list[str]:
+    """Endpoints from SOLANA_RPC_URLS (comma separated) or SOLANA_RPC_URL."""
+    urls = os.getenv("SOLANA_RPC_URLS", "") or endpoint("SOLANA_RPC_URL")
+    return [url.strip() for url in urls.split(",") if url.strip()]
+
+
+def get_rpc_pool() -> RpcPool:
+    """Return the process-wide RPC pool."""
+    global _pool
+    if _pool is None:
+        try:
+            timeout = float(os.getenv("SOLANA_RPC_TIMEOUT", "8"))
+        except ValueError:
+            timeout = 8.0
+        _pool = RpcPool(rpc_endpoints_from_env(), timeout=timeout)
+    return _pool
@@ -0,0 +1,93 @@
+"""Encrypted Telegram Session Store.
+
+Warm restarts without a fresh Telegram login:
+- Telethon StringSession persisted between runs
+- Resolved channel entities (id + access hash) cached alongside it
+- Encrypted at rest with a key derived from SESSION_SECRET
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger("SignalForge.SessionStore")
+
+
+class SessionStore:
+    """Load and save the bot session and channel entity cache."""
+
+    def __init__(self, path: str, secret: str):
+        """
+        Args:
+            path: Encrypted session file
+            secret: Passphrase the encryption key is derived from; an empty
+                secret disables persistence rather than storing it in clear
+        """
+        self.path = path
+        self.enabled = bool(secret)
+        self._secret = secret
+
+    def _fernet(self):
+        from cryptography.fernet import Fernet
+
+        digest = hashlib.sha256(b"signalforge-session:" + self._secret.encode()).digest()
+        return Fernet(base64.urlsafe_b64encode(digest))
+
+    def load(self) -> tuple[str, dict]:
+        """Return (session string, entity cache); empty values if unavailable."""
+        if not self.enabled or not os.path.exists(self.path):
+            return "", {}
+        try:
+            with open(self.path, "rb") as f:
+                data = json.loads(self._fernet().decrypt(f.read()))
+            return data.get("session", ""), data.get("entities", {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable session file {self.path}: {e}")
+            return "", {}
+
+    def save(self, session: str, entities: dict) -> None:
+        """Encrypt and atomically write the session and entity cache."""
+        if not self.enabled:
+            return
+        try:
+            token = self._fernet().encrypt(json.dumps({"session": session, "entities": entities}).encode())
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(token)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save session to {self.path}: {e}")
+
+
+def entity_to_dict(input_peer) -> Optional[dict]:
+    """Serialize a Telethon input peer for the entity cache."""
+    from telethon.tl import types
+
+    if isinstance(input_peer, types.InputPeerChannel):
+        return {"type": "channel", "id": input_peer.channel_id, "access_hash": input_peer.access_hash}
+    if isinstance(input_peer, types.InputPeerChat):
+        return {"type": "chat", "id": input_peer.chat_id}
+    if isinstance(input_peer, types.InputPeerUser):
+        return {"type": "user", "id": input_peer.user_id, "access_hash": input_peer.access_hash}
+    return None
+
+
+def entity_from_dict(data: dict):
+    """Rebuild a Telethon input peer from the entity cache."""
+    from telethon.tl import types
+
+    kind = data.get("type")
+    if kind == "channel":
+        return types.InputPeerChannel(data["id"], data["access_hash"])
+    if kind == "chat":
+        return types.InputPeerChat(data["id"])
+    if kind == "user":
+        return types.InputPeerUser(data["id"], data["access_hash"])
+    return None
@@ -0,0 +1,77 @@
+"""Signal Deduplication Cache.
+
+Suppress repeated signals for the same mint:
+- Time-bounded window per mint
+- Size-bounded, oldest first-seen entries evicted first
+- Hit/miss counters for tuning the window
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+logger = logging.getLogger("SignalForge.SignalDedup")
+
+
+@dataclass
+class DedupStats:
+    """Dedup cache counters."""
+    hits: int = 0  # Duplicates suppressed
+    misses: int = 0  # New signals let through
+    evictions: int = 0  # Entries dropped by the size bound
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of signals that were duplicates."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SignalDedupCache:
+    """TTL cache of recently seen mints, kept in first-seen order."""
+
+    def __init__(self, window: float = 300.0, max_size: int = 10_000):
+        self.window = window
+        self.max_size = max(1, max_size)
+        self.stats = DedupStats()
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def check_and_mark(self, mint: str) -> bool:
+        """Record a signal for a mint.
+
+        Returns:
+            bool: True if the mint was already seen inside the window
+        """
+        now = time.monotonic()
+        seen_at = self._seen.get(mint)
+        if seen_at is not None and now - seen_at < self.window:
+            # No move_to_end: entries stay in first-seen order, so the
+            # expired ones are always at the cold end for _evict
+            self.stats.hits += 1
+            return True
+
+        # The window is measured from the first signal, so a mint that keeps
+        # being reposted is let through again once per window.
+        self._seen[mint] = now
+        self._seen.move_to_end(mint)
+        self.stats.misses += 1
+        self._evict(now)
+        return False
+
+    def unmark(self, mint: str) -> None:
+        """Forget a mint, so a repost inside the window is let through."""
+        self._seen.pop(mint, None)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries from the cold end, then enforce the size bound."""
+        while self._seen:
+            mint, seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.window and len(self._seen) <= self.max_size:
+                break
+            self._seen.popitem(last=False)
+            if now - seen_at < self.window:
+                self.stats.evictions += 1
@@ -0,0 +1,135 @@
+"""Bounded Signal Ingestion Queue.
+
+Decouples Telegram callbacks from trade processing:
+- Bounded asyncio queue with explicit backpressure
+- Drop policies (drop oldest, reject newest)
+- Configurable pool of concurrent workers
+- Queue depth and wait time counters
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger("SignalForge.SignalQueue")
+
+
+class DropPolicy(Enum):
+    """What to do with a new signal when the queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued signal
+    REJECT = "reject"  # Refuse the new signal
+
+
+@dataclass
+class QueueStats:
+    """Ingestion counters."""
+    enqueued: int = 0
+    processed: int = 0
+    failed: int = 0
+    dropped: int = 0  # Evicted by DROP_OLDEST
+    rejected: int = 0  # Refused by REJECT
+    max_depth: int = 0
+    total_wait: float = 0.0  # Seconds spent queued, summed over processed signals
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """Average queue wait in seconds."""
+        return self.total_wait / self.processed if self.processed else 0.0
+
+
+class SignalQueue:
+    """Bounded queue drained by a pool of workers."""
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        maxsize: int = 100,
+        workers: int = 4,
+        policy: DropPolicy = DropPolicy.DROP_OLDEST,
+        name: str = "signals",
+        on_drop: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Args:
+            on_drop: Called with each signal DROP_OLDEST evicts unprocessed
+        """
+        self.handler = handler
+        self.maxsize = max(1, maxsize)
+        self.worker_count = max(1, workers)
+        self.policy = policy
+        self.name = name
+        self.on_drop = on_drop
+        self.stats = QueueStats()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.maxsize)
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        """Number of signals waiting to be processed."""
+        return self._queue.qsize()
+
+    def submit(self, item: Any) -> bool:
+        """Enqueue a signal without blocking.
+
+        Returns:
+            bool: False if the signal was rejected
+        """
+        if self._queue.full():
+            if self.policy == DropPolicy.REJECT:
+                self.stats.rejected += 1
+                logger.warning("Queue %s full, rejecting signal", self.name)
+                return False
+            _, dropped = self._queue.get_nowait()
+            self._queue.task_done()
+            self.stats.dropped += 1
+            logger.warning("Queue %s full, dropped oldest signal", self.name)
+            if self.on_drop is not None:
+                self.on_drop(dropped)
+
+        self._queue.put_nowait((time.monotonic(), item))
+        self.stats.enqueued += 1
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+        return True
+
+    def start(self) -> None:
+        """Spawn the worker pool."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info("Queue %s started with %d workers", self.name, self.worker_count)
+
+    async def stop(self, drain_timeout: Optional[float] = 5.0) -> None:
+        """Stop workers, optionally letting queued signals finish first."""
+        if drain_timeout:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Queue %s not drained, %d signals discarded", self.name, self.depth)
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        while True:
+            enqueued_at, item = await self._queue.get()
+            wait = time.monotonic() - enqueued_at
+            try:
+                await self.handler(item)
+                self.stats.processed += 1
+                self.stats.total_wait += wait
+                self.stats.max_wait = max(self.stats.max_wait, wait)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.failed += 1
+                logger.error("Error processing signal in %s: %s", self.name, e, exc_info=True)
+            finally:
+                self._queue.task_done()
@@ -1,18 +1,37 @@
-import time
+import asyncio
+import base64
+import logging
+import os
 
 import base58
-import requests
-from solana.rpc.async_api import AsyncClient
-from solders.keypair import Keypair
-from solders.pubkey import Pubkey
-from solders.system_program import TransferParams, transfer
 
-SOLANA_RPC_URL = "https://api.mainnet-beta.solana.com"
-JUPITER_API = "https://quote-api.jup.ag/v4/quote"
+from endpoints import endpoint
+from http_client import get_http_client
+from price_oracle import PriceOracle
+from quote_cache import QuoteCache
+from rpc_pool import get_rpc_pool, rpc_endpoints_from_env
+from token_accounts import fetch_mint_metadata, scan_token_balances
+from token_metadata import TokenMetadataCache
+from tx_pipeline import get_tx_pipeline
 
-# Cache for SOL price
-_last_price = 0
-_last_fetch = 0
+SOLANA_RPC_URL = rpc_endpoints_from_env()[0]
+JUPITER_API = endpoint("JUPITER_QUOTE_URL")
+JUPITER_PRICE_API = endpoint("JUPITER_PRICE_URL")
+COINGECKO_API = endpoint("COINGECKO_API_URL")
+COINBASE_API = endpoint("COINBASE_API_URL")
+DEXSCREENER_API = endpoint("DEXSCREENER_API_URL")
+WSOL_MINT = "So11111111111111111111111111111111111111112"
+QUOTE_BUDGET = 3.0  # Seconds a signal may spend on its quote, retries included
+PRICE_BATCH_SIZE = 100  # Mints per multi-id price request
+PRICE_BATCH_CONCURRENCY = 4  # Price requests in flight at once
+DEFAULT_DECIMALS = 9  # Assumed when a mint's decimals cannot be read
+
+logger = logging.getLogger("SignalForge.Solana")
+
+token_metadata = TokenMetadataCache(
+    os.getenv("TOKEN_METADATA_PATH", "").strip()
+    or os.path.join(os.getenv("BOT_STATE_DIR", "state").strip() or "state", "token_metadata.db")
+)
 
 
 def initialize_wallet(private_key_str):
@@ -20,6 +39,9 @@ def initialize_wallet(private_key_str):
     if not private_key_str:
         return None
 
+    # solana/solders are imported on first use to keep bot startup fast
+    from solders.keypair import Keypair
+
     private_key_str = private_key_str.strip().strip('"\'').strip()
     try:
         if private_key_str.startswith("["):
@@ -37,113 +59,277 @@ def initialize_wallet(private_key_str):
 async def get_wallet_balance(pubkey):
     """Get SOL balance in SOL."""
     try:
-        async with AsyncClient(SOLANA_RPC_URL) as client:
-            if isinstance(pubkey, str):
-                pubkey = Pubkey.from_string(pubkey)
-            resp = await client.get_balance(pubkey)
-            return resp.value / 1e9 if resp.value else 0
+        result = await get_rpc_pool().call("getBalance", [str(pubkey)])
+        lamports = (result or {}).get("value", 0)
+        return lamports / 1e9 if lamports else 0
     except Exception as error:
         print(f"⚠️ Balance error: {error}")
         return 0
 
 
+async def _fetch_price_chunk(mints, semaphore):
+    async with semaphore:
+        status, data = await get_http_client().get_json(
+            JUPITER_PRICE_API, params={"ids": ",".join(mints)}, timeout=5
+        )
+    if status != 200 or not data:
+        raise RuntimeError(f"Jupiter price HTTP {status}")
+    prices = {}
+    for mint, entry in (data.get("data") or {}).items():
+        price = (entry or {}).get("price")
+        if price:
+            prices[mint] = float(price)
+        symbol = (entry or {}).get("mintSymbol")
+        if symbol:
+            token_metadata.update(mint, symbol=symbol)
+    return prices
+
+
+async def get_token_prices(mints, chunk_size=PRICE_BATCH_SIZE, concurrency=PRICE_BATCH_CONCURRENCY):
+    """Get USD prices for many mints with chunked multi-id Jupiter requests.
+
+    Returns:
+        dict: mint -> price; mints without a price are left out
+    """
+    unique = list(dict.fromkeys(mint for mint in mints if mint))
+    if not unique:
+        return {}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+    results = await asyncio.gather(
+        *(_fetch_price_chunk(chunk, semaphore) for chunk in chunks), return_exceptions=True
+    )
+    prices = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            print(f"⚠️ Token price batch error ({len(chunk)} mints): {result}")
+            continue
+        prices.update(result)
+    return prices
+
+
+async def value_token_balances(balances):
+    """Price token balances with one batched lookup.
+
+    Returns:
+        (tokens, total_usd): tokens as dicts, most valuable first
+    """
+    prices = await get_token_prices([balance.mint for balance in balances])
+
+    tokens = []
+    total_usd = 0
+
+    for balance in balances:
+        token_price = prices.get(balance.mint, 0)
+        tokens.append(
+            {
+                "symbol": token_metadata.symbol(balance.mint) or f"{balance.mint[:4]}…{balance.mint[-4:]}",
+                "balance": balance.ui_amount,
+                "address": balance.mint,
+                "price": token_price,
+            }
+        )
+        total_usd += balance.ui_amount * token_price
+
+    tokens.sort(key=lambda token: token["balance"] * token["price"], reverse=True)
+    return tokens, total_usd
+
+
 async def get_token_balances(wallet_address):
-    """Get token balances from Solscan."""
-    url = f"https://public-api.solscan.io/account/tokens?account={wallet_address}"
+    """Get token balances straight from the RPC, valued with one batched price lookup."""
     try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code != 200:
-            return [], 0
-
-        data = resp.json()
-        tokens = []
-        total_usd = 0
-
-        for token in data:
-            ui_amount = token.get("tokenAmount", {}).get("uiAmount", 0)
-            if ui_amount and ui_amount > 0:
-                token_price = token.get("tokenPrice", 0)
-                tokens.append(
-                    {
-                        "symbol": token.get("tokenSymbol", "Unknown"),
-                        "balance": ui_amount,
-                        "address": token.get("tokenAddress", ""),
-                        "price": token_price,
-                    }
-                )
-                total_usd += ui_amount * token_price
-
-        return tokens, total_usd
+        balances = await scan_token_balances(str(wallet_address), get_rpc_pool(), token_metadata)
+        return await value_token_balances(balances)
     except Exception as error:
         print(f"⚠️ Token balance error: {error}")
         return [], 0
 
 
-def get_sol_price():
-    """Get current SOL price from CoinGecko with caching."""
-    global _last_price, _last_fetch
-    now = time.time()
-    if now - _last_fetch < 60:
-        return _last_price
+async def _coingecko_sol_price():
+    url = f"{COINGECKO_API}/simple/price"
+    status, data = await get_http_client().get_json(
+        url, params={"ids": "solana", "vs_currencies": "usd"}, timeout=5
+    )
+    if status == 200 and data:
+        return data.get("solana", {}).get("usd")
+    return None
+
+
+async def _jupiter_sol_price():
+    status, data = await get_http_client().get_json(
+        JUPITER_PRICE_API, params={"ids": "SOL"}, timeout=5
+    )
+    if status == 200 and data:
+        return data.get("data", {}).get("SOL", {}).get("price")
+    return None
+
+
+async def _coinbase_sol_price():
+    status, data = await get_http_client().get_json(
+        f"{COINBASE_API}/prices/SOL-USD/spot", timeout=5
+    )
+    if status == 200 and data:
+        return float(data.get("data", {}).get("amount", 0))
+    return None
+
+
+async def fetch_market_volume(mints: list[str]) -> dict[str, float]:
+    """USD volume the market swapped in each mint over the last 5 minutes, all pairs summed."""
+    status, data = await get_http_client().get_json(f"{DEXSCREENER_API}/tokens/{','.join(mints)}", timeout=5)
+    if status != 200 or not isinstance(data, dict):
+        raise RuntimeError(f"DexScreener answered HTTP {status}")
+    wanted = set(mints)
+    volumes = dict.fromkeys(mints, 0.0)
+    for pair in data.get("pairs") or []:
+        if pair.get("chainId", "solana") != "solana":
+            continue
+        volume = float((pair.get("volume") or {}).get("m5") or 0)
+        for side in ("baseToken", "quoteToken"):
+            mint = (pair.get(side) or {}).get("address")
+            if mint in wanted:
+                volumes[mint] += volume
+    return volumes
 
+
+sol_price_oracle = PriceOracle(
+    [
+        ("coingecko", _coingecko_sol_price),
+        ("jupiter", _jupiter_sol_price),
+        ("coinbase", _coinbase_sol_price),
+    ],
+    ttl=60,
+    name="SOL/USD",
+)
+
+
+async def get_sol_price():
+    """Get current SOL price in USD from the cached oracle.
+
+    Only waits on the network before the first price is known; returns 0
+    if no sufficiently fresh price is available.
+    """
     try:
-        url = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            price = data.get("solana", {}).get("usd", 0)
-            if price:
-                _last_price = price
-                _last_fetch = now
-                return price
-
-        # fallback to Jupiter
-        jup = requests.get("https://price.jup.ag/v4/price?ids=SOL", timeout=10)
-        if jup.status_code == 200:
-            price = jup.json().get("data", {}).get("SOL", {}).get("price", 0)
-            if price:
-                _last_price = price
-                _last_fetch = now
-                return price
+        return await sol_price_oracle.get_or_wait()
     except Exception as error:
         print(f"⚠️ SOL price error: {error}")
+        return 0
+
 
-    return _last_price or 0
+# Quotes are shared for 3s; mints without a route are not re-asked for a minute
+quote_cache = QuoteCache(ttl=3.0, negative_ttl=60.0)
 
 
-def get_token_price(token_address, amount_sol=0.0215):
-    """Get token price in SOL via Jupiter."""
+async def _fetch_jupiter_quote(token_address, lamports, slippage_bps):
+    """Quote ``lamports`` of SOL into raw units of a token; None if no route."""
     params = {
-        "inputMint": token_address,
-        "outputMint": "So11111111111111111111111111111111111111112",
-        "amount": int(amount_sol * 1e9),
-        "slippageBps": 50,
+        "inputMint": WSOL_MINT,
+        "outputMint": token_address,
+        "amount": lamports,
+        "slippageBps": slippage_bps,
     }
+    status, data = await get_http_client().get_json(JUPITER_API, params=params, timeout=QUOTE_BUDGET)
+    if status == 200:
+        routes = (data or {}).get("data") or []
+        return float(routes[0]["outAmount"]) if routes else None
+    if status == 400 and "route" in str(data).lower():
+        return None
+    raise RuntimeError(f"Jupiter quote HTTP {status}")
+
+
+async def refresh_token_metadata(mints):
+    """Re-read mint accounts of ``mints`` into the metadata cache."""
+    await fetch_mint_metadata(get_rpc_pool(), list(mints), token_metadata)
+
+
+async def get_token_decimals(token_address):
+    """Decimals of a mint, from the metadata cache or the chain (DEFAULT_DECIMALS if unknown).
+
+    Disk reads run off the event loop; new mints are saved to disk by the
+    metadata cache's periodic flush.
+    """
+    decimals = token_metadata.decimals(token_address)
+    if decimals is None:
+        await token_metadata.load([token_address])
+        decimals = token_metadata.decimals(token_address)
+    if decimals is None:
+        try:
+            await refresh_token_metadata([token_address])
+            decimals = token_metadata.decimals(token_address)
+        except Exception as error:
+            logger.warning("Could not read decimals of %s: %s", token_address, error)
+    if decimals is None:
+        logger.warning("Decimals of %s unknown, assuming %d", token_address, DEFAULT_DECIMALS)
+        return DEFAULT_DECIMALS
+    return decimals
+
+
+async def get_token_price(token_address, amount_sol=0.0215, slippage_bps=50):
+    """Get the SOL price of one whole token when buying for ``amount_sol`` SOL via Jupiter (cached, coalesced)."""
+    lamports = int(amount_sol * 1e9)
     try:
-        resp = requests.get(JUPITER_API, params=params, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data.get("data") and len(data["data"]) > 0:
-                return float(data["data"][0]["outAmount"]) / 1e9
+        out = await quote_cache.get(
+            token_address,
+            lamports,
+            slippage_bps,
+            lambda bucket_amount: _fetch_jupiter_quote(token_address, bucket_amount, slippage_bps),
+        )
+        if not out:
+            return None
+        decimals = await get_token_decimals(token_address)
+        return amount_sol / (out / 10 ** decimals)
     except Exception as error:
         print(f"⚠️ Token price error: {error}")
 
     return None
 
 
+def transfer_builder(wallet, receiver, lamports, compute_unit_price=0, compute_unit_limit=200_000):
+    """Return a TxBuilder signing a SOL transfer with compute budget instructions."""
+    from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+    from solders.hash import Hash
+    from solders.message import Message
+    from solders.pubkey import Pubkey
+    from solders.system_program import TransferParams, transfer
+    from solders.transaction import Transaction
+
+    instructions = [set_compute_unit_limit(compute_unit_limit)]
+    if compute_unit_price:
+        instructions.append(set_compute_unit_price(compute_unit_price))
+    instructions.append(
+        transfer(
+            TransferParams(
+                from_pubkey=wallet.pubkey(),
+                to_pubkey=Pubkey.from_string(receiver),
+                lamports=lamports,
+            )
+        )
+    )
+
+    def build(blockhash):
+        recent = Hash.from_string(blockhash)
+        message = Message.new_with_blockhash(instructions, wallet.pubkey(), recent)
+        tx = Transaction([wallet], message, recent)
+        return str(tx.signatures[0]), base64.b64encode(bytes(tx)).decode()
+
+    return build
+
+
 async def send_sol(wallet, receiver, amount):
-    """Send SOL (simulated or real)."""
+    """Send SOL and wait for confirmation.
+
+    Returns:
+        (True, signature), (False, error), or (None, message) if it is not
+        confirmed yet but may still land
+    """
     try:
-        async with AsyncClient(SOLANA_RPC_URL):
-            _ix = transfer(
-                TransferParams(
-                    from_pubkey=wallet.pubkey(),
-                    to_pubkey=Pubkey.from_string(receiver),
-                    lamports=int(amount * 1e9),
-                )
-            )
-            # In real implementation, you'd sign and send.
-            # Here we simulate.
-            return True, "simulated_tx_hash"
+        pipeline = get_tx_pipeline()
+        build = transfer_builder(
+            wallet,
+            receiver,
+            int(amount * 1e9),
+            compute_unit_price=pipeline.compute_unit_price,
+            compute_unit_limit=pipeline.compute_unit_limit,
+        )
+        return await pipeline.submit(build)
     except Exception as error:
         return False, str(error)
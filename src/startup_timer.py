@@ -0,0 +1,40 @@
+"""Startup Timing.
+
+Break down how long the bot is blind to signals after a restart.
+"""
+
+import time
+from typing import Optional
+
+
+class StartupTimer:
+    """Record named startup phases and report their durations."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        """
+        Args:
+            started_at: perf_counter() value to measure from, e.g. taken
+                before the heavy imports of the entry module
+        """
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self._last = self.started_at
+        self.phases: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> float:
+        """Close the current phase and return its duration in seconds."""
+        now = time.perf_counter()
+        duration = now - self._last
+        self.phases.append((phase, duration))
+        self._last = now
+        return duration
+
+    @property
+    def total(self) -> float:
+        """Seconds from start to the last mark."""
+        return self._last - self.started_at
+
+    def report(self) -> str:
+        """One-line summary, e.g. ``imports 410ms | connect 820ms | total 1230ms``."""
+        parts = [f"{name} {duration * 1000:.0f}ms" for name, duration in self.phases]
+        parts.append(f"total {self.total * 1000:.0f}ms")
+        return " | ".join(parts)
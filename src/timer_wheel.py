@@ -0,0 +1,179 @@
+"""Hashed Timing Wheel.
+
+One shared clock for many short-lived timers:
+- O(1) cancel, schedule O(1) plus a heap push for a tick not yet occupied
+- Only occupied ticks are visited; empty ones are skipped, never stepped over
+- A single background task instead of one sleeping task per timer, asleep
+  until the earliest occupied tick
+- Lazy cancellation (cancelled timers are dropped when their slot comes up)
+- Firing lag percentiles for /stats and benchmarks
+"""
+
+import asyncio
+import heapq
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("SignalForge.TimerWheel")
+
+
+@dataclass
+class WheelStats:
+    """Timer counters."""
+    scheduled: int = 0
+    fired: int = 0
+    cancelled: int = 0
+    errors: int = 0  # Callbacks that raised
+    max_lag: float = 0.0  # Worst seconds between deadline and firing
+
+
+class Timer:
+    """Handle of one scheduled callback."""
+
+    __slots__ = ("deadline", "due_tick", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, due_tick: int, callback: Callable[..., Any], args: tuple):
+        self.deadline = deadline
+        self.due_tick = due_tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Prevent the callback from running (no-op once fired)."""
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Hashed wheel of ``slots`` buckets, each ``tick`` seconds wide."""
+
+    def __init__(self, tick: float = 0.01, slots: int = 512, window: int = 4096):
+        """
+        Args:
+            tick: Resolution in seconds; timers fire at most one tick late
+                (plus event loop delay)
+            slots: Buckets in the wheel; timers further out than
+                ``tick * slots`` wait for later revolutions
+            window: Recent firing lags kept for percentiles
+        """
+        self.tick = tick
+        self.slots: list[list[Timer]] = [[] for _ in range(max(1, slots))]
+        self.stats = WheelStats()
+        self._origin = time.monotonic()
+        self._cursor = 0  # Next tick to process
+        self._pending = 0
+        self._due: list[int] = []  # Heap of occupied ticks
+        self._due_ticks: set[int] = set()  # Same ticks, for O(1) membership
+        self._lags: deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        """Scheduled timers, including cancelled ones not yet dropped."""
+        return self._pending
+
+    def _tick_of(self, when: float) -> int:
+        return math.ceil((when - self._origin) / self.tick)
+
+    def call_at(self, deadline: float, callback: Callable[..., Any], *args) -> Timer:
+        """Run ``callback(*args)`` at monotonic time ``deadline``."""
+        if not self._pending:
+            # Nothing to walk through: skip the ticks that passed while idle
+            self._cursor = max(self._cursor, math.floor((time.monotonic() - self._origin) / self.tick))
+            self._due.clear()
+            self._due_ticks.clear()
+        tick = max(self._cursor, self._tick_of(deadline))
+        timer = Timer(deadline, tick, callback, args)
+        self.slots[tick % len(self.slots)].append(timer)
+        self._pending += 1
+        self.stats.scheduled += 1
+        if tick not in self._due_ticks:
+            self._due_ticks.add(tick)
+            heapq.heappush(self._due, tick)
+            if self._wakeup is not None and self._due[0] == tick:
+                self._wakeup.set()  # New earliest deadline: shorten the driver's sleep
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args) -> Timer:
+        """Run ``callback(*args)`` after ``delay`` seconds."""
+        return self.call_at(time.monotonic() + max(0.0, delay), callback, *args)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Fire every timer due by ``now``; returns how many fired."""
+        now = time.monotonic() if now is None else now
+        last = math.floor((now - self._origin) / self.tick)
+        fired = 0
+        due = self._due
+        while due and due[0] <= last:
+            tick = heapq.heappop(due)
+            self._due_ticks.discard(tick)
+            # Timers scheduled by callbacks land in later ticks
+            self._cursor = max(self._cursor, tick + 1)
+            index = tick % len(self.slots)
+            slot = self.slots[index]
+            if not slot:
+                continue
+            self.slots[index] = keep = []
+            for timer in slot:
+                if timer.cancelled:
+                    self._pending -= 1
+                    self.stats.cancelled += 1
+                elif timer.due_tick <= tick:
+                    self._pending -= 1
+                    self._fire(timer, now)
+                    fired += 1
+                else:
+                    keep.append(timer)  # Due in a later revolution
+        self._cursor = max(self._cursor, last + 1)
+        return fired
+
+    def _fire(self, timer: Timer, now: float) -> None:
+        lag = max(0.0, now - timer.deadline)
+        self._lags.append(lag)
+        self.stats.fired += 1
+        self.stats.max_lag = max(self.stats.max_lag, lag)
+        try:
+            timer.callback(*timer.args)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Timer callback failed: {e}", exc_info=True)
+
+    def lag_percentile(self, q: float) -> float:
+        """Percentile ``q`` (0..1) of recent firing lags, in seconds."""
+        if not self._lags:
+            return 0.0
+        ordered = sorted(self._lags)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def start(self) -> None:
+        """Drive the wheel from a background task."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="timer-wheel")
+
+    async def stop(self) -> None:
+        """Stop the background task; scheduled timers stay in the wheel."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            self._wakeup = None
+
+    async def _run(self) -> None:
+        while True:
+            self.advance()
+            self._wakeup.clear()
+            if not self._due:
+                await self._wakeup.wait()  # Idle: sleep until something is scheduled
+                continue
+            # Sleep until the earliest occupied tick, or until an earlier one is scheduled
+            delay = self._origin + self._due[0] * self.tick - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
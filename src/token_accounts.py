@@ -0,0 +1,180 @@
+"""RPC-Native Token Balance Scan.
+
+Read a wallet's SPL token holdings straight from the Solana RPC:
+- getTokenAccountsByOwner for Token and Token-2022 in one JSON-RPC batch
+- Zero-copy decoding of raw account data (struct.unpack_from over memoryview)
+- getMultipleAccounts, chunked and batched, only for mints not in the metadata cache
+- Works against any object with an RpcPool-compatible ``batch`` method
+"""
+
+import binascii
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from token_extractor import b58decode, b58encode
+from token_metadata import TokenMetadataCache
+
+logger = logging.getLogger("SignalForge.TokenAccounts")
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+TOKEN_PROGRAM_IDS = (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID)
+
+TOKEN_ACCOUNT_SIZE = 165
+MINT_ACCOUNT_SIZE = 82
+MAX_MULTIPLE_ACCOUNTS = 100  # RPC limit for getMultipleAccounts
+
+# Token account: mint (32) | owner (32) | amount (u64 LE) | ...
+_ACCOUNT_HEAD = struct.Struct("<32s32sQ")
+# Mint: mint authority (COption) | supply (u64 LE) | decimals (u8) | initialized | freeze authority (COption)
+_MINT = struct.Struct("<I32sQBBI32s")
+
+
+@dataclass
+class TokenBalance:
+    """A wallet's total balance of one mint."""
+    mint: str
+    amount: int  # Raw units
+    decimals: int
+
+    @property
+    def ui_amount(self) -> float:
+        """Balance in whole tokens."""
+        return self.amount / 10 ** self.decimals
+
+
+def _account_data(account: dict) -> Optional[memoryview]:
+    data = (account or {}).get("data")
+    if not data:
+        return None
+    return memoryview(binascii.a2b_base64(data[0]))
+
+
+def decode_token_account(account: dict) -> Optional[tuple[bytes, bytes, int]]:
+    """(mint, owner, amount) of one base64 token account, or None if malformed."""
+    buf = _account_data(account)
+    if buf is None or len(buf) < TOKEN_ACCOUNT_SIZE:
+        return None
+    return _ACCOUNT_HEAD.unpack_from(buf)
+
+
+def decode_token_accounts(accounts: Iterable[dict], owner: bytes) -> dict[bytes, int]:
+    """Sum raw balances per mint from base64 token account entries.
+
+    Args:
+        accounts: ``value`` entries of getTokenAccountsByOwner (base64 encoding)
+        owner: Raw 32-byte owner key; accounts owned by anyone else are skipped
+
+    Returns:
+        dict: raw mint key -> total raw amount, zero balances left out
+    """
+    totals: dict[bytes, int] = {}
+    unpack = _ACCOUNT_HEAD.unpack_from
+    for entry in accounts:
+        buf = _account_data(entry.get("account"))
+        if buf is None or len(buf) < TOKEN_ACCOUNT_SIZE:
+            continue
+        mint, account_owner, amount = unpack(buf)
+        if amount and account_owner == owner:
+            totals[mint] = totals.get(mint, 0) + amount
+    return totals
+
+
+def decode_mint(account: dict) -> Optional[dict]:
+    """Fields of a base64 mint account entry, or None if it is not a mint.
+
+    Returns:
+        dict: decimals, supply, mint_authority and freeze_authority
+        (authorities None when unset)
+    """
+    buf = _account_data(account)
+    if buf is None or len(buf) < MINT_ACCOUNT_SIZE:
+        return None
+    mint_tag, mint_authority, supply, decimals, initialized, freeze_tag, freeze_authority = _MINT.unpack_from(buf)
+    if not initialized:
+        return None
+    return {
+        "decimals": decimals,
+        "supply": supply,
+        "mint_authority": b58encode(mint_authority) if mint_tag else None,
+        "freeze_authority": b58encode(freeze_authority) if freeze_tag else None,
+    }
+
+
+async def fetch_mint_metadata(rpc: Any, mints: list[str], metadata: TokenMetadataCache) -> None:
+    """Read the mint accounts of ``mints`` and record them in ``metadata``."""
+    chunks = [mints[i:i + MAX_MULTIPLE_ACCOUNTS] for i in range(0, len(mints), MAX_MULTIPLE_ACCOUNTS)]
+    options = {"encoding": "base64", "dataSlice": {"offset": 0, "length": MINT_ACCOUNT_SIZE}}
+    results = await rpc.batch([("getMultipleAccounts", [chunk, options]) for chunk in chunks])
+    now = time.time()
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            logger.warning("Mint lookup for %d mints failed: %s", len(chunk), result)
+            continue
+        for mint, account in zip(chunk, (result or {}).get("value") or []):
+            fields = decode_mint(account)
+            if fields is not None:
+                metadata.update(mint, refreshed_at=now, **fields)
+
+
+async def scan_token_balances(
+    owner: str,
+    rpc: Any,
+    metadata: TokenMetadataCache,
+) -> list[TokenBalance]:
+    """Return every non-zero token balance of a wallet.
+
+    Args:
+        owner: Wallet address
+        rpc: RpcPool, or any stand-in with the same ``batch`` method
+        metadata: Decimals cache, filled in for newly seen mints
+
+    Raises:
+        RpcError: If neither token program could be queried
+    """
+    owner_key = b58decode(owner)
+    if owner_key is None or len(owner_key) != 32:
+        raise ValueError(f"Invalid owner address: {owner}")
+
+    options = {"encoding": "base64", "commitment": "confirmed"}
+    results = await rpc.batch([
+        ("getTokenAccountsByOwner", [owner, {"programId": program}, options])
+        for program in TOKEN_PROGRAM_IDS
+    ])
+
+    totals: dict[bytes, int] = {}
+    errors = []
+    for program, result in zip(TOKEN_PROGRAM_IDS, results):
+        if isinstance(result, Exception):
+            logger.warning("Token account scan for %s failed: %s", program, result)
+            errors.append(result)
+            continue
+        for mint, amount in decode_token_accounts((result or {}).get("value") or [], owner_key).items():
+            totals[mint] = totals.get(mint, 0) + amount
+    if len(errors) == len(TOKEN_PROGRAM_IDS):
+        raise errors[0]
+
+    amounts = {b58encode(mint): amount for mint, amount in totals.items()}
+    unknown = [mint for mint in amounts if metadata.decimals(mint) is None]
+    if unknown:
+        await metadata.load(unknown)
+        unknown = [mint for mint in unknown if metadata.decimals(mint) is None]
+    if unknown:
+        await fetch_mint_metadata(rpc, unknown, metadata)
+
+    return to_balances(amounts, metadata)
+
+
+def to_balances(amounts: dict[str, int], metadata: TokenMetadataCache) -> list[TokenBalance]:
+    """Build balances from mint -> raw amount, skipping mints of unknown decimals."""
+    balances = []
+    for mint, amount in amounts.items():
+        decimals = metadata.decimals(mint)
+        if decimals is None:
+            logger.warning("Skipping %s: decimals unknown", mint)
+            continue
+        balances.append(TokenBalance(mint, amount, decimals))
+    return balances
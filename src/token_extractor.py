@@ -0,0 +1,138 @@
+"""Token Address Extractor.
+
+Find the mint a signal message is actually calling:
+- Single regex pass over the message
+- Base58 decoding of every candidate to a 32-byte public key
+- Context ranking ("CA:" labels, pump.fun/dexscreener links, wallet/tx hints)
+- Batch API over many messages
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {char: index for index, char in enumerate(B58_ALPHABET)}
+
+_CANDIDATE_RE = re.compile(r"\b[1-9A-HJ-NP-Za-km-z]{32,44}\b")
+
+# Addresses that show up in messages but are never the token being called
+IGNORED_ADDRESSES = frozenset({
+    "11111111111111111111111111111111",  # System Program
+    "So11111111111111111111111111111111111111112",  # Wrapped SOL
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",  # SPL Token Program
+    "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb",  # Token-2022 Program
+    "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL",  # Associated Token Program
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY9NyK2Ar8HB1dsn",  # USDT
+})
+
+_CONTEXT_WINDOW = 40
+
+# (pattern matched against the text just before a candidate, score)
+_PREFIX_RULES = (
+    (re.compile(r"pump\.fun/(?:coin/)?$"), 4),
+    (re.compile(r"(?:birdeye\.so|solscan\.io|solana\.fm)/token/$"), 4),
+    (re.compile(r"gmgn\.ai/sol/token/$"), 4),
+    (re.compile(r"jup\.ag/swap/\w+-$"), 3),
+    (re.compile(r"dexscreener\.com/solana/$"), 2),
+    (re.compile(r"\b(?:ca|contract|mint|token|address)\b[^\w\n/]{0,4}$", re.IGNORECASE), 3),
+    (re.compile(r"/(?:tx|account|address)/$"), -4),
+    (re.compile(r"\b(?:wallet|dev|deployer|owner|tx|txn|signature|sig)\b[^\w\n/]{0,4}$", re.IGNORECASE), -3),
+)
+
+
+@dataclass
+class TokenCandidate:
+    """A decoded address found in a message."""
+    address: str
+    score: int
+    position: int  # Offset of the last occurrence in the message
+
+
+def b58decode(value: str) -> Optional[bytes]:
+    """Decode a base58 string, returning None on invalid characters."""
+    number = 0
+    index = _B58_INDEX
+    try:
+        for char in value:
+            number = number * 58 + index[char]
+    except KeyError:
+        return None
+    leading = len(value) - len(value.lstrip("1"))
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\x00" * leading + body
+
+
+def b58encode(data: bytes) -> str:
+    """Encode bytes as base58."""
+    number = int.from_bytes(data, "big")
+    out = []
+    while number:
+        number, rem = divmod(number, 58)
+        out.append(B58_ALPHABET[rem])
+    leading = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading + "".join(reversed(out))
+
+
+def is_valid_pubkey(value: str) -> bool:
+    """Check that a string decodes to exactly 32 bytes."""
+    decoded = b58decode(value)
+    return decoded is not None and len(decoded) == 32
+
+
+def _score_context(text: str, start: int, end: int, address: str) -> int:
+    prefix = text[max(0, start - _CONTEXT_WINDOW):start]
+    score = 0
+    for pattern, weight in _PREFIX_RULES:
+        if pattern.search(prefix):
+            score += weight
+    if address.endswith("pump"):
+        score += 1  # pump.fun vanity suffix
+    if text[end:end + 1] == "/":
+        score -= 1  # Path segment, e.g. a pair page with more after it
+    return score
+
+
+def extract_candidates(text: str) -> list[TokenCandidate]:
+    """Return every valid pubkey in a message, best candidate first.
+
+    Ties are broken in favour of the later occurrence, which matches the
+    old "last match wins" behaviour for unlabelled messages.
+    """
+    found: dict[str, TokenCandidate] = {}
+    for match in _CANDIDATE_RE.finditer(text):
+        address = match.group()
+        if address in IGNORED_ADDRESSES:
+            continue
+        candidate = found.get(address)
+        if candidate is None:
+            if not is_valid_pubkey(address):
+                continue
+            score = _score_context(text, match.start(), match.end(), address)
+            found[address] = TokenCandidate(address, score, match.start())
+        else:
+            score = _score_context(text, match.start(), match.end(), address)
+            candidate.score = max(candidate.score, score) + 1  # Repeated mentions
+            candidate.position = match.start()
+
+    return sorted(found.values(), key=lambda c: (c.score, c.position), reverse=True)
+
+
+def extract_token_address(text: str) -> Optional[str]:
+    """Return the most likely token mint in a message.
+
+    Candidates whose context marks them as a wallet or transaction are
+    never returned, even if they are the only address in the message.
+    """
+    if not text:
+        return None
+    candidates = extract_candidates(text)
+    if candidates and candidates[0].score >= 0:
+        return candidates[0].address
+    return None
+
+
+def extract_batch(messages: Iterable[str]) -> list[Optional[str]]:
+    """Extract the best token address from each message."""
+    return [extract_token_address(message) for message in messages]
@@ -0,0 +1,301 @@
+"""Persistent Token Metadata Cache.
+
+Mint facts that rarely change, kept across runs:
+- SQLite file in the state directory, read and written only off the event loop
+- Decimals, symbol, supply, mint and freeze authority per mint
+- Bounded LRU in memory in front of the database, warmed at start; lookups
+  never touch the disk and unsaved entries are never evicted
+- Background refresh of the mutable fields (supply, authorities), changes
+  written by the periodic flush
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger("SignalForge.TokenMetadata")
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS mints (
+        mint TEXT PRIMARY KEY,
+        decimals INTEGER,
+        symbol TEXT,
+        supply INTEGER,
+        mint_authority TEXT,
+        freeze_authority TEXT,
+        refreshed_at REAL
+    )
+"""
+_COLUMNS = "mint, decimals, symbol, supply, mint_authority, freeze_authority, refreshed_at"
+_SELECT_MANY = "SELECT " + _COLUMNS + " FROM mints WHERE mint IN ({})"
+_SELECT_RECENT = "SELECT " + _COLUMNS + " FROM mints ORDER BY refreshed_at DESC LIMIT ?"
+_SQLITE_MAX_VARS = 500  # Mints per IN (...) query
+
+_MISSING = object()  # Memoized database miss
+
+
+@dataclass
+class TokenMetadata:
+    """What is known about one mint."""
+    decimals: Optional[int] = None
+    symbol: Optional[str] = None
+    supply: Optional[int] = None  # Raw units
+    mint_authority: Optional[str] = None  # None once minting is disabled
+    freeze_authority: Optional[str] = None  # None if accounts cannot be frozen
+    refreshed_at: Optional[float] = None  # Unix time of the last on-chain read
+
+
+_FIELDS = tuple(f.name for f in fields(TokenMetadata))
+
+
+def _upsert(columns: tuple[str, ...]) -> str:
+    """Insert a mint or overwrite only ``columns`` of its row."""
+    names = ", ".join(("mint", *columns))
+    values = ", ".join("?" * (len(columns) + 1))
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+    return f"INSERT INTO mints ({names}) VALUES ({values}) ON CONFLICT(mint) DO UPDATE SET {updates}"
+
+
+# Refreshes the on-chain fields of the given mints in the cache
+MetadataFetcher = Callable[[list[str]], Awaitable[None]]
+
+
+class TokenMetadataCache:
+    """Mint -> TokenMetadata, SQLite-backed with an in-memory LRU."""
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 4096,
+        refresh_age: float = 6 * 3600,
+        refresh_interval: float = 600.0,
+    ):
+        """
+        Args:
+            path: SQLite database file
+            max_entries: Mints kept in memory
+            refresh_age: Seconds after which supply and authorities are re-read
+            refresh_interval: Seconds between background refresh passes
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.refresh_age = refresh_age
+        self.refresh_interval = refresh_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()  # The connection is shared by worker threads
+        self._lru: OrderedDict[str, Any] = OrderedDict()
+        self._dirty: dict[str, set[str]] = {}  # mint -> fields changed since the last save
+        self._saving: dict[str, set[str]] = {}  # Being written right now
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+        return self._db
+
+    def _remember(self, mint: str, entry: Any) -> None:
+        self._lru[mint] = entry
+        self._lru.move_to_end(mint)
+        # Evict the least recently used, but never facts that are not on disk yet
+        for _ in range(len(self._lru) - self.max_entries):
+            oldest, oldest_entry = self._lru.popitem(last=False)
+            if oldest in self._dirty or oldest in self._saving:
+                self._lru[oldest] = oldest_entry
+
+    def _select(self, mints: Optional[list[str]]) -> list[tuple]:
+        """Rows of ``mints``, or of the most recently refreshed mints if None."""
+        with self._db_lock:
+            db = self._connect()
+            if mints is None:
+                return db.execute(_SELECT_RECENT, (self.max_entries,)).fetchall()
+            rows = []
+            for i in range(0, len(mints), _SQLITE_MAX_VARS):
+                chunk = mints[i:i + _SQLITE_MAX_VARS]
+                rows += db.execute(_SELECT_MANY.format(", ".join("?" * len(chunk))), chunk).fetchall()
+            return rows
+
+    def _merge(self, rows: list[tuple], missing: tuple[str, ...] = ()) -> None:
+        """Fill the cache from database rows; fields changed in memory win."""
+        for mint, *values in rows:
+            entry = self._lru.get(mint)
+            if not isinstance(entry, TokenMetadata):
+                self._remember(mint, TokenMetadata(*values))
+                continue
+            changed = self._dirty.get(mint, set()) | self._saving.get(mint, set())
+            for name, value in zip(_FIELDS, values):
+                if name not in changed:
+                    setattr(entry, name, value)
+        for mint in missing:
+            if mint not in self._lru:
+                self._remember(mint, _MISSING)
+
+    async def preload(self) -> None:
+        """Warm the cache with the most recently refreshed mints on disk."""
+        try:
+            rows = await asyncio.to_thread(self._select, None)
+        except sqlite3.Error as e:
+            logger.warning(f"Token metadata preload failed: {e}")
+            return
+        self._merge(rows[::-1])  # Most recent end up most recently used
+        logger.debug("Preloaded metadata of %d mints", len(rows))
+
+    async def load(self, mints: list[str]) -> None:
+        """Read mints that are not fully known in memory from disk, off the event loop."""
+        wanted = []
+        for mint in dict.fromkeys(mints):
+            entry = self._lru.get(mint)
+            if entry is None or (entry is not _MISSING and entry.decimals is None):
+                wanted.append(mint)
+        if not wanted:
+            return
+        try:
+            rows = await asyncio.to_thread(self._select, wanted)
+        except sqlite3.Error as e:
+            logger.warning(f"Token metadata lookup failed: {e}")
+            return
+        found = {row[0] for row in rows}
+        self._merge(rows, tuple(mint for mint in wanted if mint not in found))
+
+    def get(self, mint: str) -> Optional[TokenMetadata]:
+        """Cached metadata for a mint, or None if nothing is known in memory."""
+        entry = self._lru.get(mint)
+        if entry is None:
+            return None
+        self._lru.move_to_end(mint)
+        return None if entry is _MISSING else entry
+
+    def decimals(self, mint: str) -> Optional[int]:
+        """Known decimals for a mint, or None."""
+        entry = self.get(mint)
+        return entry.decimals if entry else None
+
+    def symbol(self, mint: str) -> Optional[str]:
+        """Known symbol for a mint, or None."""
+        entry = self.get(mint)
+        return entry.symbol if entry else None
+
+    def update(self, mint: str, **values) -> None:
+        """Record facts about a mint; None values are ignored unless the
+        field is an authority (where None means "revoked")."""
+        entry = self.get(mint) or TokenMetadata()
+        changed = set()
+        for key, value in values.items():
+            if key not in _FIELDS:
+                raise ValueError(f"Unknown token metadata field: {key}")
+            if value is None and not key.endswith("_authority"):
+                continue
+            if getattr(entry, key) != value:
+                setattr(entry, key, value)
+                changed.add(key)
+        if changed:
+            self._dirty.setdefault(mint, set()).update(changed)
+        self._remember(mint, entry)
+
+    def _take_dirty(self) -> dict[tuple[str, ...], list[tuple]]:
+        """Move changed mints to ``_saving``; returns their rows grouped by changed columns."""
+        batches: dict[tuple[str, ...], list[tuple]] = {}
+        for mint, changed in self._dirty.items():
+            entry = self._lru[mint]
+            columns = tuple(name for name in _FIELDS if name in changed)
+            batches.setdefault(columns, []).append((mint, *(getattr(entry, name) for name in columns)))
+            self._saving.setdefault(mint, set()).update(changed)
+        self._dirty = {}
+        return batches
+
+    def _write(self, batches: dict[tuple[str, ...], list[tuple]]) -> None:
+        with self._db_lock:
+            with self._connect() as db:
+                for columns, rows in batches.items():
+                    db.executemany(_upsert(columns), rows)
+
+    def _saved(self, ok: bool) -> None:
+        if not ok:  # Write them again on the next save
+            for mint, changed in self._saving.items():
+                self._dirty.setdefault(mint, set()).update(changed)
+        self._saving = {}
+
+    async def flush(self) -> None:
+        """Write mints changed since the last save, off the event loop."""
+        if not self._dirty or self._saving:
+            return
+        batches = self._take_dirty()
+        try:
+            await asyncio.to_thread(self._write, batches)
+            self._saved(True)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save token metadata to {self.path}: {e}")
+            self._saved(False)
+        except BaseException:
+            self._saved(False)
+            raise
+
+    def save(self) -> None:
+        """Write mints changed since the last save, blocking (used on close)."""
+        if not self._dirty:
+            return
+        batches = self._take_dirty()
+        try:
+            self._write(batches)
+            self._saved(True)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save token metadata to {self.path}: {e}")
+            self._saved(False)
+
+    def stale(self, now: Optional[float] = None) -> list[str]:
+        """Mints in memory whose on-chain fields are due for a refresh."""
+        now = time.time() if now is None else now
+        return [
+            mint for mint, entry in self._lru.items()
+            if isinstance(entry, TokenMetadata)
+            and entry.decimals is not None
+            and (entry.refreshed_at is None or now - entry.refreshed_at >= self.refresh_age)
+        ]
+
+    def start(self, fetch: MetadataFetcher) -> None:
+        """Warm the cache, then periodically refresh stale mints with ``fetch``
+        and write changes in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop(fetch), name="token-metadata-refresh")
+
+    async def stop(self) -> None:
+        """Stop the refresh task, save and close the database."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.close()
+
+    def close(self) -> None:
+        """Save pending changes and close the database."""
+        self.save()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def _refresh_loop(self, fetch: MetadataFetcher) -> None:
+        await self.preload()
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            mints = self.stale()
+            if mints:
+                try:
+                    await fetch(mints)
+                    logger.debug("Refreshed metadata of %d mints", len(mints))
+                except Exception as e:
+                    logger.warning(f"Token metadata refresh failed: {e}")
+            await self.flush()  # Also writes mints added since the last pass
+
+    def __len__(self) -> int:
+        """Mints currently known in memory."""
+        return sum(1 for entry in self._lru.values() if entry is not _MISSING)
@@ -0,0 +1,215 @@
+"""Trade History Index.
+
+In-memory secondary indexes over recorded trades:
+- By mint (chronological)
+- By day bucket (chronological)
+- Sorted by realized PnL (best / worst), in bisect-sorted buckets so a
+  settled trade is ranked in O(log n) plus a shift within one bucket
+- Paginated lookups that never scan the full history
+- Built lazily after a replay, each index on its first query, so startup
+  does not pay for indexes nobody asks for
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+def trade_pnl(trade: dict) -> float:
+    """Realized PnL of a settled trade in SOL."""
+    return trade["return"] - trade["amount"]
+
+
+def page_from_end(items: list, page: int, page_size: int) -> list:
+    """Return page ``page`` (1-based) of ``items``, newest first."""
+    end = len(items) - (page - 1) * page_size
+    if end <= 0:
+        return []
+    return items[max(0, end - page_size):end][::-1]
+
+
+class _RankedTrades:
+    """Trades sorted by (PnL, id), split into buckets of at most 2 * load.
+
+    Bucket maxima are bisected to find the bucket, so inserting or removing
+    a trade only shifts entries within that bucket, never the whole history.
+    """
+
+    __slots__ = ("load", "_keys", "_trades", "_maxes", "_len")
+
+    def __init__(self, load: int = 256):
+        self.load = load
+        self._keys: list[list[tuple[float, int]]] = []
+        self._trades: list[list[dict]] = []
+        self._maxes: list[tuple[float, int]] = []  # Last key of each bucket
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def build(self, keys: list[tuple[float, int]], trades: list[dict]) -> None:
+        """Replace the contents with already sorted ``keys`` and ``trades``."""
+        self._keys = [keys[i:i + self.load] for i in range(0, len(keys), self.load)]
+        self._trades = [trades[i:i + self.load] for i in range(0, len(trades), self.load)]
+        self._maxes = [bucket[-1] for bucket in self._keys]
+        self._len = len(keys)
+
+    def insert(self, key: tuple[float, int], trade: dict) -> None:
+        self._len += 1
+        if not self._maxes:
+            self._keys.append([key])
+            self._trades.append([trade])
+            self._maxes.append(key)
+            return
+        pos = bisect.bisect_right(self._maxes, key)
+        if pos == len(self._maxes):  # Past every bucket: extend the last one
+            pos -= 1
+            self._keys[pos].append(key)
+            self._trades[pos].append(trade)
+            self._maxes[pos] = key
+        else:
+            keys = self._keys[pos]
+            index = bisect.bisect_right(keys, key)
+            keys.insert(index, key)
+            self._trades[pos].insert(index, trade)
+        if len(self._keys[pos]) > 2 * self.load:
+            keys, trades = self._keys[pos], self._trades[pos]
+            self._keys[pos + 1:pos + 1] = [keys[self.load:]]
+            self._trades[pos + 1:pos + 1] = [trades[self.load:]]
+            del keys[self.load:]
+            del trades[self.load:]
+            self._maxes[pos] = keys[-1]
+            self._maxes.insert(pos + 1, self._keys[pos + 1][-1])
+
+    def remove(self, key: tuple[float, int], trade: dict) -> bool:
+        """Remove ``trade`` ranked under ``key``; False if it is not there."""
+        pos = bisect.bisect_left(self._maxes, key)
+        while pos < len(self._maxes):
+            keys, trades = self._keys[pos], self._trades[pos]
+            index = bisect.bisect_left(keys, key)
+            while index < len(keys) and keys[index] == key:
+                if trades[index] is trade:
+                    del keys[index]
+                    del trades[index]
+                    self._len -= 1
+                    if keys:
+                        self._maxes[pos] = keys[-1]
+                    else:
+                        del self._keys[pos], self._trades[pos], self._maxes[pos]
+                    return True
+                index += 1
+            if index < len(keys):  # Equal keys end inside this bucket
+                return False
+            pos += 1
+        return False
+
+    def range(self, start: int, stop: int) -> list[dict]:
+        """Trades ranked ``start`` to ``stop``, walking in from the nearer end."""
+        start, stop = max(0, start), min(stop, self._len)
+        if start >= stop:
+            return []
+        if start < self._len - stop:
+            trades, offset = [], 0
+            for bucket in self._trades:
+                end = offset + len(bucket)
+                if end > start:
+                    trades.extend(bucket[max(0, start - offset):stop - offset])
+                    if end >= stop:
+                        break
+                offset = end
+            return trades
+        parts, end = [], self._len
+        for bucket in reversed(self._trades):
+            begin = end - len(bucket)
+            if begin < stop:
+                parts.append(bucket[max(0, start - begin):stop - begin])
+                if begin <= start:
+                    break
+            end = begin
+        return [trade for part in reversed(parts) for trade in part]
+
+
+@dataclass
+class TradeIndex:
+    """Secondary indexes over the trade history."""
+    by_mint: dict[str, list[dict]] = field(default_factory=dict)
+    by_day: dict[str, list[dict]] = field(default_factory=dict)
+    _pnl: _RankedTrades = field(default_factory=_RankedTrades)
+    _source: Optional[list[dict]] = None  # Replayed history the unbuilt indexes come from
+    _unbuilt: set[str] = field(default_factory=set)  # "mint", "day", "pnl"
+
+    def add(self, trade: dict) -> None:
+        """Index a newly recorded trade (already appended to the replayed history)."""
+        if "mint" not in self._unbuilt:
+            self.by_mint.setdefault(trade["token"], []).append(trade)
+        if "day" not in self._unbuilt:
+            self.by_day.setdefault(trade["date"][:10], []).append(trade)
+        if "pnl" not in self._unbuilt and trade.get("return") is not None:
+            self._insert_pnl(trade)
+
+    def update_return(self, trade: dict, old_return) -> None:
+        """Re-rank a trade whose return changed from ``old_return``."""
+        if "pnl" in self._unbuilt:
+            return  # Ranked with its current return when first queried
+        if old_return is not None:
+            self._pnl.remove((old_return - trade["amount"], trade.get("id", 0)), trade)
+        if trade.get("return") is not None:
+            self._insert_pnl(trade)
+
+    def _insert_pnl(self, trade: dict) -> None:
+        self._pnl.insert((trade_pnl(trade), trade.get("id", 0)), trade)
+
+    def rebuild(self, trades: list[dict]) -> None:
+        """Re-index ``trades``, e.g. after a journal replay.
+
+        ``trades`` must be the live history list that later trades are
+        appended to; each index is built from it on its first query.
+        """
+        self.by_mint.clear()
+        self.by_day.clear()
+        self._pnl.build([], [])
+        self._source = trades
+        self._unbuilt = {"mint", "day", "pnl"}
+
+    def _build(self, name: str) -> None:
+        if name not in self._unbuilt:
+            return
+        self._unbuilt.discard(name)
+        if name == "mint":
+            for trade in self._source:
+                self.by_mint.setdefault(trade["token"], []).append(trade)
+        elif name == "day":
+            for trade in self._source:
+                self.by_day.setdefault(trade["date"][:10], []).append(trade)
+        else:
+            settled = sorted(
+                (t for t in self._source if t.get("return") is not None),
+                key=lambda t: (trade_pnl(t), t.get("id", 0)),
+            )
+            self._pnl.build([(trade_pnl(t), t.get("id", 0)) for t in settled], settled)
+        if not self._unbuilt:
+            self._source = None
+
+    def for_mint(self, mint: str, page: int = 1, page_size: int = 5) -> tuple[list[dict], int]:
+        """Trades for a mint, newest first, with the total count."""
+        self._build("mint")
+        trades = self.by_mint.get(mint, [])
+        return page_from_end(trades, page, page_size), len(trades)
+
+    def for_day(self, day: str, page: int = 1, page_size: int = 5) -> tuple[list[dict], int]:
+        """Trades on a day (YYYY-MM-DD), newest first, with the total count."""
+        self._build("day")
+        trades = self.by_day.get(day, [])
+        return page_from_end(trades, page, page_size), len(trades)
+
+    def worst(self, count: int = 10, page: int = 1) -> tuple[list[dict], int]:
+        """Settled trades with the lowest PnL first."""
+        self._build("pnl")
+        start = (page - 1) * count
+        return self._pnl.range(start, start + count), len(self._pnl)
+
+    def best(self, count: int = 10, page: int = 1) -> tuple[list[dict], int]:
+        """Settled trades with the highest PnL first."""
+        self._build("pnl")
+        end = len(self._pnl) - (page - 1) * count
+        return self._pnl.range(end - count, end)[::-1], len(self._pnl)
@@ -0,0 +1,301 @@
+"""Durable Trade Journal.
+
+Persist trading history across restarts:
+- SQLite in WAL mode, append-only trade rows
+- Background writer thread, so recording a trade never blocks the event loop
+- Batched commits (one fsync per batch, not per trade), failed batches retried
+- Fast startup replay from a columnar snapshot plus the journal tail; the
+  snapshot also carries the PnL aggregates, so only the tail is re-added
+"""
+
+import bisect
+import logging
+import marshal
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from pnl_tracker import PnLTracker
+
+logger = logging.getLogger("SignalForge.TradeJournal")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS trades (
+        id INTEGER PRIMARY KEY,
+        date TEXT NOT NULL,
+        token TEXT NOT NULL,
+        amount REAL NOT NULL,
+        price REAL,
+        ret REAL,
+        seq INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS trades_seq ON trades (seq)",
+)
+
+_COLUMNS = "id, date, token, amount, price, ret"
+_INSERT = "INSERT OR REPLACE INTO trades (id, date, token, amount, price, ret, seq) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_UPDATE_RETURN = "UPDATE trades SET ret = ?1, seq = ?3 WHERE id = ?2"
+
+_SNAPSHOT_VERSION = 2  # 2 adds the PnL aggregates; 1 is still read
+_STOP = object()
+
+
+def _rows_to_trades(rows) -> list[dict]:
+    return [
+        {"id": id_, "date": date, "token": token, "amount": amount, "price": price, "return": ret}
+        for id_, date, token, amount, price, ret in rows
+    ]
+
+
+class TradeJournal:
+    """Append-only SQLite trade log with a background writer.
+
+    Every write stamps its row with an increasing ``seq``. A snapshot holds
+    all rows up to some seq in columnar marshal format, so startup only has
+    to read the snapshot and the rows written after it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        synchronous: str = "NORMAL",
+        snapshot_every: int = 50_000,
+        retry_delay: float = 0.5,
+        stop_retries: int = 5,
+    ):
+        """
+        Args:
+            path: SQLite database file
+            batch_size: Max writes per transaction
+            flush_interval: Max seconds a write waits before being committed
+            synchronous: SQLite synchronous level; NORMAL fsyncs on checkpoint,
+                FULL fsyncs every batch commit
+            snapshot_every: Rewrite the snapshot after this many writes
+            retry_delay: First wait before retrying a failed batch; doubles up to 5s
+            stop_retries: Attempts at a failed batch on close before giving up
+        """
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.synchronous = synchronous.upper()
+        self.snapshot_every = snapshot_every
+        self.retry_delay = retry_delay
+        self.stop_retries = max(1, stop_retries)
+        self.next_id = 1
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._seq = 0
+        self._snapshot_seq = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def load(self, pnl: Optional[PnLTracker] = None) -> list[dict]:
+        """Replay the journal into trade dicts, oldest first.
+
+        Args:
+            pnl: Tracker to bring up to date with the replayed trades, from the
+                snapshot's aggregates plus the tail when the snapshot has them
+        """
+        started = time.perf_counter()
+        conn = self._connect()
+        aggregates = None
+        changes: list[tuple[Optional[dict], dict]] = []  # (replaced trade, tail trade)
+        try:
+            snapshot = self._read_snapshot()
+            if snapshot is None:
+                trades = _rows_to_trades(conn.execute(f"SELECT {_COLUMNS} FROM trades ORDER BY id"))
+                tail = len(trades)
+            else:
+                self._snapshot_seq, columns, aggregates = snapshot
+                ids = columns[0]
+                trades = _rows_to_trades(zip(*columns))
+                rows = conn.execute(
+                    f"SELECT {_COLUMNS} FROM trades WHERE seq > ? ORDER BY id", (self._snapshot_seq,)
+                ).fetchall()
+                tail = len(rows)
+                for trade in _rows_to_trades(rows):
+                    index = bisect.bisect_left(ids, trade["id"])
+                    if index < len(ids) and ids[index] == trade["id"]:
+                        changes.append((trades[index], trade))
+                        trades[index] = trade
+                    else:
+                        changes.append((None, trade))
+                        trades.append(trade)
+            self._seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM trades").fetchone()[0]
+        finally:
+            conn.close()
+
+        if pnl is not None:
+            if aggregates is None:
+                pnl.rebuild(trades)
+            else:
+                pnl.restore(aggregates)
+                for old, trade in changes:
+                    if old is None:
+                        pnl.add_trade(trade)
+                    else:
+                        pnl.update_return(trade, old["return"])
+
+        if trades:
+            self.next_id = trades[-1]["id"] + 1
+        logger.info(
+            "Loaded %d trades (%d from journal tail) from %s in %.1fms",
+            len(trades), tail, self.path, (time.perf_counter() - started) * 1000,
+        )
+        return trades
+
+    def _read_snapshot(self) -> Optional[tuple[int, list, Optional[dict]]]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                data = marshal.loads(f.read())
+            if data.get("version") not in (1, _SNAPSHOT_VERSION):
+                return None
+            return data["seq"], data["columns"], data.get("pnl")
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable journal snapshot: {e}")
+            return None
+
+    def _write_snapshot(self, conn: sqlite3.Connection) -> None:
+        rows = conn.execute(f"SELECT {_COLUMNS} FROM trades ORDER BY id").fetchall()
+        columns = [list(column) for column in zip(*rows)] or [[] for _ in range(6)]
+        pnl = PnLTracker()
+        pnl.rebuild(_rows_to_trades(rows))
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(marshal.dumps(
+                {"version": _SNAPSHOT_VERSION, "seq": self._seq, "columns": columns, "pnl": pnl.state()}
+            ))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self._snapshot_seq = self._seq
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(target=self._run, name="trade-journal", daemon=True)
+        self._writer.start()
+
+    def append(self, trade: dict) -> None:
+        """Assign the trade an id and queue it for writing."""
+        trade["id"] = self.next_id
+        self.next_id += 1
+        self._queue.put((
+            _INSERT,
+            (trade["id"], trade["date"], trade["token"], trade["amount"], trade.get("price"), trade.get("return")),
+        ))
+
+    def update_return(self, trade: dict) -> None:
+        """Queue an update of a trade's return."""
+        if "id" in trade:
+            self._queue.put((_UPDATE_RETURN, (trade.get("return"), trade["id"])))
+
+    def close(self) -> None:
+        """Flush pending writes, write a fresh snapshot and stop the writer."""
+        if self._writer is None:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            batch: list = []
+            stopping = False
+            failures = 0
+            while True:
+                if not stopping:
+                    stopping = self._collect(batch, wait=not batch)
+                if self._write_batch(conn, batch):
+                    batch, failures = [], 0
+                    if stopping or self._seq - self._snapshot_seq >= self.snapshot_every:
+                        if self._seq != self._snapshot_seq:
+                            self._write_snapshot(conn)
+                    if stopping:
+                        break
+                    continue
+                # Keep the failed batch and retry it, with whatever was queued since
+                failures += 1
+                if stopping and failures >= self.stop_retries:
+                    logger.critical(f"Trade journal closed with {len(batch)} entries that could not be written")
+                    break
+                time.sleep(min(self.retry_delay * 2 ** (failures - 1), 5.0))
+        except Exception as e:
+            logger.error(f"Trade journal writer stopped: {e}", exc_info=True)
+        finally:
+            conn.close()
+
+    def _collect(self, batch: list, wait: bool) -> bool:
+        """Move queued writes into ``batch``; True once a stop was requested."""
+        limit = len(batch) + self.batch_size
+        if wait:
+            batch.append(self._queue.get())
+        deadline = time.monotonic() + (self.flush_interval if wait else 0.0)
+        while len(batch) < limit:
+            timeout = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if _STOP not in batch:
+            return False
+        batch[:] = [op for op in batch if op is not _STOP]
+        # Drain anything queued before the stop request
+        while True:
+            try:
+                op = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if op is not _STOP:
+                batch.append(op)
+        return True
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list) -> bool:
+        """Commit ``batch`` in one transaction; False if it must be retried.
+
+        Entries are removed from ``batch`` as they are committed one by one.
+        """
+        if not batch:
+            return True
+        seq = self._seq
+        try:
+            with conn:
+                for sql, params in batch:
+                    seq += 1
+                    conn.execute(sql, (*params, seq))
+        except sqlite3.IntegrityError as e:
+            # A row the schema rejects would fail every retry: write the rest one by one
+            if len(batch) == 1:
+                logger.error(f"Dropping journal entry the database rejects {batch[0][1]}: {e}")
+                return True
+            while batch:
+                if not self._write_batch(conn, batch[:1]):
+                    return False
+                del batch[0]
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error writing {len(batch)} journal entries, will retry: {e}")
+            return False
+        self._seq = seq
+        return True
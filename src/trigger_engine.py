@@ -0,0 +1,119 @@
+"""Price Trigger Engine.
+
+Fires resting limit, stop-loss and take-profit orders on price ticks:
+- Per mint, two bisect-sorted level lists: orders that fire when the
+  price falls to their level (buy limit, sell stop) and orders that fire
+  when it rises to it (sell limit, take profit, buy stop)
+- Both lists keep firing levels at the tail, so a tick costs
+  O(log n + k) for k fired orders, never a scan of the book
+- O(log n) cancellation of a resting order
+"""
+
+import bisect
+from dataclasses import dataclass
+from typing import Optional
+
+from order_store import Order, OrderType
+
+_FALLS, _RISES = 0, 1  # Book sides: fire at or below / at or above the level
+
+
+@dataclass
+class TriggerStats:
+    """Trigger counters."""
+    ticks: int = 0
+    fired: int = 0
+    cancelled: int = 0
+
+
+def trigger_direction(order: Order) -> Optional[int]:
+    """Which way the price must cross for ``order`` to fire (None if it never does)."""
+    buy = order.side == "BUY"
+    if order.order_type == OrderType.LIMIT:
+        return _FALLS if buy else _RISES
+    if order.order_type == OrderType.STOP_LOSS:
+        return _RISES if buy else _FALLS
+    if order.order_type == OrderType.TAKE_PROFIT:
+        return _FALLS if buy else _RISES
+    return None
+
+
+def trigger_price(order: Order) -> float:
+    """Level at which ``order`` fires: its stop price if set, else its limit price."""
+    return order.stop_price if order.stop_price is not None else order.price
+
+
+class TriggerEngine:
+    """Resting trigger orders per mint, fired by price ticks."""
+
+    def __init__(self):
+        self.stats = TriggerStats()
+        # mint -> (falls, rises); entries are (key, order_id) with the firing end at the tail
+        self._books: dict[str, tuple[list, list]] = {}
+        self._resting: dict[int, tuple[Order, int, tuple]] = {}  # order_id -> (order, side, entry)
+
+    def __len__(self) -> int:
+        """Resting orders."""
+        return len(self._resting)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self._resting
+
+    def add(self, order: Order) -> bool:
+        """Rest an order until its trigger price is crossed; False for other order types."""
+        side = trigger_direction(order)
+        if side is None:
+            return False
+        if order.order_id in self._resting:
+            raise ValueError(f"Order {order.order_id} is already resting")
+        price = trigger_price(order)
+        # Falling-price orders fire when price <= level: highest levels at the tail.
+        # Rising-price orders fire when price >= level: store -level so the lowest are at the tail.
+        entry = (price if side == _FALLS else -price, order.order_id)
+        book = self._books.setdefault(order.token_address, ([], []))[side]
+        bisect.insort(book, entry)
+        self._resting[order.order_id] = (order, side, entry)
+        return True
+
+    def cancel(self, order_id: int) -> bool:
+        """Remove a resting order; False if it is not resting."""
+        resting = self._resting.pop(order_id, None)
+        if resting is None:
+            return False
+        order, side, entry = resting
+        books = self._books[order.token_address]
+        book = books[side]
+        del book[bisect.bisect_left(book, entry)]
+        if not books[0] and not books[1]:
+            del self._books[order.token_address]
+        self.stats.cancelled += 1
+        return True
+
+    def on_tick(self, mint: str, price: float) -> list[Order]:
+        """Remove and return every order of ``mint`` that ``price`` triggers."""
+        self.stats.ticks += 1
+        books = self._books.get(mint)
+        if books is None:
+            return []
+        fired = []
+        for side, threshold in ((_FALLS, price), (_RISES, -price)):
+            book = books[side]
+            start = bisect.bisect_left(book, (threshold, -1))
+            if start == len(book):
+                continue
+            for _, order_id in reversed(book[start:]):  # Furthest-crossed level first
+                fired.append(self._resting.pop(order_id)[0])
+            del book[start:]
+        if fired:
+            self.stats.fired += len(fired)
+            if not books[0] and not books[1]:
+                del self._books[mint]
+        return fired
+
+    def levels(self, mint: str) -> tuple[list[float], list[float]]:
+        """Resting trigger prices of a mint: (fire on fall, fire on rise), nearest first."""
+        books = self._books.get(mint)
+        if books is None:
+            return [], []
+        falls, rises = books
+        return [key for key, _ in reversed(falls)], [-key for key, _ in reversed(rises)]
@@ -0,0 +1,255 @@
+"""TWAP Execution Scheduler.
+
+Works TWAP parent orders off as evenly spaced child orders:
+- Every child fires from one shared TimerWheel, not a sleeping task each
+- Partial fills roll the unfilled rest into the remaining slices
+- Failed slices re-plan what is left over the remaining time
+- A fixed pool of workers executes due children, bounding concurrency
+  and task count across all parents
+- Cancel at any point; an in-flight child finishes, nothing new starts
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from order_store import Order, OrderStatus, OrderStore
+from timer_wheel import Timer, TimerWheel
+
+logger = logging.getLogger("SignalForge.TWAP")
+
+# Executes one child of a parent order: (parent, size) -> (filled size, average price)
+ChildExecutor = Callable[[Order, float], Awaitable[tuple[float, float]]]
+
+
+@dataclass
+class TwapStats:
+    """Scheduler counters."""
+    parents: int = 0
+    filled: int = 0
+    cancelled: int = 0
+    rejected: int = 0  # Parents given up on without any fill
+    children: int = 0
+    child_failures: int = 0
+    partial_fills: int = 0
+
+
+@dataclass
+class TwapPlan:
+    """Execution state of one parent order."""
+    order: Order
+    end_at: float  # Monotonic time the schedule should be done by
+    slices_left: int
+    remaining: float  # Size still to fill
+    notional: float = 0.0  # Sum of filled size * price
+    failures: int = 0
+    cancelled: bool = False
+    busy: bool = False  # A child is queued or executing
+    timer: Optional[Timer] = None
+    done: Optional[asyncio.Future] = None
+
+
+class TwapScheduler:
+    """Slices TWAP parents into children fired from a shared timer wheel."""
+
+    def __init__(
+        self,
+        executor: ChildExecutor,
+        wheel: Optional[TimerWheel] = None,
+        max_in_flight: int = 32,
+        max_failures: int = 3,
+        retry_delay: float = 1.0,
+        min_slice: float = 0.0,
+        store: Optional[OrderStore] = None,
+    ):
+        """
+        Args:
+            executor: Sends one child order and reports its fill
+            wheel: Shared timer wheel (a private one is created if omitted)
+            max_in_flight: Workers, i.e. children executing at once across all parents
+            max_failures: Failed or overdue slices tolerated per parent
+            retry_delay: Max seconds before a failed slice is retried
+            min_slice: Children smaller than this sweep the whole remainder
+            store: Order store whose indexes follow status changes
+        """
+        self.executor = executor
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self.max_failures = max_failures
+        self.retry_delay = retry_delay
+        self.min_slice = min_slice
+        self.store = store
+        self.stats = TwapStats()
+        self.max_in_flight = max(1, max_in_flight)
+        self.plans: dict[int, TwapPlan] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+
+    def __len__(self) -> int:
+        """Active parent orders."""
+        return len(self.plans)
+
+    def submit(self, order: Order, duration: float, slices: int) -> TwapPlan:
+        """Start working ``order`` off in ``slices`` children over ``duration`` seconds.
+
+        The first child fires on the next wheel tick and the last one at
+        ``duration``; the order object is updated in place as children fill.
+        """
+        if order.order_id in self.plans:
+            raise ValueError(f"Order {order.order_id} is already scheduled")
+        plan = TwapPlan(
+            order=order,
+            end_at=time.monotonic() + max(0.0, duration),
+            slices_left=max(1, slices),
+            remaining=order.size - order.filled_size,
+            notional=order.filled_size * order.average_fill_price,
+            done=asyncio.get_running_loop().create_future(),
+        )
+        self.plans[order.order_id] = plan
+        self.stats.parents += 1
+        self.start()
+        plan.timer = self.wheel.call_later(0.0, self._due, plan)
+        return plan
+
+    def cancel(self, order_id: int) -> bool:
+        """Stop scheduling children of a parent; False if it is not active."""
+        plan = self.plans.get(order_id)
+        if plan is None or plan.cancelled:
+            return False
+        plan.cancelled = True
+        if plan.timer is not None:
+            plan.timer.cancel()
+            plan.timer = None
+        if not plan.busy:
+            self._finish(plan, OrderStatus.CANCELLED)
+        return True
+
+    async def wait(self, order_id: int) -> Optional[Order]:
+        """Wait until a parent is done; None if it is not active."""
+        plan = self.plans.get(order_id)
+        if plan is None:
+            return None
+        return await asyncio.shield(plan.done)
+
+    def start(self) -> None:
+        """Start the worker pool and the timer wheel (done by submit)."""
+        if not self._workers:
+            self._ready = asyncio.Queue()
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"twap-worker-{i}") for i in range(self.max_in_flight)
+            ]
+        self.wheel.start()
+
+    async def stop(self) -> None:
+        """Cancel every parent, including in-flight children."""
+        for plan in list(self.plans.values()):
+            self.cancel(plan.order.order_id)
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for plan in list(self.plans.values()):
+            self._finish(plan, OrderStatus.CANCELLED)
+
+    def _due(self, plan: TwapPlan) -> None:
+        plan.timer = None
+        if not plan.cancelled:
+            plan.busy = True
+            self._ready.put_nowait(plan)
+
+    async def _worker(self) -> None:
+        while True:
+            plan = await self._ready.get()
+            await self._run_slice(plan)
+
+    def _slice_size(self, plan: TwapPlan) -> float:
+        size = plan.remaining / plan.slices_left
+        return plan.remaining if size < self.min_slice else size
+
+    async def _run_slice(self, plan: TwapPlan) -> None:
+        failed = False
+        try:
+            if plan.cancelled:
+                return
+            size = self._slice_size(plan)
+            self.stats.children += 1
+            filled, price = await self.executor(plan.order, size)
+        except asyncio.CancelledError:
+            plan.cancelled = True
+            raise
+        except Exception as e:
+            failed = True
+            logger.warning(f"Slice of {plan.order.order_id} failed: {e}")
+        else:
+            filled = min(max(0.0, filled), plan.remaining)
+            if filled < size * (1 - 1e-9):
+                self.stats.partial_fills += 1
+            self._record_fill(plan, filled, price)
+            plan.slices_left -= 1
+        finally:
+            plan.busy = False
+            self._next(plan, failed)
+
+    def _record_fill(self, plan: TwapPlan, filled: float, price: float) -> None:
+        if filled <= 0:
+            return
+        order = plan.order
+        plan.remaining -= filled
+        plan.notional += filled * price
+        order.filled_size += filled
+        order.average_fill_price = plan.notional / order.filled_size
+        if order.status == OrderStatus.PENDING:
+            self._set_status(order, OrderStatus.PARTIALLY_FILLED)
+        order.updated_at = time.time()
+
+    def _next(self, plan: TwapPlan, failed: bool) -> None:
+        """Finish the parent or schedule its next child."""
+        if plan.remaining <= plan.order.size * 1e-9:
+            self._finish(plan, OrderStatus.FILLED)
+            return
+        if plan.cancelled:
+            self._finish(plan, OrderStatus.CANCELLED)
+            return
+        if failed:
+            plan.failures += 1
+            self.stats.child_failures += 1
+        if plan.slices_left == 0:
+            # Schedule used up with a partially filled rest: one catch-up slice
+            plan.failures += 1
+            plan.slices_left = 1
+        if plan.failures > self.max_failures:
+            logger.warning(
+                f"{plan.order.order_id} gave up after {plan.failures} failed slices, "
+                f"{plan.remaining:.6f} unfilled"
+            )
+            status = OrderStatus.CANCELLED if plan.order.filled_size else OrderStatus.REJECTED
+            self._finish(plan, status)
+            return
+        # Re-plan: spread what is left evenly over the time that is left
+        interval = max(0.0, plan.end_at - time.monotonic()) / plan.slices_left
+        delay = min(self.retry_delay, interval) if failed else interval
+        plan.timer = self.wheel.call_later(delay, self._due, plan)
+
+    def _set_status(self, order: Order, status: OrderStatus) -> None:
+        if self.store is not None:
+            self.store.set_status(order, status)
+        else:
+            order.status = status
+            order.updated_at = time.time()
+
+    def _finish(self, plan: TwapPlan, status: OrderStatus) -> None:
+        order = plan.order
+        self._set_status(order, status)
+        self.plans.pop(order.order_id, None)
+        if status == OrderStatus.FILLED:
+            self.stats.filled += 1
+        elif status == OrderStatus.CANCELLED:
+            self.stats.cancelled += 1
+        else:
+            self.stats.rejected += 1
+        if not plan.done.done():
+            plan.done.set_result(order)
+        logger.debug(
+            "%s %s: %.6f of %.6f filled", order.order_id, status.value, order.filled_size, order.size
+        )
@@ -0,0 +1,343 @@
+"""Transaction Submission Pipeline.
+
+Sign, send and confirm transactions without blocking on the RPC:
+- Background blockhash prefetch, so signing never waits for getLatestBlockhash
+- Bounded number of transactions in flight
+- One poller confirms every pending signature with batched getSignatureStatuses
+- Periodic resend while pending; re-sign with a fresh blockhash once the old
+  one is expired at finalized and the old signature is known not to have landed
+- Works against any object with RpcPool-compatible ``call``/``call_via``/``batch``
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("SignalForge.TxPipeline")
+
+# Signs a transaction for a blockhash: blockhash -> (signature, base64 transaction)
+TxBuilder = Callable[[str], tuple[str, str]]
+
+MAX_STATUS_BATCH = 256  # RPC limit for getSignatureStatuses
+BLOCKHASH_LIFETIME = 150  # Blocks a blockhash stays valid
+FINALITY_BLOCKS = 32  # Blocks finalized commitment trails confirmed by, roughly
+BLOCKHASH_WAIT = 30.0  # Seconds to wait for the first blockhash
+
+
+def _env_number(name: str, default, cast=float):
+    try:
+        return cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass
+class TxStats:
+    """Submission counters."""
+    submitted: int = 0
+    confirmed: int = 0
+    failed: int = 0  # Landed with an error or gave up
+    resends: int = 0  # Same transaction sent again while pending
+    rebroadcasts: int = 0  # Re-signed with a fresh blockhash after expiry
+    total_latency: float = 0.0  # Submit to confirm, summed over confirmed
+    max_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average submit-to-confirm latency in seconds."""
+        return self.total_latency / self.confirmed if self.confirmed else 0.0
+
+
+@dataclass
+class PendingTx:
+    """A transaction waiting for confirmation."""
+    build: TxBuilder
+    signature: str
+    payload: str
+    last_valid_height: int
+    submitted_at: float
+    sent_at: float
+    rebroadcasts: int = 0
+    endpoint: Optional[str] = None  # RPC endpoint that accepted the last send
+    done: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class TxPipeline:
+    """Prefetched blockhashes, bounded submission and batched confirmation."""
+
+    def __init__(
+        self,
+        rpc: Any,
+        max_in_flight: int = 8,
+        compute_unit_price: int = 0,
+        compute_unit_limit: int = 200_000,
+        blockhash_refresh: float = 10.0,
+        poll_interval: float = 0.4,
+        resend_interval: float = 2.0,
+        max_rebroadcasts: int = 2,
+        commitment: str = "confirmed",
+        slot_seconds: float = 0.4,
+    ):
+        """
+        Args:
+            rpc: RpcPool, or any stand-in with the same ``call``/``batch`` methods
+            max_in_flight: Transactions awaiting confirmation at once
+            compute_unit_price: Priority fee in micro-lamports per compute unit
+            compute_unit_limit: Compute unit limit requested per transaction
+            blockhash_refresh: Seconds between blockhash prefetches
+            poll_interval: Seconds between status polls
+            resend_interval: Seconds between resends of a pending transaction
+            max_rebroadcasts: Re-signs allowed after the blockhash expired
+            commitment: Confirmation level that completes a transaction
+            slot_seconds: Expected block time, to turn block heights into waits
+        """
+        self.rpc = rpc
+        self.max_in_flight = max(1, max_in_flight)
+        self.compute_unit_price = compute_unit_price
+        self.compute_unit_limit = compute_unit_limit
+        self.blockhash_refresh = blockhash_refresh
+        self.poll_interval = poll_interval
+        self.resend_interval = resend_interval
+        self.max_rebroadcasts = max_rebroadcasts
+        self.commitment = commitment
+        self.slot_seconds = slot_seconds
+        self.stats = TxStats()
+        self.blockhash: Optional[str] = None
+        self.last_valid_height = 0
+        self.block_height = 0  # Latest block height seen
+        self._blockhash_ready: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending: dict[str, PendingTx] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def in_flight(self) -> int:
+        """Transactions awaiting confirmation."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the blockhash prefetch and status poller tasks."""
+        if self._tasks:
+            return
+        self._blockhash_ready = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._tasks = [
+            asyncio.create_task(self._blockhash_loop(), name="tx-blockhash"),
+            asyncio.create_task(self._poll_loop(), name="tx-poller"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop background tasks and fail whatever is still pending."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for tx in list(self._pending.values()):
+            self._finish(tx, False, "pipeline stopped")
+
+    async def refresh_blockhash(self) -> None:
+        """Fetch the latest blockhash now."""
+        result = await self.rpc.call("getLatestBlockhash", [{"commitment": self.commitment}])
+        value = result["value"]
+        self.blockhash = value["blockhash"]
+        self.last_valid_height = value["lastValidBlockHeight"]
+        self.block_height = max(self.block_height, self.last_valid_height - BLOCKHASH_LIFETIME)
+        self._blockhash_ready.set()
+
+    async def _blockhash_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_blockhash()
+                await asyncio.sleep(self.blockhash_refresh)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Blockhash refresh failed: %s", e)
+                await asyncio.sleep(min(1.0, self.blockhash_refresh))
+
+    async def _send(self, tx: PendingTx) -> None:
+        _, tx.endpoint = await self.rpc.call_via(
+            "sendTransaction",
+            [tx.payload, {"encoding": "base64", "skipPreflight": True, "maxRetries": 0}],
+            prefer=tx.endpoint,
+        )
+
+    def _sign(self, build: TxBuilder) -> tuple[str, str, int]:
+        signature, payload = build(self.blockhash)
+        return signature, payload, self.last_valid_height
+
+    def expected_wait(self, tx: PendingTx) -> float:
+        """Seconds until ``tx`` is settled at worst: the rest of its blockhash
+        lifetime, every re-sign it may still get and their finality checks."""
+        blocks = max(0, tx.last_valid_height - self.block_height) + FINALITY_BLOCKS
+        blocks += (self.max_rebroadcasts - tx.rebroadcasts) * (BLOCKHASH_LIFETIME + FINALITY_BLOCKS)
+        return blocks * self.slot_seconds + self.resend_interval + 2 * self.poll_interval
+
+    async def submit(self, build: TxBuilder, timeout: Optional[float] = None) -> tuple[Optional[bool], str]:
+        """Sign, send and wait for confirmation.
+
+        Args:
+            timeout: Seconds to wait at most (default: until the transaction
+                can no longer land, re-signs included)
+
+        Returns:
+            (True, signature) once confirmed, (False, reason) once it cannot
+            land, or (None, message) if the wait ran out first; the
+            transaction is then still tracked and may yet confirm
+        """
+        self.start()
+        await self._slots.acquire()  # Released when the transaction settles
+        try:
+            await asyncio.wait_for(self._blockhash_ready.wait(), timeout=timeout or BLOCKHASH_WAIT)
+        except asyncio.TimeoutError:
+            self._slots.release()
+            return False, "no recent blockhash available"
+        signature, payload, last_valid = self._sign(build)
+        now = time.monotonic()
+        tx = PendingTx(build, signature, payload, last_valid, now, now)
+        self.stats.submitted += 1
+        self._pending[signature] = tx
+        try:
+            await self._send(tx)
+        except Exception as e:
+            # The payload may have reached a node anyway: keep tracking it,
+            # the poller resends it and settles it either way
+            logger.warning("Send of %s failed, tracking it anyway: %s", signature, e)
+        wait = self.expected_wait(tx)
+        if timeout is not None:
+            wait = min(wait, timeout)
+        try:
+            return await asyncio.wait_for(asyncio.shield(tx.done), timeout=wait)
+        except asyncio.TimeoutError:
+            return None, f"{tx.signature} not confirmed after {wait:.0f}s, still tracking it"
+
+    def _finish(self, tx: PendingTx, ok: bool, detail: str) -> None:
+        if tx.done.done():
+            return
+        self._pending.pop(tx.signature, None)
+        self._slots.release()
+        if ok:
+            latency = time.monotonic() - tx.submitted_at
+            self.stats.confirmed += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+        else:
+            self.stats.failed += 1
+            logger.warning("Transaction %s failed: %s", tx.signature, detail)
+        tx.done.set_result((ok, detail))
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self._pending:
+                continue
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Status poll failed: %s", e)
+
+    async def poll(self) -> None:
+        """Check every pending signature and resend or re-sign as needed."""
+        pending = list(self._pending.values())
+        chunks = [pending[i:i + MAX_STATUS_BATCH] for i in range(0, len(pending), MAX_STATUS_BATCH)]
+        calls = [("getBlockHeight", [{"commitment": self.commitment}])]
+        calls += [("getSignatureStatuses", [[tx.signature for tx in chunk]]) for chunk in chunks]
+        height, *replies = await self.rpc.batch(calls)
+        if isinstance(height, Exception):
+            raise height
+        self.block_height = max(self.block_height, height)
+
+        now = time.monotonic()
+        resend = []
+        for chunk, reply in zip(chunks, replies):
+            if isinstance(reply, Exception):
+                logger.warning("Status batch of %d failed: %s", len(chunk), reply)
+                continue
+            for tx, status in zip(chunk, reply.get("value") or []):
+                if status is not None and status.get("confirmationStatus") in ("confirmed", "finalized"):
+                    if status.get("err"):
+                        self._finish(tx, False, f"{tx.signature} failed on chain: {status['err']}")
+                    else:
+                        self._finish(tx, True, tx.signature)
+                elif status is None and height > tx.last_valid_height:
+                    resend.append(self._rebroadcast(tx))
+                elif now - tx.sent_at >= self.resend_interval:
+                    tx.sent_at = now
+                    self.stats.resends += 1
+                    resend.append(self._send(tx))
+        if resend:
+            await asyncio.gather(*resend, return_exceptions=True)
+
+    async def _rebroadcast(self, tx: PendingTx) -> None:
+        # A null status from one (possibly lagging) node does not prove the old
+        # signature never landed. Re-sign only once a finalized block is past
+        # its blockhash and a history search still finds nothing, asked of the
+        # endpoint that took the send first.
+        height, statuses = await self.rpc.batch(
+            [
+                ("getBlockHeight", [{"commitment": "finalized"}]),
+                ("getSignatureStatuses", [[tx.signature], {"searchTransactionHistory": True}]),
+            ],
+            prefer=tx.endpoint,
+        )
+        if isinstance(height, Exception) or isinstance(statuses, Exception):
+            return  # Ask again on the next poll
+        status = (statuses.get("value") or [None])[0]
+        if status is not None:
+            if status.get("confirmationStatus") in ("confirmed", "finalized"):
+                if status.get("err"):
+                    self._finish(tx, False, f"{tx.signature} failed on chain: {status['err']}")
+                else:
+                    self._finish(tx, True, tx.signature)
+            return  # Landed but not yet confirmed: keep polling
+        if height <= tx.last_valid_height:
+            return  # Could still land on a fork that has not finalized yet
+        if tx.rebroadcasts >= self.max_rebroadcasts:
+            self._finish(tx, False, f"blockhash expired {tx.rebroadcasts + 1} times")
+            return
+        if self.blockhash is None or self.last_valid_height <= tx.last_valid_height:
+            await self.refresh_blockhash()
+        del self._pending[tx.signature]
+        tx.signature, tx.payload, tx.last_valid_height = self._sign(tx.build)
+        tx.sent_at = time.monotonic()
+        tx.rebroadcasts += 1
+        self._pending[tx.signature] = tx
+        self.stats.rebroadcasts += 1
+        await self._send(tx)
+
+
+_pipeline: Optional[TxPipeline] = None
+
+
+def get_tx_pipeline() -> TxPipeline:
+    """Return the process-wide transaction pipeline (on the shared RPC pool)."""
+    global _pipeline
+    if _pipeline is None:
+        from rpc_pool import get_rpc_pool
+
+        _pipeline = TxPipeline(
+            get_rpc_pool(),
+            max_in_flight=_env_number("TX_MAX_IN_FLIGHT", 8, int),
+            compute_unit_price=_env_number("TX_COMPUTE_UNIT_PRICE", 0, int),
+            compute_unit_limit=_env_number("TX_COMPUTE_UNIT_LIMIT", 200_000, int),
+            blockhash_refresh=_env_number("TX_BLOCKHASH_REFRESH_SEC", 10.0),
+        )
+    return _pipeline
+
+
+def current_tx_pipeline() -> Optional[TxPipeline]:
+    """The process-wide pipeline if it was created, without creating it."""
+    return _pipeline
+
+
+async def close_tx_pipeline() -> None:
+    """Stop the process-wide pipeline, if it was ever used."""
+    global _pipeline
+    if _pipeline is not None:
+        await _pipeline.stop()
+        _pipeline = None
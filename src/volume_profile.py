@@ -0,0 +1,232 @@
+"""Intraday Volume Profiles.
+
+Per-mint time-of-day volume forecasts for VWAP execution:
+- One array('d') of EWMA bucket volumes per mint (96 x 15 min by default)
+- Updated incrementally from recorded swap volume, one bucket at a time
+- Short-horizon realized volume rate to compare against the forecast
+- SQLite persistence (profiles as BLOBs) behind a bounded LRU, flushed
+  periodically in the background and on stop
+"""
+
+import asyncio
+import logging
+import math
+import os
+import sqlite3
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger("SignalForge.VolumeProfile")
+
+DAY = 86400
+_OPEN_BUCKET = struct.Struct("<qd")  # Absolute bucket being accumulated, its volume so far
+
+
+class VolumeProfile:
+    """Time-of-day volume forecast of one mint."""
+
+    __slots__ = (
+        "bucket_seconds", "alpha", "half_life", "volumes", "seen",
+        "_bucket", "_bucket_volume", "_recent_rate", "_recent_at",
+    )
+
+    def __init__(self, bucket_seconds: int = 900, alpha: float = 0.2, half_life: float = 300.0):
+        """
+        Args:
+            bucket_seconds: Width of a time-of-day bucket; must divide a day
+            alpha: EWMA weight of the newest day in a bucket
+            half_life: Seconds over which the realized volume rate decays
+        """
+        if DAY % bucket_seconds:
+            raise ValueError("bucket_seconds must divide a day")
+        self.bucket_seconds = bucket_seconds
+        self.alpha = alpha
+        self.half_life = half_life
+        self.volumes = array("d", bytes(8 * (DAY // bucket_seconds)))  # EWMA volume per bucket
+        self.seen = array("B", bytes(len(self.volumes)))  # 1 once a bucket has been observed
+        self._bucket: Optional[int] = None  # Absolute bucket being accumulated
+        self._bucket_volume = 0.0
+        self._recent_rate = 0.0  # Volume per second, exponentially decayed
+        self._recent_at = 0.0
+
+    def record(self, volume: float, ts: Optional[float] = None) -> None:
+        """Add swap volume traded at unix time ``ts``."""
+        ts = time.time() if ts is None else ts
+        bucket = int(ts // self.bucket_seconds)
+        if self._bucket is None:
+            self._bucket = bucket
+        elif bucket > self._bucket:
+            self._close(bucket)
+        self._bucket_volume += volume
+        self._recent_rate = self.recent_rate(ts) + volume * math.log(2) / self.half_life
+        self._recent_at = max(self._recent_at, ts)
+
+    def _close(self, bucket: int) -> None:
+        """Fold finished buckets into the profile; skipped ones traded nothing."""
+        size = len(self.volumes)
+        for absolute in range(self._bucket, min(bucket, self._bucket + size)):
+            observed = self._bucket_volume if absolute == self._bucket else 0.0
+            index = absolute % size
+            if self.seen[index]:
+                self.volumes[index] += self.alpha * (observed - self.volumes[index])
+            else:
+                self.volumes[index] = observed
+                self.seen[index] = 1
+        self._bucket = bucket
+        self._bucket_volume = 0.0
+
+    @property
+    def trained(self) -> bool:
+        """True once any bucket has a forecast."""
+        return any(self.seen)
+
+    def recent_rate(self, now: Optional[float] = None) -> float:
+        """Realized volume per second over roughly the last ``half_life``."""
+        now = time.time() if now is None else now
+        elapsed = max(0.0, now - self._recent_at)
+        return self._recent_rate * 0.5 ** (elapsed / self.half_life)
+
+    def expected(self, start: float, end: float) -> float:
+        """Forecast volume between unix times ``start`` and ``end``."""
+        total = 0.0
+        size = len(self.volumes)
+        t = start
+        while t < end:
+            bucket = int(t // self.bucket_seconds)
+            bucket_end = min(end, (bucket + 1) * self.bucket_seconds)
+            total += self.volumes[bucket % size] * (bucket_end - t) / self.bucket_seconds
+            t = bucket_end
+        return total
+
+    def to_bytes(self) -> bytes:
+        """Serialized bucket volumes, seen flags and the bucket still open."""
+        open_bucket = _OPEN_BUCKET.pack(-1 if self._bucket is None else self._bucket, self._bucket_volume)
+        return self.volumes.tobytes() + self.seen.tobytes() + open_bucket
+
+    def load_bytes(self, data: bytes) -> None:
+        """Restore what ``to_bytes`` produced."""
+        split = 8 * len(self.volumes)
+        end = split + len(self.seen)
+        if len(data) not in (end, end + _OPEN_BUCKET.size):
+            raise ValueError("Profile size does not match the bucket layout")
+        self.volumes = array("d", data[:split])
+        self.seen = array("B", data[split:end])
+        if len(data) > end:  # Volume of the bucket open at the last save
+            bucket, volume = _OPEN_BUCKET.unpack(data[end:])
+            if bucket >= 0:
+                self._bucket, self._bucket_volume = bucket, volume
+
+
+class VolumeProfileStore:
+    """Mint -> VolumeProfile, SQLite-backed with an in-memory LRU."""
+
+    def __init__(
+        self,
+        path: str,
+        max_profiles: int = 2048,
+        bucket_seconds: int = 900,
+        alpha: float = 0.2,
+        flush_interval: float = 60.0,
+    ):
+        """
+        Args:
+            path: SQLite database file
+            max_profiles: Profiles kept in memory
+            bucket_seconds / alpha: Layout and smoothing of new profiles
+            flush_interval: Seconds between background saves
+        """
+        self.path = path
+        self.max_profiles = max(1, max_profiles)
+        self.bucket_seconds = bucket_seconds
+        self.alpha = alpha
+        self.flush_interval = flush_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self._lru: OrderedDict[str, VolumeProfile] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (mint TEXT PRIMARY KEY, bucket_seconds INTEGER, data BLOB)"
+            )
+        return self._db
+
+    def get(self, mint: str) -> VolumeProfile:
+        """Profile of a mint, loaded from disk or created empty."""
+        profile = self._lru.get(mint)
+        if profile is not None:
+            self._lru.move_to_end(mint)
+            return profile
+        profile = VolumeProfile(self.bucket_seconds, self.alpha)
+        try:
+            row = self._connect().execute(
+                "SELECT bucket_seconds, data FROM profiles WHERE mint = ?", (mint,)
+            ).fetchone()
+            if row and row[0] == self.bucket_seconds:
+                profile.load_bytes(row[1])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Volume profile of {mint} could not be loaded: {e}")
+        self._lru[mint] = profile
+        while len(self._lru) > self.max_profiles:
+            if next(iter(self._lru)) in self._dirty:
+                self.save()
+            self._lru.popitem(last=False)
+        return profile
+
+    def record(self, mint: str, volume: float, ts: Optional[float] = None) -> None:
+        """Add swap volume of a mint."""
+        self.get(mint).record(volume, ts)
+        self._dirty.add(mint)
+
+    def save(self) -> None:
+        """Write profiles changed since the last save."""
+        rows = [
+            (mint, self.bucket_seconds, self._lru[mint].to_bytes())
+            for mint in self._dirty if mint in self._lru
+        ]
+        if not rows:
+            return
+        try:
+            with self._connect() as db:
+                db.executemany("INSERT OR REPLACE INTO profiles (mint, bucket_seconds, data) VALUES (?, ?, ?)", rows)
+            self._dirty.clear()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save volume profiles to {self.path}: {e}")
+
+    def start(self) -> None:
+        """Save changed profiles every ``flush_interval`` seconds in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop(), name="volume-profile-flush")
+
+    async def stop(self) -> None:
+        """Stop the flush task, save and close the database."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.close()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.save()
+
+    def close(self) -> None:
+        """Save pending changes and close the database."""
+        self.save()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        """Profiles currently in memory."""
+        return len(self._lru)
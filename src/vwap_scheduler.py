@@ -0,0 +1,91 @@
+"""VWAP Execution Scheduler.
+
+TWAP timing with volume-weighted child sizes:
+- Each child takes the share of the remaining size that the mint's
+  intraday volume profile forecasts for its slice of the window
+- Sizes scale with realized volume when it departs from the forecast,
+  so a quiet thin token is not hit with its full forecast share
+- Mints without history fall back to even TWAP slices
+"""
+
+import time
+from typing import Optional
+
+from timer_wheel import TimerWheel
+from twap_scheduler import ChildExecutor, TwapPlan, TwapScheduler
+from volume_profile import VolumeProfile, VolumeProfileStore
+
+
+def vwap_child_size(
+    profile: VolumeProfile,
+    remaining: float,
+    slices_left: int,
+    now: float,
+    horizon: float,
+    min_ratio: float = 0.8,
+    max_ratio: float = 1.25,
+) -> float:
+    """Size of the next child of a VWAP parent.
+
+    Args:
+        profile: Volume profile of the mint
+        remaining: Size still to fill
+        slices_left: Children left, this one included
+        now: Unix time the child is sent
+        horizon: Seconds left in the execution window
+        min_ratio / max_ratio: Bounds of the realized / forecast volume
+            adjustment
+
+    Returns:
+        float: Child size; the last slice always takes the whole rest
+    """
+    if slices_left <= 1 or horizon <= 0:
+        return remaining
+    step = horizon / slices_left
+    upcoming = profile.expected(now, now + step)
+    total = profile.expected(now, now + horizon)
+    if total <= 0:
+        return remaining / slices_left
+
+    slice_volume = upcoming
+    realized = profile.recent_rate(now) * step
+    if upcoming > 0 and realized > 0:
+        # Trade more into a busier market than forecast, less into a quieter
+        # one; later slices keep their forecast
+        slice_volume = upcoming * min(max_ratio, max(min_ratio, realized / upcoming))
+    return remaining * slice_volume / (slice_volume + total - upcoming)
+
+
+class VwapScheduler(TwapScheduler):
+    """Slices VWAP parents along per-mint intraday volume profiles."""
+
+    def __init__(
+        self,
+        executor: ChildExecutor,
+        profiles: VolumeProfileStore,
+        wheel: Optional[TimerWheel] = None,
+        **kwargs,
+    ):
+        """
+        Args:
+            executor: Sends one child order and reports its fill
+            profiles: Volume profiles, fed with market swap volume (never
+                with this scheduler's own fills)
+            wheel: Shared timer wheel (a private one is created if omitted)
+            **kwargs: TwapScheduler options
+        """
+        super().__init__(executor, wheel, **kwargs)
+        self.profiles = profiles
+
+    def _slice_size(self, plan: TwapPlan) -> float:
+        profile = self.profiles.get(plan.order.token_address)
+        if not profile.trained:
+            return super()._slice_size(plan)  # No history yet: even slices
+        size = vwap_child_size(
+            profile,
+            plan.remaining,
+            plan.slices_left,
+            now=time.time(),
+            horizon=max(0.0, plan.end_at - time.monotonic()),
+        )
+        return plan.remaining if size < self.min_slice else size
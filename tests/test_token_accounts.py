@@ -0,0 +1,126 @@
+"""RPC-native token balance scan against the benchmark's in-process RPC."""
+
+import asyncio
+import base64
+import random
+import struct
+
+from bench_token_accounts import FakeRpc, decode_sliced, mint_account, token_account
+from token_accounts import (
+    TOKEN_2022_PROGRAM_ID,
+    TOKEN_PROGRAM_ID,
+    decode_mint,
+    decode_token_account,
+    decode_token_accounts,
+    scan_token_balances,
+)
+from token_extractor import b58encode
+from token_metadata import TokenMetadataCache
+
+
+def wallet(accounts=200, seed=7):
+    rng = random.Random(seed)
+    owner = rng.randbytes(32)
+    return owner, FakeRpc(rng, owner, accounts)
+
+
+def expected_balances(rpc, owner):
+    totals = {}
+    for accounts in rpc.by_program.values():
+        for mint, amount in decode_sliced(accounts, owner).items():
+            totals[b58encode(mint)] = totals.get(b58encode(mint), 0) + amount
+    return {mint: (amount, rpc.decimals[mint]) for mint, amount in totals.items()}
+
+
+def test_decode_token_account_fields():
+    mint, owner = bytes(range(32)), bytes(range(32, 64))
+    assert decode_token_account(token_account(mint, owner, 123456789)["account"]) == (mint, owner, 123456789)
+    # Token-2022 accounts carry extensions past the 165 base bytes
+    assert decode_token_account(token_account(mint, owner, 5, extra=17)["account"]) == (mint, owner, 5)
+
+
+def test_decode_token_account_rejects_short_data():
+    entry = token_account(bytes(32), bytes(32), 1)["account"]
+    entry["data"][0] = entry["data"][0][:100]
+    assert decode_token_account(entry) is None
+    assert decode_token_account({}) is None
+
+
+def test_decode_token_accounts_matches_field_slicing():
+    owner, rpc = wallet()
+    for accounts in rpc.by_program.values():
+        assert decode_token_accounts(accounts, owner) == decode_sliced(accounts, owner)
+
+
+def test_decode_token_accounts_skips_other_owners_and_empty():
+    owner, other, mint = b"o" * 32, b"x" * 32, b"m" * 32
+    accounts = [
+        token_account(mint, owner, 10),
+        token_account(mint, owner, 0),
+        token_account(mint, other, 99),
+        token_account(mint, owner, 5, extra=17),
+    ]
+    assert decode_token_accounts(accounts, owner) == {mint: 15}
+
+
+def test_decode_mint():
+    assert decode_mint(mint_account(9)) == {
+        "decimals": 9,
+        "supply": 10 ** 12,
+        "mint_authority": None,
+        "freeze_authority": None,
+    }
+    uninitialized = struct.pack("<I32sQBBI32s", 0, bytes(32), 0, 6, 0, 0, bytes(32))
+    assert decode_mint({"data": [base64.b64encode(uninitialized).decode(), "base64"]}) is None
+    assert decode_mint({"data": ["", "base64"]}) is None
+
+
+def test_scan_token_balances(tmp_path):
+    owner, rpc = wallet()
+    metadata = TokenMetadataCache(str(tmp_path / "token_metadata.db"))
+    balances = asyncio.run(scan_token_balances(b58encode(owner), rpc, metadata))
+    assert {b.mint: (b.amount, b.decimals) for b in balances} == expected_balances(rpc, owner)
+    metadata.close()
+
+
+def test_scan_asks_both_token_programs(tmp_path):
+    owner, rpc = wallet()
+    seen = []
+    batch = rpc.batch
+
+    async def recording(calls):
+        seen.extend(calls)
+        return await batch(calls)
+
+    rpc.batch = recording
+    metadata = TokenMetadataCache(str(tmp_path / "token_metadata.db"))
+    asyncio.run(scan_token_balances(b58encode(owner), rpc, metadata))
+    programs = [params[1]["programId"] for method, params in seen if method == "getTokenAccountsByOwner"]
+    assert programs == [TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID]
+    metadata.close()
+
+
+def test_scan_reads_mints_only_once(tmp_path):
+    owner, rpc = wallet()
+    metadata = TokenMetadataCache(str(tmp_path / "token_metadata.db"))
+    first = asyncio.run(scan_token_balances(b58encode(owner), rpc, metadata))
+    assert rpc.calls == 2  # Token accounts, then the unknown mints
+    second = asyncio.run(scan_token_balances(b58encode(owner), rpc, metadata))
+    assert rpc.calls == 3  # Token accounts only
+    assert second == first
+    metadata.close()
+
+
+def test_metadata_cache_persists_across_runs(tmp_path):
+    owner, rpc = wallet()
+    path = str(tmp_path / "token_metadata.db")
+    metadata = TokenMetadataCache(path)
+    first = asyncio.run(scan_token_balances(b58encode(owner), rpc, metadata))
+    metadata.close()
+
+    reopened = TokenMetadataCache(path)
+    calls = rpc.calls
+    again = asyncio.run(scan_token_balances(b58encode(owner), rpc, reopened))
+    assert rpc.calls == calls + 1  # Decimals come from disk
+    assert again == first
+    reopened.close()
@@ -0,0 +1,117 @@
+"""Transaction pipeline against the benchmark's simulated chain."""
+
+import asyncio
+import random
+
+from bench_tx_pipeline import MockRpc, builder
+from tx_pipeline import TxPipeline
+
+SLOT_MS = 10
+
+
+class DroppingRpc(MockRpc):
+    """Drops every send of the signatures in ``drop``."""
+
+    def __init__(self, drop=(), **kwargs):
+        super().__init__(random.Random(3), SLOT_MS, 0, 0.0, **kwargs)
+        self.drop = set(drop)
+        self.sends = []
+
+    async def call(self, method, params=None, timeout=None):
+        if method == "sendTransaction":
+            signature = params[0].split("|")[0]
+            self.sends.append(signature)
+            if signature in self.drop:
+                return signature
+        return await super().call(method, params, timeout)
+
+
+class LaggingRpc(DroppingRpc):
+    """Answers null for landed signatures unless the history is searched."""
+
+    async def batch(self, calls, prefer=None):
+        results = await super().batch(calls, prefer)
+        for i, (method, params) in enumerate(calls):
+            if method == "getSignatureStatuses" and len(params) < 2:
+                results[i] = {"value": [None] * len(params[0])}
+        return results
+
+
+def pipeline(rpc, **kwargs):
+    options = dict(
+        poll_interval=0.01,
+        resend_interval=0.05,
+        blockhash_refresh=rpc.slot * 2,
+        slot_seconds=rpc.slot,
+    )
+    options.update(kwargs)
+    return TxPipeline(rpc, **options)
+
+
+def run(rpc, **kwargs):
+    async def go():
+        txs = pipeline(rpc, **kwargs)
+        counter = [0]
+        try:
+            result = await txs.submit(builder(rpc, counter), timeout=5.0)
+        finally:
+            await txs.stop()
+        return result, counter[0], txs.stats
+
+    return asyncio.run(go())
+
+
+def test_confirms():
+    rpc = DroppingRpc()
+    (ok, detail), signed, stats = run(rpc)
+    assert ok is True and detail == "sig-1"
+    assert signed == 1
+    assert stats.confirmed == 1 and stats.rebroadcasts == 0
+
+
+def test_resends_dropped_transaction_until_it_lands():
+    rpc = DroppingRpc(drop={"sig-1"})
+
+    async def lift_drop():
+        await asyncio.sleep(0.12)
+        rpc.drop.clear()
+
+    async def go():
+        txs = pipeline(rpc)
+        lift = asyncio.create_task(lift_drop())
+        result = await txs.submit(builder(rpc, [0]), timeout=5.0)
+        await lift
+        await txs.stop()
+        return result, txs.stats
+
+    (ok, detail), stats = asyncio.run(go())
+    assert ok is True and detail == "sig-1"
+    assert stats.resends >= 1
+    assert stats.rebroadcasts == 0
+    assert rpc.sends.count("sig-1") == stats.resends + 1
+
+
+def test_resigns_after_blockhash_expiry():
+    rpc = DroppingRpc(drop={"sig-1"}, validity=20)
+    (ok, detail), signed, stats = run(rpc)
+    assert ok is True and detail == "sig-2"
+    assert signed == 2
+    assert stats.rebroadcasts == 1
+
+
+def test_gives_up_after_max_rebroadcasts():
+    rpc = DroppingRpc(drop={"sig-1", "sig-2"}, validity=20)
+    (ok, detail), signed, stats = run(rpc, max_rebroadcasts=1)
+    assert ok is False
+    assert "expired 2 times" in detail
+    assert signed == 2
+    assert stats.failed == 1
+
+
+def test_no_resign_when_null_status_hides_a_landed_transaction():
+    rpc = LaggingRpc(validity=20)
+    (ok, detail), signed, stats = run(rpc)
+    assert ok is True and detail == "sig-1"
+    assert signed == 1  # Never re-signed, so never sent twice under new signatures
+    assert stats.rebroadcasts == 0
+    assert set(rpc.sends) == {"sig-1"}